@@ -0,0 +1,87 @@
+"""
+Порівняння двох файлів результатів `run_benchmarks.py`.
+
+Для кожної пари (рушій, кількість станцій), виміряної в обох файлах, виводиться
+відношення найкращого часу та пікової пам'яті нової версії до базової.
+Якщо хоча б одне відношення перевищує поріг, скрипт завершується з кодом 1,
+тож його можна використовувати як перевірку регресій.
+
+Запуск (з кореня репозиторію):
+    python benchmarks/compare_results.py baseline.json benchmarks/results/latest.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+
+def load_results(path: str) -> Dict[Tuple[str, int], Dict]:
+    """
+    Завантажує успішні вимірювання з файлу результатів.
+
+    Аргументи:
+        path (str): Шлях до файлу JSON.
+
+    Повертає:
+        Dict[Tuple[str, int], Dict]: Вимірювання за ключем (рушій, кількість станцій).
+    """
+    with open(path, encoding='utf-8') as stream:
+        report = json.load(stream)
+    return {
+        (record['engine'], record['num_nodes']): record
+        for record in report['results'] if record['status'] == 'ok'
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[Dict]:
+    """
+    Зіставляє вимірювання двох версій.
+
+    Аргументи:
+        baseline (Dict): Результати базової версії (`load_results`).
+        current (Dict): Результати нової версії (`load_results`).
+        threshold (float): Допустиме відносне погіршення (0.1 — на 10 %).
+
+    Повертає:
+        List[Dict]: Для кожного спільного ключа — відношення часу та пам'яті і ознака регресії.
+    """
+    rows = []
+    for key in sorted(set(baseline) & set(current)):
+        old, new = baseline[key], current[key]
+        time_ratio = new['best'] / old['best'] if old['best'] > 0 else None
+        memory_ratio = None
+        if old.get('peak_memory_bytes') and new.get('peak_memory_bytes') is not None:
+            memory_ratio = new['peak_memory_bytes'] / old['peak_memory_bytes']
+        rows.append({
+            'engine': key[0],
+            'num_nodes': key[1],
+            'time_ratio': time_ratio,
+            'memory_ratio': memory_ratio,
+            'regression': any(
+                ratio is not None and ratio > 1.0 + threshold for ratio in (time_ratio, memory_ratio)
+            ),
+        })
+    return rows
+
+
+def main() -> None:
+    """Порівнює два файли результатів і повертає код 1 у разі регресії."""
+    parser = argparse.ArgumentParser(description="Порівняння результатів бенчмарків двох версій.")
+    parser.add_argument('baseline', help="файл результатів базової версії")
+    parser.add_argument('current', help="файл результатів нової версії")
+    parser.add_argument('--threshold', type=float, default=0.1, help="допустиме відносне погіршення")
+    args = parser.parse_args()
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    for row in rows:
+        time_ratio = f"{row['time_ratio']:.2f}x" if row['time_ratio'] is not None else '—'
+        memory_ratio = f"{row['memory_ratio']:.2f}x" if row['memory_ratio'] is not None else '—'
+        marker = '  РЕГРЕСІЯ' if row['regression'] else ''
+        print(f"{row['engine']:<26} {row['num_nodes']:>9}  час {time_ratio:>7}  пам'ять {memory_ratio:>7}{marker}")
+
+    sys.exit(1 if any(row['regression'] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
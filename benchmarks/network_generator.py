@@ -0,0 +1,249 @@
+"""
+Модуль для генерації синтетичних транспортних мереж заданого розміру.
+
+Згенеровані мережі повторюють форму даних `edges.py`: станції мають рядкові
+ідентифікатори '1'..'N', граф зв'язний, більшість станцій мають 1–2 з'єднання,
+а кілька станцій є хабами. Каркас будується як випадкове дерево з частковим
+переважним приєднанням (нова станція частіше приєднується до станцій з більшим
+ступенем), а додаткові ребра з'єднують станцію з її предком через 2–3 ребра,
+утворюючи короткі локальні цикли замість «телепортів» через усю мережу.
+Ваги `distance` і `time` генеруються за заданими розподілами з округленням до 0.1.
+
+Використання:
+    - generate_edge_arrays(num_nodes) -> (sources, targets, weights): масиви NumPy.
+    - generate_edges(num_nodes) -> list: пари станцій у форматі task_01/task_02.
+    - generate_weighted_edges(num_nodes) -> list: трійки з вагами у форматі task_03.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Середній ступінь і діапазони ваг мережі з edges.py
+DEFAULT_AVERAGE_DEGREE = 2.32
+DEFAULT_WEIGHTS: Dict[str, Tuple[str, float, float]] = {
+    'distance': ('uniform', 1.0, 30.0),
+    'time': ('uniform', 1.0, 4.0),
+}
+# Імовірність переважного приєднання нової станції (інакше — до випадкової станції)
+PREFERENTIAL_PROBABILITY = 0.5
+
+_DISTRIBUTIONS = ('uniform', 'normal', 'exponential')
+
+
+def generate_edge_arrays(
+    num_nodes: int,
+    average_degree: float = DEFAULT_AVERAGE_DEGREE,
+    weights: Optional[Dict[str, Tuple[str, float, float]]] = None,
+    seed: int = 42
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Генерує зв'язну транспортну мережу як масиви кінців ребер і колонки ваг.
+
+    Аргументи:
+        num_nodes (int): Кількість станцій (не менше 2).
+        average_degree (float): Бажаний середній ступінь (не менше 2 · (N - 1) / N).
+        weights (Dict[str, Tuple[str, float, float]], optional): Для кожної ваги — розподіл
+            ('uniform', 'normal' або 'exponential') та діапазон (low, high).
+            За замовчуванням — діапазони `distance` і `time` з edges.py.
+        seed (int): Зерно генератора випадкових чисел.
+
+    Повертає:
+        Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]: Індекси початків і кінців
+        ребер (int64, від 0) та колонки ваг float64 довжиною E.
+
+    Raises:
+        ValueError: Якщо параметри мережі некоректні.
+    """
+    if num_nodes < 2:
+        raise ValueError("num_nodes must be at least 2")
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    for distribution, low, high in weights.values():
+        if distribution not in _DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {_DISTRIBUTIONS}")
+        if not 0 <= low <= high:
+            raise ValueError("weight range must satisfy 0 <= low <= high")
+
+    rng = np.random.default_rng(seed)
+    num_edges = max(num_nodes - 1, int(round(num_nodes * average_degree / 2)))
+    max_edges = num_nodes * (num_nodes - 1) // 2
+    if num_edges > max_edges:
+        raise ValueError("average_degree is too large for the number of nodes")
+
+    parents = _attachment_tree(num_nodes, rng)
+    sources = np.arange(1, num_nodes, dtype=np.int64)
+    targets = parents[1:]
+    sources, targets = _add_local_edges(sources, targets, parents, num_edges, rng)
+
+    columns = {
+        name: _sample_weights(rng, distribution, low, high, len(sources))
+        for name, (distribution, low, high) in weights.items()
+    }
+    return sources, targets, columns
+
+
+def generate_edges(
+    num_nodes: int,
+    average_degree: float = DEFAULT_AVERAGE_DEGREE,
+    seed: int = 42
+) -> List[Tuple[str, str]]:
+    """
+    Генерує мережу у форматі edges.py з task_01 та task_02 (пари станцій).
+
+    Аргументи:
+        num_nodes (int): Кількість станцій.
+        average_degree (float): Бажаний середній ступінь.
+        seed (int): Зерно генератора випадкових чисел.
+
+    Повертає:
+        List[Tuple[str, str]]: Ребра мережі.
+    """
+    sources, targets, _ = generate_edge_arrays(num_nodes, average_degree, weights={}, seed=seed)
+    names = node_names(num_nodes)
+    return [(names[u], names[v]) for u, v in zip(sources.tolist(), targets.tolist())]
+
+
+def generate_weighted_edges(
+    num_nodes: int,
+    average_degree: float = DEFAULT_AVERAGE_DEGREE,
+    weights: Optional[Dict[str, Tuple[str, float, float]]] = None,
+    seed: int = 42
+) -> List[Tuple[str, str, Dict[str, float]]]:
+    """
+    Генерує мережу у форматі edges.py з task_03 (трійки з вагами).
+
+    Аргументи:
+        num_nodes (int): Кількість станцій.
+        average_degree (float): Бажаний середній ступінь.
+        weights (Dict[str, Tuple[str, float, float]], optional): Розподіли ваг
+            (див. `generate_edge_arrays`).
+        seed (int): Зерно генератора випадкових чисел.
+
+    Повертає:
+        List[Tuple[str, str, Dict[str, float]]]: Ребра мережі з вагами.
+    """
+    sources, targets, columns = generate_edge_arrays(num_nodes, average_degree, weights, seed)
+    names = node_names(num_nodes)
+    column_lists = {name: column.tolist() for name, column in columns.items()}
+    return [
+        (names[u], names[v], {name: values[i] for name, values in column_lists.items()})
+        for i, (u, v) in enumerate(zip(sources.tolist(), targets.tolist()))
+    ]
+
+
+def node_names(num_nodes: int) -> List[str]:
+    """Повертає ідентифікатори станцій '1'..'N' (індекс i відповідає станції str(i + 1))."""
+    return [str(i) for i in range(1, num_nodes + 1)]
+
+
+def _attachment_tree(num_nodes: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Будує випадкове дерево з частковим переважним приєднанням.
+
+    Аргументи:
+        num_nodes (int): Кількість вершин.
+        rng (np.random.Generator): Генератор випадкових чисел.
+
+    Повертає:
+        np.ndarray: Батько кожної вершини (для кореня 0 — -1).
+    """
+    preferential = (rng.random(num_nodes) < PREFERENTIAL_PROBABILITY).tolist()
+    picks = rng.random(num_nodes).tolist()
+    parents = [-1] * num_nodes
+    # Кінці вже доданих ребер: випадковий кінець обирається пропорційно до ступеня
+    endpoints: List[int] = []
+    for node in range(1, num_nodes):
+        if preferential[node] and endpoints:
+            parent = endpoints[int(picks[node] * len(endpoints))]
+        else:
+            parent = int(picks[node] * node)
+        parents[node] = parent
+        endpoints.append(node)
+        endpoints.append(parent)
+    return np.array(parents, dtype=np.int64)
+
+
+def _add_local_edges(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    parents: np.ndarray,
+    num_edges: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Доповнює дерево ребрами до предків на відстані 2–3, а за їх нестачі — випадковими ребрами.
+
+    Аргументи:
+        sources (np.ndarray): Початки ребер дерева.
+        targets (np.ndarray): Кінці ребер дерева.
+        parents (np.ndarray): Батьки вершин дерева.
+        num_edges (int): Потрібна загальна кількість ребер.
+        rng (np.random.Generator): Генератор випадкових чисел.
+
+    Повертає:
+        Tuple[np.ndarray, np.ndarray]: Початки та кінці всіх ребер без повторів.
+    """
+    num_nodes = len(parents)
+    keys = np.minimum(sources, targets) * num_nodes + np.maximum(sources, targets)
+    # Для кореня та його дітей предки відсутні: ланцюжок зупиняється на корені
+    grandparents = np.where(parents >= 0, parents[np.maximum(parents, 0)], -1)
+    great_grandparents = np.where(grandparents >= 0, parents[np.maximum(grandparents, 0)], -1)
+
+    for local in (True, False):
+        missing = num_edges - len(keys)
+        if missing <= 0:
+            break
+        # Надлишкова вибірка компенсує повтори та вже наявні ребра
+        candidates = rng.integers(0, num_nodes, size=2 * missing + 16)
+        if local:
+            ancestors = np.where(
+                rng.random(len(candidates)) < 0.5,
+                grandparents[candidates], great_grandparents[candidates]
+            )
+        else:
+            ancestors = rng.integers(0, num_nodes, size=len(candidates))
+        valid = (ancestors >= 0) & (ancestors != candidates)
+        low = np.minimum(candidates, ancestors)[valid]
+        high = np.maximum(candidates, ancestors)[valid]
+        new_keys = np.unique(low * num_nodes + high)
+        new_keys = new_keys[~np.isin(new_keys, keys)]
+        keys = np.concatenate([keys, rng.permutation(new_keys)[:missing]])
+
+    while len(keys) < num_edges:
+        # Малі щільні мережі: добір випадкових пар, доки не набереться потрібна кількість
+        u, v = sorted(rng.integers(0, num_nodes, size=2).tolist())
+        key = u * num_nodes + v
+        if u != v and key not in keys:
+            keys = np.append(keys, key)
+
+    return keys // num_nodes, keys % num_nodes
+
+
+def _sample_weights(
+    rng: np.random.Generator,
+    distribution: str,
+    low: float,
+    high: float,
+    size: int
+) -> np.ndarray:
+    """
+    Генерує ваги ребер за розподілом в межах [low, high] з округленням до 0.1.
+
+    Аргументи:
+        rng (np.random.Generator): Генератор випадкових чисел.
+        distribution (str): 'uniform', 'normal' (середина діапазону, σ = ширина / 6)
+            або 'exponential' (від low з масштабом ширина / 4).
+        low (float): Нижня межа ваги.
+        high (float): Верхня межа ваги.
+        size (int): Кількість ваг.
+
+    Повертає:
+        np.ndarray: Ваги float64.
+    """
+    width = high - low
+    if distribution == 'uniform':
+        values = rng.uniform(low, high, size)
+    elif distribution == 'normal':
+        values = rng.normal((low + high) / 2, width / 6 if width else 0.0, size)
+    else:
+        values = low + rng.exponential(width / 4 if width else 0.0, size)
+    return np.round(np.clip(values, low, high), 1)
@@ -0,0 +1,365 @@
+"""
+Набір бенчмарків для пошуку, найкоротших шляхів, аналізу та візуалізації
+на синтетичних транспортних мережах.
+
+Для кожного розміру мережі (за замовчуванням 1e2–1e6 станцій) генерується мережа
+(`network_generator`), після чого кожен рушій запускається кілька разів: фіксується
+найкращий і медіанний час (`time.perf_counter`), а окремим запуском під `tracemalloc` —
+пікова пам'ять, виділена під час виклику. Для рушіїв, які на великих мережах
+працюють годинами (перебір шляхів у dfs, точний аналіз, spring layout), діє межа розміру; пропущені
+вимірювання позначаються в результатах як 'skipped', помилки — як 'error'.
+
+Результати записуються у JSON разом з версіями Python і бібліотек та комітом git,
+щоб їх можна було порівнювати між версіями (`compare_results.py`).
+
+Запуск (з кореня репозиторію):
+    python benchmarks/run_benchmarks.py --sizes 100 1000 10000 --output benchmarks/results/latest.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for task in ('task_01', 'task_02', 'task_03'):
+    sys.path.insert(0, os.path.join(REPO_ROOT, task))
+
+# pylint: disable=wrong-import-position
+from network_generator import DEFAULT_AVERAGE_DEGREE, generate_edge_arrays, node_names
+from graph01.compact_graph import CompactGraph as AnalysisCompactGraph
+from graph01.centrality import centrality
+from graph01.graph_analysis import analyze_graph
+from graph01.path_statistics import path_statistics
+from graph01.resilience import ResilienceAnalysis
+from graph02.graph_search import bfs, dfs
+from graph03.compact_graph import CompactGraph as SearchCompactGraph
+from graph03.graph_creation import create_transport_network_graph
+from graph03.graph_search import dijkstra
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+class Network(NamedTuple):
+    """Синтетична мережа одного розміру в усіх представленнях, які потрібні рушіям."""
+    num_nodes: int
+    weighted_edges: list
+    graph: Any
+    search_compact: SearchCompactGraph
+    analysis_compact: AnalysisCompactGraph
+    start: str
+    goal: str
+    route: List[str]
+
+
+class Engine(NamedTuple):
+    """Рушій бенчмарку: функція від мережі та максимальний розмір мережі за замовчуванням."""
+    run: Callable[[Network], Any]
+    max_nodes: int
+    description: str
+
+
+def _visualize(network: Network) -> None:
+    """Малює мережу у тимчасову директорію (модуль візуалізації імпортується лише тут)."""
+    from graph01.graph_visualization import visualize_graph
+    with tempfile.TemporaryDirectory() as output_dir:
+        visualize_graph(network.graph, output_dir=output_dir)
+
+
+def _visualize_path(network: Network) -> None:
+    """Малює маршрут між двома станціями засобами graph02."""
+    from graph02.graph_visualization import visualize_path_on_graph
+    with tempfile.TemporaryDirectory() as output_dir:
+        visualize_path_on_graph(network.graph, network.route, output_dir=output_dir)
+
+
+def _visualize_weighted_path(network: Network) -> None:
+    """Малює маршрут між двома станціями з підписами ваг засобами graph03."""
+    from graph03.graph_visualization import visualize_path_on_weighted_graph
+    with tempfile.TemporaryDirectory() as output_dir:
+        visualize_path_on_weighted_graph(network.graph, network.route, output_dir=output_dir)
+
+
+def _render_routes(network: Network) -> None:
+    """Малює пакет маршрутів на спільному фоні (по два типи ваги, один процес)."""
+    from graph03.batch_rendering import render_route_images
+    jobs = [(network.route, weight_type, f"route_{i}") for i in range(4) for weight_type in ('distance', 'time')]
+    with tempfile.TemporaryDirectory() as output_dir:
+        render_route_images(network.graph, jobs, output_dir=output_dir, processes=1)
+
+
+ENGINES: Dict[str, Engine] = {
+    'build_networkx': Engine(
+        lambda network: create_transport_network_graph(network.weighted_edges), 1_000_000,
+        "побудова nx.Graph з ребер"
+    ),
+    'build_compact': Engine(
+        lambda network: SearchCompactGraph.from_edges(network.weighted_edges), 1_000_000,
+        "побудова CompactGraph з ребер"
+    ),
+    'bfs': Engine(
+        lambda network: bfs(network.graph, network.start, network.goal), 1_000_000,
+        "graph02.bfs між двома станціями"
+    ),
+    'bfs_bidirectional': Engine(
+        lambda network: bfs(network.graph, network.start, network.goal, bidirectional=True), 1_000_000,
+        "graph02.bfs(bidirectional=True)"
+    ),
+    # dfs перебирає прості шляхи з поверненням: на мережах з циклами час росте експоненційно
+    'dfs': Engine(
+        lambda network: dfs(network.graph, network.start, network.goal), 1_000,
+        "graph02.dfs між двома станціями"
+    ),
+    'dijkstra': Engine(
+        lambda network: dijkstra(network.graph, network.start, 'distance'), 1_000_000,
+        "graph03.dijkstra на nx.Graph (усі шляхи з однієї станції)"
+    ),
+    'dijkstra_compact': Engine(
+        lambda network: dijkstra(network.search_compact, network.start, 'distance'), 1_000_000,
+        "graph03.dijkstra на CompactGraph"
+    ),
+    # Складові analyze_graph вимірюються й окремо, щоб час однієї не губився в сумі
+    # Точна статистика шляхів — BFS з кожної вершини, O(V · E)
+    'path_statistics': Engine(
+        lambda network: path_statistics(network.analysis_compact), 10_000,
+        "graph01.path_statistics, точний режим"
+    ),
+    # Діаметр за iFUB і вибірка джерел, що зростає до відносної похибки 5 %
+    'path_statistics_approximate': Engine(
+        lambda network: path_statistics(network.analysis_compact, mode='approximate'), 100_000,
+        "graph01.path_statistics, наближений режим"
+    ),
+    # Точний алгоритм Брандеса, O(V · E)
+    'centrality': Engine(
+        lambda network: centrality(network.analysis_compact), 1_000,
+        "graph01.centrality, точний режим"
+    ),
+    'centrality_approximate': Engine(
+        lambda network: centrality(network.analysis_compact, mode='approximate'), 10_000,
+        "graph01.centrality, наближений режим"
+    ),
+    'resilience': Engine(
+        lambda network: ResilienceAnalysis(network.analysis_compact), 1_000_000,
+        "graph01.ResilienceAnalysis (мости та точки зчленування)"
+    ),
+    # Без центральностей (вони вмикаються окремо і вимірюються рушіями centrality)
+    'analyze_graph': Engine(
+        lambda network: analyze_graph(network.graph), 10_000,
+        "graph01.analyze_graph, точний режим"
+    ),
+    'analyze_graph_approximate': Engine(
+        lambda network: analyze_graph(network.analysis_compact, mode='approximate'), 100_000,
+        "graph01.analyze_graph на CompactGraph, наближений режим"
+    ),
+    'visualize_graph': Engine(_visualize, 10_000, "graph01.visualize_graph (spring layout та PNG)"),
+    'visualize_path': Engine(_visualize_path, 10_000, "graph02.visualize_path_on_graph"),
+    'visualize_weighted_path': Engine(
+        _visualize_weighted_path, 10_000, "graph03.visualize_path_on_weighted_graph"
+    ),
+    'batch_rendering': Engine(_render_routes, 10_000, "graph03.render_route_images, 8 зображень"),
+}
+
+
+def build_network(num_nodes: int, average_degree: float, seed: int) -> Network:
+    """
+    Генерує мережу та будує всі її представлення.
+
+    Аргументи:
+        num_nodes (int): Кількість станцій.
+        average_degree (float): Середній ступінь.
+        seed (int): Зерно генератора.
+
+    Повертає:
+        Network: Мережа для рушіїв.
+    """
+    sources, targets, columns = generate_edge_arrays(num_nodes, average_degree, seed=seed)
+    names = node_names(num_nodes)
+    distances, times = columns['distance'].tolist(), columns['time'].tolist()
+    weighted_edges = [
+        (names[u], names[v], {'distance': distances[i], 'time': times[i]})
+        for i, (u, v) in enumerate(zip(sources.tolist(), targets.tolist()))
+    ]
+    float_columns = {name: column.astype('float32') for name, column in columns.items()}
+    graph = create_transport_network_graph(weighted_edges)
+    return Network(
+        num_nodes=num_nodes,
+        weighted_edges=weighted_edges,
+        graph=graph,
+        search_compact=SearchCompactGraph.from_arrays(names, sources, targets, float_columns),
+        analysis_compact=AnalysisCompactGraph.from_arrays(names, sources, targets, float_columns),
+        # Перша та остання станції: остання приєднана до дерева найпізніше, тож шлях довгий
+        start=names[0],
+        goal=names[-1],
+        # Маршрут для рушіїв візуалізації обчислюється один раз, поза вимірюванням
+        route=bfs(graph, names[0], names[-1], bidirectional=True) or [names[0]],
+    )
+
+
+def measure(func: Callable[[], Any], repeats: int, memory: bool) -> Dict:
+    """
+    Вимірює час виконання та пікову пам'ять функції.
+
+    Аргументи:
+        func (Callable[[], Any]): Функція без аргументів.
+        repeats (int): Кількість запусків для вимірювання часу.
+        memory (bool): Чи виконувати додатковий запуск під `tracemalloc`.
+
+    Повертає:
+        Dict: 'times' (секунди), 'best', 'median' та 'peak_memory_bytes' (None без вимірювання).
+    """
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+
+    peak = None
+    if memory:
+        # tracemalloc сповільнює виконання, тому пам'ять вимірюється окремим запуском
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {'times': times, 'best': min(times), 'median': statistics.median(times), 'peak_memory_bytes': peak}
+
+
+def run_benchmarks(
+    sizes: List[int],
+    engines: List[str],
+    repeats: int = 3,
+    average_degree: float = DEFAULT_AVERAGE_DEGREE,
+    seed: int = 42,
+    memory: bool = True,
+    limits: bool = True,
+    log: Optional[Callable[[str], None]] = print
+) -> Dict:
+    """
+    Запускає вибрані рушії на мережах усіх розмірів.
+
+    Аргументи:
+        sizes (List[int]): Кількості станцій.
+        engines (List[str]): Назви рушіїв з ENGINES.
+        repeats (int): Кількість запусків для вимірювання часу.
+        average_degree (float): Середній ступінь мереж.
+        seed (int): Зерно генератора мереж.
+        memory (bool): Чи вимірювати пікову пам'ять.
+        limits (bool): Чи пропускати рушії на мережах, більших за їхню межу.
+        log (Callable[[str], None], optional): Функція для виведення прогресу.
+
+    Повертає:
+        Dict: Метадані запуску та список результатів.
+    """
+    results = []
+    for num_nodes in sizes:
+        started = time.perf_counter()
+        network = build_network(num_nodes, average_degree, seed)
+        if log:
+            log(f"{num_nodes} станцій, {len(network.weighted_edges)} ребер: "
+                f"мережу згенеровано за {time.perf_counter() - started:.2f} с")
+
+        for name in engines:
+            engine = ENGINES[name]
+            record = {'engine': name, 'num_nodes': num_nodes, 'num_edges': len(network.weighted_edges)}
+            if limits and num_nodes > engine.max_nodes:
+                record['status'] = 'skipped'
+            else:
+                try:
+                    record.update(measure(lambda: engine.run(network), repeats, memory))
+                    record['status'] = 'ok'
+                except Exception as error:  # pylint: disable=broad-except
+                    record['status'] = 'error'
+                    record['error'] = f"{type(error).__name__}: {error}"
+            results.append(record)
+            if log:
+                log(_format_record(record))
+
+        del network
+
+    return {'metadata': _metadata(average_degree, seed, repeats), 'results': results}
+
+
+def _format_record(record: Dict) -> str:
+    """Форматує один результат для виведення в консоль."""
+    prefix = f"  {record['engine']:<28}"
+    if record['status'] == 'skipped':
+        return f"{prefix} пропущено (межа розміру)"
+    if record['status'] == 'error':
+        return f"{prefix} помилка: {record['error']}"
+    peak = record['peak_memory_bytes']
+    memory = f", пік пам'яті {peak / 2 ** 20:.1f} МіБ" if peak is not None else ''
+    return f"{prefix} найкращий {record['best'] * 1000:.2f} мс, медіана {record['median'] * 1000:.2f} мс{memory}"
+
+
+def _metadata(average_degree: float, seed: int, repeats: int) -> Dict:
+    """Збирає відомості про середовище, щоб результати різних версій можна було зіставити."""
+    versions = {}
+    for package in ('numpy', 'networkx', 'matplotlib'):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+        'average_degree': average_degree,
+        'seed': seed,
+        'repeats': repeats,
+        'engines': {name: engine.description for name, engine in ENGINES.items()},
+    }
+
+
+def main() -> None:
+    """Розбирає аргументи командного рядка, запускає бенчмарки та зберігає результати у JSON."""
+    parser = argparse.ArgumentParser(description="Бенчмарки рушіїв транспортної мережі на синтетичних мережах.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="кількості станцій")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=list(ENGINES), help="рушії")
+    parser.add_argument('--repeats', type=int, default=3, help="кількість запусків для вимірювання часу")
+    parser.add_argument('--average-degree', type=float, default=DEFAULT_AVERAGE_DEGREE, help="середній ступінь")
+    parser.add_argument('--seed', type=int, default=42, help="зерно генератора мереж")
+    parser.add_argument('--no-memory', action='store_true', help="не вимірювати пікову пам'ять")
+    parser.add_argument('--no-limits', action='store_true', help="запускати рушії на мережах будь-якого розміру")
+    parser.add_argument(
+        '--output', default=os.path.join(REPO_ROOT, 'benchmarks', 'results', 'latest.json'),
+        help="файл JSON для результатів"
+    )
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        args.sizes, args.engines, repeats=args.repeats, average_degree=args.average_degree,
+        seed=args.seed, memory=not args.no_memory, limits=not args.no_limits
+    )
+
+    output_dir = os.path.dirname(os.path.abspath(args.output))
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    with open(args.output, 'w', encoding='utf-8') as stream:
+        json.dump(report, stream, ensure_ascii=False, indent=2)
+    print(f"Результати збережено у {args.output}")
+
+
+if __name__ == "__main__":
+    main()
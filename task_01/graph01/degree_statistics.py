@@ -0,0 +1,93 @@
+"""
+Модуль для обчислення статистики ступенів вершин графа транспортної мережі.
+
+Ступені всіх вершин зчитуються один раз у вектор NumPy, після чого гістограма
+(`np.bincount`), перцентилі, максимум, середнє та список хабів обчислюються
+векторно. Результат спільно використовують аналіз графа та візуалізація
+(розміри вузлів), тож ступені не перераховуються вершина за вершиною.
+
+Використання:
+    - degree_statistics(graph) -> dict: статистика ступенів.
+    - scaled_node_sizes(graph, degree_stats) -> np.ndarray: розміри вузлів для візуалізації.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+from graph01.compact_graph import CompactGraph
+
+# Площа вузла на рисунку на одиницю ступеня
+NODE_SIZE_PER_DEGREE = 300
+
+
+def degree_statistics(
+    graph: Any,
+    hub_threshold: Optional[float] = None,
+    percentiles: Sequence[float] = (50, 90, 99)
+) -> Dict:
+    """
+    Обчислює статистику ступенів за один прохід по вершинах.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        hub_threshold (float, optional): Мінімальний ступінь хаба.
+            За замовчуванням — 90-й перцентиль ступенів.
+        percentiles (Sequence[float]): Перцентилі, які потрібно обчислити.
+
+    Повертає:
+        Dict: Словник з ключами:
+            'nodes' — вершини в порядку графа;
+            'degrees' — вектор ступенів у тому ж порядку;
+            'histogram' — кількість вершин для кожного ступеня від 0 до максимуму;
+            'degree_count' — словник ступінь -> кількість (у порядку першої появи);
+            'average', 'max', 'percentiles', 'hub_threshold', 'hubs'.
+    """
+    if isinstance(graph, CompactGraph):
+        nodes = graph.node_ids
+        degrees = graph.degree().astype(np.int64)
+    else:
+        nodes = list(graph.nodes())
+        degrees = np.fromiter((degree for _, degree in graph.degree()), dtype=np.int64, count=len(nodes))
+
+    if degrees.size == 0:
+        return {
+            'nodes': nodes, 'degrees': degrees, 'histogram': np.zeros(0, dtype=np.int64),
+            'degree_count': {}, 'average': 0.0, 'max': 0,
+            'percentiles': {p: 0.0 for p in percentiles}, 'hub_threshold': hub_threshold, 'hubs': []
+        }
+
+    histogram = np.bincount(degrees)
+    # Порядок ключів як у попередньому аналізі: за першою появою ступеня серед вершин
+    values, first_seen = np.unique(degrees, return_index=True)
+    order = np.argsort(first_seen)
+    degree_count = {int(values[i]): int(histogram[values[i]]) for i in order}
+
+    if hub_threshold is None:
+        hub_threshold = float(np.percentile(degrees, 90))
+
+    return {
+        'nodes': nodes,
+        'degrees': degrees,
+        'histogram': histogram,
+        'degree_count': degree_count,
+        'average': float(degrees.mean()),
+        'max': int(degrees.max()),
+        'percentiles': dict(zip(percentiles, np.percentile(degrees, percentiles).tolist())),
+        'hub_threshold': hub_threshold,
+        'hubs': [nodes[i] for i in np.flatnonzero(degrees >= hub_threshold).tolist()],
+    }
+
+
+def scaled_node_sizes(graph: Any, degree_stats: Optional[Dict] = None) -> np.ndarray:
+    """
+    Повертає розміри вузлів для візуалізації, пропорційні ступеню.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        degree_stats (Dict, optional): Результат `degree_statistics` для цього графа.
+
+    Повертає:
+        np.ndarray: Розміри вузлів у порядку `graph.nodes()`.
+    """
+    if degree_stats is None:
+        degree_stats = degree_statistics(graph)
+    return NODE_SIZE_PER_DEGREE * degree_stats['degrees']
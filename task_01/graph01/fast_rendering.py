@@ -0,0 +1,129 @@
+"""
+Модуль для швидкого пакетного малювання великих графів без вікон (бекенд Agg).
+
+`nx.draw` та `plt.Arrow` створюють окремий об'єкт matplotlib для кожного вузла,
+ребра та стрілки, тому на мережах зі 100 тис. ребер малювання триває хвилини.
+Тут усі ребра малюються однією `LineCollection`, усі вузли — одним `scatter`,
+а всі стрілки шляху — одним `quiver`. Підписи вузлів пропускаються, якщо вузлів
+більше за поріг.
+
+matplotlib імпортується лише всередині функцій малювання, а pyplot — лише тоді,
+коли осі не передано, тож імпорт модуля не завантажує matplotlib.
+
+Використання:
+    - use_bulk_rendering(graph, bulk) -> bool: чи малювати пакетно (автоматично для великих графів).
+    - use_headless_backend(): перемикання matplotlib на бекенд Agg.
+    - draw_graph_bulk(graph, pos, node_sizes): малювання ребер, вузлів і підписів.
+    - draw_arrows_bulk(starts, ends): малювання стрілок однією колекцією.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+
+# Кількість вузлів, з якої пакетне малювання вмикається автоматично
+BULK_NODE_THRESHOLD = 1000
+# Максимальна кількість вузлів, для якої в пакетному режимі малюються підписи
+LABEL_NODE_THRESHOLD = 200
+
+
+def use_bulk_rendering(graph: Any, bulk: Optional[bool] = None) -> bool:
+    """
+    Визначає, чи використовувати пакетне малювання.
+
+    Аргументи:
+        graph (nx.Graph): Граф для малювання.
+        bulk (bool, optional): Явний вибір режиму; None — автоматично за кількістю вузлів.
+
+    Повертає:
+        bool: True для пакетного режиму.
+    """
+    if bulk is None:
+        return graph.number_of_nodes() >= BULK_NODE_THRESHOLD
+    return bulk
+
+
+def use_headless_backend() -> None:
+    """Перемикає matplotlib на бекенд Agg (без вікон), якщо він ще не активний."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    if matplotlib.get_backend().lower() != 'agg':
+        plt.switch_backend('Agg')
+
+
+def draw_graph_bulk(
+    graph: Any,
+    pos: Dict[Any, np.ndarray],
+    node_sizes: Sequence[float],
+    ax: Optional[Any] = None,
+    node_color: str = 'lightblue',
+    edge_color: str = 'gray',
+    font_size: int = 9,
+    label_threshold: int = LABEL_NODE_THRESHOLD
+) -> None:
+    """
+    Малює граф трьома об'єктами matplotlib: ребра, вузли та (для малих графів) підписи.
+
+    Аргументи:
+        graph (nx.Graph): Граф для малювання.
+        pos (Dict[Any, np.ndarray]): Позиції вузлів.
+        node_sizes (Sequence[float]): Розміри вузлів у порядку `graph.nodes()`.
+        ax (plt.Axes, optional): Осі для малювання (за замовчуванням поточні).
+        node_color (str): Колір вузлів.
+        edge_color (str): Колір ребер.
+        font_size (int): Розмір шрифту підписів.
+        label_threshold (int): Підписи малюються лише для графів з не більше ніж стількома вузлами.
+    """
+    from matplotlib.collections import LineCollection
+
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    coordinates = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(len(nodes), 2)
+
+    edge_index = np.array([(index[u], index[v]) for u, v in graph.edges()], dtype=np.int64).reshape(-1, 2)
+    ax.add_collection(LineCollection(coordinates[edge_index], colors=edge_color, linewidths=1.0, zorder=1))
+    ax.scatter(coordinates[:, 0], coordinates[:, 1], s=node_sizes, c=node_color, zorder=2)
+
+    if len(nodes) <= label_threshold:
+        for node, (x, y) in zip(nodes, coordinates):
+            ax.text(x, y, str(node), fontsize=font_size, fontweight='bold', ha='center', va='center', zorder=3)
+
+    ax.autoscale_view()
+    ax.set_axis_off()
+
+
+def draw_arrows_bulk(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    ax: Optional[Any] = None,
+    color: str = 'red',
+    width: float = 0.004
+) -> Optional[Any]:
+    """
+    Малює всі стрілки одним об'єктом `quiver`.
+
+    Аргументи:
+        starts (np.ndarray): Початки стрілок, масив (N, 2).
+        ends (np.ndarray): Кінці стрілок, масив (N, 2).
+        ax (plt.Axes, optional): Осі для малювання (за замовчуванням поточні).
+        color (str): Колір стрілок.
+        width (float): Товщина стрілок у частках ширини осей.
+
+    Повертає:
+        matplotlib.quiver.Quiver: Об'єкт зі стрілками або None, якщо стрілок немає.
+    """
+    if ax is None:
+        import matplotlib.pyplot as plt
+        ax = plt.gca()
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    if starts.size == 0:
+        return None
+    deltas = ends - starts
+    return ax.quiver(
+        starts[:, 0], starts[:, 1], deltas[:, 0], deltas[:, 1],
+        angles='xy', scale_units='xy', scale=1, color=color, width=width, zorder=3
+    )
@@ -5,52 +5,112 @@
 Він містить дві основні функції: `analyze_graph` для проведення аналізу та `print_analysis_results`
 для виведення результатів аналізу на екран.
 
+Функції приймають як `nx.Graph`, так і компактний граф `CompactGraph`.
+Окрім ступенів, аналіз визначає мости й точки зчленування — з'єднання та станції,
+закриття кожного з яких розділяє мережу (див. `resilience`). Найважливіші станції
+за посередницькою та близькісною центральністю (див. `centrality`) додаються на запит:
+алгоритм Брандеса займає O(V·E) і коштує більше за решту аналізу разом.
+
 Використання:
     - analyze_graph(graph: nx.Graph) -> dict: аналізує транспортну мережу та повертає словник з результатами.
     - print_analysis_results(analysis_results: dict) -> None: виводить результати аналізу графа.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 import networkx as nx
-
-def analyze_graph(graph: nx.Graph) -> Dict:
+from graph01.centrality import centrality
+from graph01.compact_graph import CompactGraph, connected_component_labels
+from graph01.degree_statistics import degree_statistics
+from graph01.path_statistics import path_statistics
+from graph01.resilience import ResilienceAnalysis
+
+def analyze_graph(
+    graph: nx.Graph,
+    mode: str = 'exact',
+    processes: Optional[int] = None,
+    degree_stats: Optional[Dict] = None,
+    centrality_stats: Optional[Dict] = None,
+    compute_centrality: bool = False
+) -> Dict:
     """
     Аналіз характеристик графа транспортної мережі.
 
+    Діаметр і середня довжина найкоротшого шляху обчислюються за один обхід
+    (див. `path_statistics`).
+
     Аргументи:
-        graph (nx.Graph): Граф, що представляє транспортну мережу.
+        graph (nx.Graph | CompactGraph): Граф, що представляє транспортну мережу.
+        mode (str): 'exact' — точний обхід з усіх вершин; 'approximate' — точний діаметр
+            за iFUB, вибіркові оцінки середньої довжини шляху та центральностей.
+        processes (int, optional): Кількість процесів (None — автоматично).
+        degree_stats (Dict, optional): Готовий результат `degree_statistics` для цього графа
+            (наприклад, спільний з візуалізацією).
+        centrality_stats (Dict, optional): Готовий результат `centrality` для цього графа;
+            якщо задано, центральності додаються до результатів без нового обчислення.
+        compute_centrality (bool): Чи обчислювати центральності, якщо centrality_stats не задано.
 
     Повертає:
-        Dict: Словник з характеристиками графа.
+        Dict: Словник з характеристиками графа. Ключі центральностей ('betweenness_centrality',
+        'closeness_centrality', 'bottlenecks', 'central_stations', 'centrality_error')
+        є лише тоді, коли центральності передано або запитано.
     """
+    if degree_stats is None:
+        degree_stats = degree_statistics(graph)
+    if centrality_stats is None and compute_centrality:
+        centrality_stats = centrality(graph, mode=mode, processes=processes)
+
+    if isinstance(graph, CompactGraph):
+        analysis_results = _analyze_compact_graph(graph, mode, processes, degree_stats)
+        if centrality_stats is not None:
+            _add_centrality(analysis_results, centrality_stats)
+        analysis_results.update(ResilienceAnalysis(graph).results())
+        return analysis_results
+
     analysis_results = {}
 
     # Підрахунок основних характеристик графа
-    num_nodes = graph.number_of_nodes()
-    num_edges = graph.number_of_edges()
-    degree_distribution = [graph.degree(n) for n in graph.nodes()]
-
-    # Підрахунок кількості вершин для кожного ступеня
-    degree_count = {}
-    for node in graph.nodes():
-        degree = graph.degree(node)
-        if degree in degree_count:
-            degree_count[degree] += 1
-        else:
-            degree_count[degree] = 1
-
-    # Збереження результатів аналізу
-    analysis_results['num_nodes'] = num_nodes
-    analysis_results['num_edges'] = num_edges
-    analysis_results['degree_distribution'] = degree_distribution
-    analysis_results['degree_count'] = degree_count
-    analysis_results['average_degree'] = sum(degree_distribution) / num_nodes
+    _add_degree_statistics(analysis_results, graph, degree_stats)
     analysis_results['connected_components'] = nx.number_connected_components(graph)
 
     # Перевірка, чи граф зв'язаний, перед обчисленням діаметра та середньої довжини найкоротшого шляху
     if nx.is_connected(graph):
-        analysis_results['diameter'] = nx.diameter(graph)
-        analysis_results['average_shortest_path_length'] = nx.average_shortest_path_length(graph)
+        _add_path_statistics(analysis_results, graph, mode, processes)
+    else:
+        analysis_results['diameter'] = None
+        analysis_results['average_shortest_path_length'] = None
+
+    if centrality_stats is not None:
+        _add_centrality(analysis_results, centrality_stats)
+    analysis_results.update(ResilienceAnalysis(graph).results())
+    return analysis_results
+
+
+def _analyze_compact_graph(
+    graph: CompactGraph,
+    mode: str,
+    processes: Optional[int],
+    degree_stats: Dict
+) -> Dict:
+    """
+    Аналіз характеристик компактного графа без перетворення у NetworkX.
+
+    Аргументи:
+        graph (CompactGraph): Граф у форматі CSR.
+        mode (str): Режим обчислення статистики шляхів.
+        processes (int, optional): Кількість процесів.
+        degree_stats (Dict): Статистика ступенів графа.
+
+    Повертає:
+        Dict: Словник з тими самими ключами, що й у `analyze_graph`.
+    """
+    analysis_results = {}
+    _add_degree_statistics(analysis_results, graph, degree_stats)
+
+    num_components, _ = connected_component_labels(graph)
+    analysis_results['connected_components'] = num_components
+
+    if num_components == 1:
+        _add_path_statistics(analysis_results, graph, mode, processes)
     else:
         analysis_results['diameter'] = None
         analysis_results['average_shortest_path_length'] = None
@@ -58,6 +118,57 @@ def analyze_graph(graph: nx.Graph) -> Dict:
     return analysis_results
 
 
+def _add_degree_statistics(analysis_results: Dict, graph, degree_stats: Dict) -> None:
+    """
+    Додає до результатів кількість вершин і ребер та характеристики ступенів.
+
+    Аргументи:
+        analysis_results (Dict): Словник результатів (доповнюється на місці).
+        graph (nx.Graph | CompactGraph): Граф.
+        degree_stats (Dict): Результат `degree_statistics` для цього графа.
+    """
+    analysis_results['num_nodes'] = graph.number_of_nodes()
+    analysis_results['num_edges'] = graph.number_of_edges()
+    analysis_results['degree_distribution'] = degree_stats['degrees'].tolist()
+    analysis_results['degree_count'] = degree_stats['degree_count']
+    analysis_results['average_degree'] = degree_stats['average']
+    analysis_results['max_degree'] = degree_stats['max']
+    analysis_results['degree_percentiles'] = degree_stats['percentiles']
+    analysis_results['hubs'] = degree_stats['hubs']
+
+
+def _add_path_statistics(analysis_results: Dict, graph, mode: str, processes: Optional[int]) -> None:
+    """
+    Додає до результатів діаметр і середню довжину найкоротшого шляху зв'язного графа.
+
+    Аргументи:
+        analysis_results (Dict): Словник результатів (доповнюється на місці).
+        graph (nx.Graph | CompactGraph): Зв'язний граф.
+        mode (str): Режим обчислення статистики шляхів.
+        processes (int, optional): Кількість процесів.
+    """
+    statistics = path_statistics(graph, mode=mode, processes=processes)
+    analysis_results['diameter'] = statistics['diameter']
+    analysis_results['average_shortest_path_length'] = statistics['average_shortest_path_length']
+    analysis_results['average_shortest_path_length_error'] = statistics['error_bound']
+
+
+def _add_centrality(analysis_results: Dict, centrality_stats: Dict) -> None:
+    """
+    Додає до результатів центральності вершин і найважливіші станції.
+
+    Аргументи:
+        analysis_results (Dict): Словник результатів (доповнюється на місці).
+        centrality_stats (Dict): Результат `centrality` для цього графа.
+    """
+    nodes = centrality_stats['nodes']
+    analysis_results['betweenness_centrality'] = dict(zip(nodes, centrality_stats['betweenness'].tolist()))
+    analysis_results['closeness_centrality'] = dict(zip(nodes, centrality_stats['closeness'].tolist()))
+    analysis_results['bottlenecks'] = centrality_stats['bottlenecks']
+    analysis_results['central_stations'] = centrality_stats['central_stations']
+    analysis_results['centrality_error'] = centrality_stats['error_bound']
+
+
 def print_analysis_results(analysis_results: Dict) -> None:
     """
     Виведення результатів аналізу графа.
@@ -79,6 +190,28 @@ def print_analysis_results(analysis_results: Dict) -> None:
 
     if analysis_results['diameter'] is not None:
         print(f"Діаметр графа: {analysis_results['diameter']}")
-        print(f"Середня довжина найкоротшого шляху: {analysis_results['average_shortest_path_length']:.2f}\n")
+        error = analysis_results.get('average_shortest_path_length_error') or 0.0
+        error_text = f" (±{error:.2f})" if error else ""
+        print(f"Середня довжина найкоротшого шляху: {analysis_results['average_shortest_path_length']:.2f}{error_text}\n")
     else:
         print("Граф не є зв'язним, тому діаметр і середню довжину шляху неможливо обчислити.\n")
+
+    if analysis_results.get('bottlenecks') is not None:
+        error = analysis_results.get('centrality_error') or 0.0
+        error_text = f" (±{error:.2f})" if error else ""
+        betweenness = analysis_results['betweenness_centrality']
+        closeness = analysis_results['closeness_centrality']
+        print(f"Вузькі місця (посередницька центральність{error_text}): " + ", ".join(
+            f"{node} ({betweenness[node]:.2f})" for node in analysis_results['bottlenecks']
+        ))
+        print("Центральні станції (близькісна центральність): " + ", ".join(
+            f"{node} ({closeness[node]:.2f})" for node in analysis_results['central_stations']
+        ) + "\n")
+
+    if analysis_results.get('bridges') is not None:
+        print(f"Мости (з'єднання, закриття кожного з яких розділяє мережу): {len(analysis_results['bridges'])}")
+        print(
+            "Точки зчленування (станції, закриття кожної з яких розділяє мережу): "
+            f"{len(analysis_results['articulation_points'])}"
+        )
+        print(f"Двозв'язні компоненти: {analysis_results['biconnected_components']}\n")
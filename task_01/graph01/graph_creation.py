@@ -6,6 +6,7 @@
 
 from typing import List, Tuple
 import networkx as nx
+from graph01.compact_graph import CompactGraph
 
 def create_transport_network_graph(edges: List[Tuple[str, str]]) -> nx.Graph:
     """
@@ -24,3 +25,15 @@ def create_transport_network_graph(edges: List[Tuple[str, str]]) -> nx.Graph:
     graph.add_edges_from(edges)
 
     return graph
+
+def create_compact_transport_network_graph(edges: List[Tuple[str, str]]) -> CompactGraph:
+    """
+    Створює компактний (CSR) граф транспортної мережі з тих самих ребер.
+
+    Параметри:
+        edges (List[Tuple[str, str]]): Список ребер, де кожне ребро є парою станцій (назви станцій).
+
+    Повертає:
+        CompactGraph: Граф у форматі CSR з цілими індексами станцій.
+    """
+    return CompactGraph.from_edges(edges)
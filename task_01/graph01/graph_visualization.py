@@ -11,16 +11,27 @@
 
 Функціонал:
 - Візуалізація графа.
-- Налаштування вигляду графа (розмір вузлів залежно від ступеня).
+- Налаштування вигляду графа (розмір вузлів залежно від ступеня або посередницької центральності).
 - Збереження зображення у вказану директорію.
 """
 
 import os
-import matplotlib.pyplot as plt
+from typing import Dict, Optional
 import networkx as nx
+from graph01.centrality import centrality_node_sizes
+from graph01.degree_statistics import scaled_node_sizes
+from graph01.fast_rendering import draw_graph_bulk, use_bulk_rendering, use_headless_backend
+from graph01.layout_cache import get_layout
 
 
-def visualize_graph(graph: nx.Graph, output_dir: str = 'results', filename: str = 'transport_network_graph') -> None:
+def visualize_graph(
+    graph: nx.Graph,
+    output_dir: str = 'results',
+    filename: str = 'transport_network_graph',
+    degree_stats: Optional[Dict] = None,
+    bulk: Optional[bool] = None,
+    centrality_stats: Optional[Dict] = None
+) -> None:
     """
     Візуалізація графа транспортної мережі та збереження зображення у файл.
 
@@ -28,23 +39,42 @@ def visualize_graph(graph: nx.Graph, output_dir: str = 'results', filename: str
         graph (nx.Graph): Граф, що представляє транспортну мережу.
         output_dir (str, optional): Директорія, куди зберігати зображення. За замовчуванням 'results'.
         filename (str, optional): Назва файлу без розширення. За замовчуванням 'transport_network_graph'.
+        degree_stats (Dict, optional): Готовий результат `degree_statistics` для цього графа.
+        bulk (bool, optional): Пакетне малювання для великих графів (бекенд Agg, без підписів
+            понад поріг). None — автоматично за кількістю вузлів.
+        centrality_stats (Dict, optional): Результат `centrality` для цього графа. Якщо задано,
+            розмір вузлів залежить від посередницької центральності, а не від ступеня.
     
     Опис:
         Функція будує граф на основі поданого об'єкта типу `networkx.Graph`. 
-        Розмір вузлів масштабовано відповідно до їх ступеня (кількості з'єднань).
+        Розмір вузлів масштабовано відповідно до їх ступеня (кількості з'єднань)
+        або посередницької центральності.
         Граф зберігається у вигляді PNG-зображення у вказаній директорії.
     """
+    # pyplot імпортується лише під час малювання, а не під час імпорту модуля
+    import matplotlib.pyplot as plt
+
+    bulk = use_bulk_rendering(graph, bulk)
+    if bulk:
+        use_headless_backend()
+
     plt.figure(figsize=(12, 10))
-    pos = nx.spring_layout(graph, seed=42)
+    pos = get_layout(graph, seed=42)
 
-    # Обчислюємо розміри вузлів пропорційно до їх ступеня
-    node_sizes = [300 * graph.degree(node) for node in graph.nodes()]
+    # Обчислюємо розміри вузлів пропорційно до їх ступеня або центральності
+    if centrality_stats is not None:
+        node_sizes = centrality_node_sizes(centrality_stats)
+    else:
+        node_sizes = scaled_node_sizes(graph, degree_stats)
 
     # Візуалізація графа
-    nx.draw(
-        graph, pos, with_labels=True, node_size=node_sizes, node_color='lightblue', font_size=9,
-        font_weight='bold', edge_color='gray'
-    )
+    if bulk:
+        draw_graph_bulk(graph, pos, node_sizes)
+    else:
+        nx.draw(
+            graph, pos, with_labels=True, node_size=node_sizes, node_color='lightblue', font_size=9,
+            font_weight='bold', edge_color='gray'
+        )
 
     plt.suptitle("Транспортна мережа міста", size=20)
 
@@ -0,0 +1,256 @@
+"""
+Модуль для інкрементального аналізу графа транспортної мережі.
+
+Клас `IncrementalGraphAnalyzer` обгортає граф і підтримує актуальними характеристики,
+які обчислює `analyze_graph`, при додаванні та видаленні ребер:
+    - кількість вершин і ребер, ступені та розподіл ступенів оновлюються за O(1);
+    - кожна вершина має мітку своєї зв'язної компоненти, а компонента — множину вершин;
+      при додаванні ребра мітку змінюють вершини меншої з двох компонент, а при
+      видаленні перевіряється лише уражена частина графа: двонаправлений BFS від кінців
+      ребра зупиняється, щойно фронти зустрілися або вичерпався менший з них, і нову
+      мітку отримують лише вершини відокремленої частини, тож робота пропорційна
+      меншій стороні розрізу, а не розміру компоненти;
+    - діаметр і середня довжина найкоротшого шляху перераховуються ліниво,
+      лише коли їх читають після змін.
+
+Використання:
+    analyzer = IncrementalGraphAnalyzer(graph)
+    analyzer.remove_edge('15', '33')
+    print_analysis_results(analyzer.results())
+"""
+
+from itertools import count
+from typing import Any, Dict, Optional, Set
+import networkx as nx
+from graph01.path_statistics import path_statistics
+
+
+class IncrementalGraphAnalyzer:
+    """
+    Обгортка над графом, що підтримує його характеристики при змінах.
+
+    Граф слід змінювати лише через методи аналізатора, інакше його стан буде неактуальним.
+
+    Атрибути:
+        graph (nx.Graph): Граф транспортної мережі.
+        mode (str): Режим обчислення статистики шляхів ('exact' або 'approximate').
+        processes (int, optional): Кількість процесів для статистики шляхів.
+    """
+
+    def __init__(self, graph: nx.Graph, mode: str = 'exact', processes: Optional[int] = None) -> None:
+        self.graph = graph
+        self.mode = mode
+        self.processes = processes
+
+        self._degree_count: Dict[int, int] = {}
+        for _, degree in graph.degree():
+            self._degree_count[degree] = self._degree_count.get(degree, 0) + 1
+        self._degree_total = sum(degree * count for degree, count in self._degree_count.items())
+
+        self._labels = count()
+        self._component: Dict[Any, int] = {}
+        self._members: Dict[int, Set[Any]] = {}
+        for node in graph.nodes():
+            self._add_component(node)
+        for u, v in graph.edges():
+            self._union(u, v)
+
+        self._path_statistics: Optional[Dict] = None
+
+    @property
+    def num_nodes(self) -> int:
+        """Кількість вершин."""
+        return self.graph.number_of_nodes()
+
+    @property
+    def num_edges(self) -> int:
+        """Кількість ребер."""
+        return self.graph.number_of_edges()
+
+    @property
+    def connected_components(self) -> int:
+        """Кількість зв'язних компонент."""
+        return len(self._members)
+
+    @property
+    def degree_count(self) -> Dict[int, int]:
+        """Кількість вершин для кожного ступеня."""
+        return dict(self._degree_count)
+
+    @property
+    def average_degree(self) -> float:
+        """Середній ступінь вершин."""
+        return self._degree_total / self.num_nodes if self.num_nodes else 0.0
+
+    @property
+    def diameter(self) -> Optional[int]:
+        """Діаметр графа (None, якщо граф не зв'язний); обчислюється ліниво."""
+        statistics = self._get_path_statistics()
+        return statistics['diameter'] if statistics else None
+
+    @property
+    def average_shortest_path_length(self) -> Optional[float]:
+        """Середня довжина найкоротшого шляху (None, якщо граф не зв'язний); обчислюється ліниво."""
+        statistics = self._get_path_statistics()
+        return statistics['average_shortest_path_length'] if statistics else None
+
+    def add_node(self, node: Any) -> None:
+        """
+        Додає ізольовану вершину.
+
+        Аргументи:
+            node (Any): Вершина.
+        """
+        if node in self.graph:
+            return
+        self.graph.add_node(node)
+        self._add_component(node)
+        self._change_degree(None, 0)
+        self._path_statistics = None
+
+    def add_edge(self, u: Any, v: Any, **attributes: Any) -> None:
+        """
+        Додає ребро (або оновлює атрибути наявного ребра).
+
+        Аргументи:
+            u (Any): Перша вершина.
+            v (Any): Друга вершина.
+            **attributes: Атрибути ребра.
+        """
+        self.add_node(u)
+        self.add_node(v)
+        if self.graph.has_edge(u, v):
+            self.graph[u][v].update(attributes)
+            return
+
+        before = {node: self.graph.degree(node) for node in (u, v)}
+        self.graph.add_edge(u, v, **attributes)
+        for node, degree in before.items():
+            self._change_degree(degree, self.graph.degree(node))
+        self._union(u, v)
+        self._path_statistics = None
+
+    def remove_edge(self, u: Any, v: Any) -> None:
+        """
+        Видаляє ребро та, за потреби, розділяє компоненту.
+
+        Аргументи:
+            u (Any): Перша вершина.
+            v (Any): Друга вершина.
+
+        Raises:
+            nx.NetworkXError: Якщо ребра немає в графі.
+        """
+        before = {node: self.graph.degree(node) for node in (u, v)}
+        self.graph.remove_edge(u, v)
+        for node, degree in before.items():
+            self._change_degree(degree, self.graph.degree(node))
+
+        if u != v:
+            separated = self._separated_side(u, v)
+            if separated is not None:
+                self._split(self._component[u], separated)
+        self._path_statistics = None
+
+    def results(self) -> Dict:
+        """
+        Повертає характеристики графа у форматі `analyze_graph`.
+
+        Повертає:
+            Dict: Словник з характеристиками графа.
+        """
+        diameter = self.diameter
+        return {
+            'num_nodes': self.num_nodes,
+            'num_edges': self.num_edges,
+            'degree_distribution': [degree for _, degree in self.graph.degree()],
+            'degree_count': self.degree_count,
+            'average_degree': self.average_degree,
+            'connected_components': self.connected_components,
+            'diameter': diameter,
+            'average_shortest_path_length': self.average_shortest_path_length,
+            'average_shortest_path_length_error': (
+                self._path_statistics['error_bound'] if diameter is not None else None
+            ),
+        }
+
+    def _get_path_statistics(self) -> Optional[Dict]:
+        """Повертає кешовану статистику шляхів, перераховуючи її після змін графа."""
+        if len(self._members) != 1:
+            return None
+        if self._path_statistics is None:
+            self._path_statistics = path_statistics(self.graph, mode=self.mode, processes=self.processes)
+        return self._path_statistics
+
+    def _change_degree(self, old: Optional[int], new: int) -> None:
+        """Переносить вершину з одного ступеня в розподілі на інший."""
+        if old is not None:
+            self._degree_count[old] -= 1
+            if self._degree_count[old] == 0:
+                del self._degree_count[old]
+            self._degree_total -= old
+        self._degree_count[new] = self._degree_count.get(new, 0) + 1
+        self._degree_total += new
+
+    def _add_component(self, node: Any) -> None:
+        """Створює компоненту з однієї вершини."""
+        label = next(self._labels)
+        self._component[node] = label
+        self._members[label] = {node}
+
+    def _union(self, u: Any, v: Any) -> None:
+        """Об'єднує компоненти двох вершин (вершини меншої отримують мітку більшої)."""
+        label_u, label_v = self._component[u], self._component[v]
+        if label_u == label_v:
+            return
+        if len(self._members[label_u]) < len(self._members[label_v]):
+            label_u, label_v = label_v, label_u
+        moved = self._members.pop(label_v)
+        for node in moved:
+            self._component[node] = label_u
+        self._members[label_u] |= moved
+
+    def _separated_side(self, u: Any, v: Any) -> Optional[Set[Any]]:
+        """
+        Перевіряє, чи залишились u та v зв'язаними після видалення ребра.
+
+        Двонаправлений BFS розширює менший фронт; якщо він вичерпався без зустрічі,
+        відвідані ним вершини утворюють нову компоненту.
+
+        Аргументи:
+            u (Any): Перша вершина видаленого ребра.
+            v (Any): Друга вершина видаленого ребра.
+
+        Повертає:
+            Set[Any]: Вершини відокремленої частини або None, якщо компонента не розпалась.
+        """
+        visited = ({u}, {v})
+        frontiers = ([u], [v])
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(visited[0]) <= len(visited[1]) else 1
+            next_frontier = []
+            for node in frontiers[side]:
+                for adjacent in self.graph[node]:
+                    if adjacent in visited[1 - side]:
+                        return None
+                    if adjacent not in visited[side]:
+                        visited[side].add(adjacent)
+                        next_frontier.append(adjacent)
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+        return visited[0] if not frontiers[0] else visited[1]
+
+    def _split(self, label: int, separated: Set[Any]) -> None:
+        """
+        Виділяє відокремлену частину компоненти в нову компоненту.
+
+        Мітку змінюють лише вершини відокремленої частини, тож робота пропорційна її розміру.
+
+        Аргументи:
+            label (int): Мітка компоненти до розділення.
+            separated (Set[Any]): Вершини, що утворюють нову компоненту.
+        """
+        self._members[label] -= separated
+        new_label = next(self._labels)
+        for node in separated:
+            self._component[node] = new_label
+        self._members[new_label] = separated
@@ -0,0 +1,124 @@
+"""
+Модуль для кешування розташування вершин графа (spring layout).
+
+`nx.spring_layout` має складність O(V² · iterations), тому обчислювати його для
+кожного зображення того самого графа надто дорого. Функція `get_layout` зберігає
+результат у LRU-кеші в пам'яті з ключем "відбиток структури графа + параметри
+розташування" і, за бажанням, у файлах `.npy` на диску.
+
+Використання:
+    - get_layout(graph, seed=42) -> dict: позиції вершин (з кешу або обчислені).
+    - configure_layout_cache(max_entries, cache_dir): налаштування кешу.
+    - clear_layout_cache(): очищення кешу в пам'яті.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import numpy as np
+import networkx as nx
+from graph01.compact_graph import CompactGraph
+
+_cache: 'OrderedDict[str, Dict[Any, np.ndarray]]' = OrderedDict()
+_settings = {'max_entries': 16, 'cache_dir': None}
+
+
+def configure_layout_cache(max_entries: int = 16, cache_dir: Optional[str] = None) -> None:
+    """
+    Налаштовує кеш розташувань.
+
+    Аргументи:
+        max_entries (int): Максимальна кількість розташувань у пам'яті.
+        cache_dir (str, optional): Директорія для збереження розташувань у файлах `.npy`.
+            Якщо None, кеш існує лише в пам'яті.
+    """
+    _settings['max_entries'] = max_entries
+    _settings['cache_dir'] = cache_dir
+    while len(_cache) > max_entries:
+        _cache.popitem(last=False)
+
+
+def clear_layout_cache() -> None:
+    """Очищає кеш розташувань у пам'яті (файли на диску не видаляються)."""
+    _cache.clear()
+
+
+def graph_fingerprint(graph: Any) -> str:
+    """
+    Обчислює відбиток структури графа: порядок вершин і список ребер.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф.
+
+    Повертає:
+        str: Шістнадцятковий хеш структури графа.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(graph, CompactGraph):
+        digest.update('\0'.join(map(str, graph.node_ids)).encode())
+        digest.update(graph.edge_sources.tobytes())
+        digest.update(graph.edge_targets.tobytes())
+    else:
+        digest.update('\0'.join(map(str, graph.nodes())).encode())
+        digest.update('\0'.join(f"{u}\1{v}" for u, v in graph.edges()).encode())
+    return digest.hexdigest()
+
+
+def get_layout(graph: Any, seed: int = 42, **layout_kwargs: Any) -> Dict[Any, np.ndarray]:
+    """
+    Повертає позиції вершин графа, обчислюючи `nx.spring_layout` лише за відсутності в кеші.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф для розташування.
+        seed (int): Зерно генератора випадкових чисел для `nx.spring_layout`.
+        **layout_kwargs: Додаткові параметри `nx.spring_layout` (k, iterations тощо).
+
+    Повертає:
+        Dict[Any, np.ndarray]: Словник вершина -> координати (x, y).
+    """
+    params = ','.join(f"{name}={value!r}" for name, value in sorted(layout_kwargs.items()))
+    key = hashlib.blake2b(
+        f"{graph_fingerprint(graph)}|seed={seed}|{params}".encode(), digest_size=16
+    ).hexdigest()
+
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    nodes = list(graph.nodes())
+    pos = _load_from_disk(key, nodes)
+    if pos is None:
+        layout_graph = graph.to_networkx() if isinstance(graph, CompactGraph) else graph
+        pos = nx.spring_layout(layout_graph, seed=seed, **layout_kwargs)
+        _save_to_disk(key, nodes, pos)
+
+    _cache[key] = pos
+    while len(_cache) > _settings['max_entries']:
+        _cache.popitem(last=False)
+    return pos
+
+
+def _load_from_disk(key: str, nodes: list) -> Optional[Dict[Any, np.ndarray]]:
+    """Завантажує розташування з файлу `.npy`, якщо він є і відповідає кількості вершин."""
+    cache_dir = _settings['cache_dir']
+    if cache_dir is None:
+        return None
+    filepath = os.path.join(cache_dir, f"{key}.npy")
+    if not os.path.exists(filepath):
+        return None
+    coordinates = np.load(filepath)
+    if coordinates.shape != (len(nodes), 2):
+        return None
+    return dict(zip(nodes, coordinates))
+
+
+def _save_to_disk(key: str, nodes: list, pos: Dict[Any, np.ndarray]) -> None:
+    """Зберігає розташування у файл `.npy` у порядку вершин графа."""
+    cache_dir = _settings['cache_dir']
+    if cache_dir is None:
+        return
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    coordinates = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(len(nodes), 2)
+    np.save(os.path.join(cache_dir, f"{key}.npy"), coordinates)
@@ -0,0 +1,281 @@
+"""
+Модуль для обчислення статистики найкоротших шляхів графа транспортної мережі.
+
+На відміну від послідовних викликів `nx.diameter` та `nx.average_shortest_path_length`
+(два окремі повні обходи), тут ексцентриситети, діаметр і середня довжина шляху
+обчислюються разом з одних і тих самих дерев BFS, а вершини-джерела розподіляються
+між процесами.
+
+Режими:
+    - 'exact': точний обхід з усіх вершин (паралельно).
+    - 'approximate': діаметр точно за алгоритмом iFUB, середня довжина шляху —
+      оцінка за вибіркою джерел з гарантованою відносною похибкою (емпірична нерівність Бернштейна).
+      Вибірка подвоюється від INITIAL_SAMPLE_SIZE джерел, доки межа похибки не стане
+      часткою epsilon від оцінки, або задається явно параметром sample_size.
+
+Використання:
+    - path_statistics(graph, mode='exact') -> dict: статистика шляхів зв'язного графа.
+    - ifub_diameter(graph) -> int: точний діаметр за iFUB з чотирма проходами (4-sweep).
+    - double_sweep_lower_bound(graph) -> int: нижня межа діаметра за два проходи BFS.
+"""
+
+import math
+import os
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from graph01.compact_graph import CompactGraph, bfs_levels
+
+# Мінімальна кількість вершин, з якої вмикається пул процесів за замовчуванням
+PARALLEL_THRESHOLD = 2000
+
+# Кількість джерел першого етапу вибірки в режимі 'approximate'
+INITIAL_SAMPLE_SIZE = 64
+
+_worker_graph: Optional[CompactGraph] = None
+
+
+def path_statistics(
+    graph: Any,
+    mode: str = 'exact',
+    processes: Optional[int] = None,
+    epsilon: float = 0.05,
+    confidence: float = 0.95,
+    seed: int = 42,
+    sample_size: Optional[int] = None
+) -> Dict:
+    """
+    Обчислює діаметр і середню довжину найкоротшого шляху зв'язного графа.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Зв'язний граф.
+        mode (str): 'exact' або 'approximate'.
+        processes (int, optional): Кількість процесів. None — автоматично
+            (усі ядра для графів від PARALLEL_THRESHOLD вершин, інакше 1).
+        epsilon (float): Допустима відносна похибка середньої довжини шляху
+            (частка від самого середнього) в режимі 'approximate'.
+        confidence (float): Імовірність, з якою похибка не перевищує epsilon.
+        seed (int): Зерно для вибору джерел у режимі 'approximate'.
+        sample_size (int, optional): Фіксована кількість джерел у режимі 'approximate'
+            замість добору за epsilon; межа похибки тоді лише повідомляється.
+
+    Повертає:
+        Dict: Словник з ключами 'diameter', 'average_shortest_path_length',
+        'eccentricities' (лише в режимі 'exact'), 'error_bound' (абсолютна межа
+        похибки середньої довжини шляху) та 'sources'.
+
+    Raises:
+        ValueError: Якщо mode не є 'exact' або 'approximate'.
+    """
+    if mode not in ('exact', 'approximate'):
+        raise ValueError("mode must be either 'exact' or 'approximate'")
+
+    compact = _as_compact(graph)
+    num_nodes = compact.number_of_nodes()
+    if num_nodes < 2:
+        return {
+            'diameter': 0,
+            'average_shortest_path_length': 0.0,
+            'eccentricities': {node: 0 for node in compact.node_ids},
+            'error_bound': 0.0,
+            'sources': num_nodes
+        }
+
+    if processes is None:
+        processes = (os.cpu_count() or 1) if num_nodes >= PARALLEL_THRESHOLD else 1
+
+    if mode == 'exact':
+        sources = np.arange(num_nodes)
+        eccentricities, lengths = _sweep(compact, sources, processes)
+        return {
+            'diameter': int(eccentricities.max()),
+            'average_shortest_path_length': int(lengths.sum()) / (num_nodes * (num_nodes - 1)),
+            'eccentricities': dict(zip(compact.node_ids, eccentricities.tolist())),
+            'error_bound': 0.0,
+            'sources': num_nodes
+        }
+
+    diameter = ifub_diameter(compact)
+
+    # Джерела беруться з однієї випадкової перестановки, тож кожен етап лише доповнює вибірку
+    order = np.random.default_rng(seed).permutation(num_nodes)
+    delta = 1.0 - confidence
+    if sample_size is not None:
+        sources = order[:max(2, min(sample_size, num_nodes))]
+        _, lengths = _sweep(compact, sources, processes)
+        means = lengths / (num_nodes - 1)
+        error_bound = 0.0 if len(sources) == num_nodes else _bernstein_error(means, diameter, delta)
+    else:
+        # Вибірка подвоюється, доки межа похибки не стане часткою epsilon від середнього;
+        # рівень значущості ділиться між етапами (δ/2, δ/4, ...), тож гарантія зберігається
+        means = np.empty(0, dtype=np.float64)
+        size = min(INITIAL_SAMPLE_SIZE, num_nodes)
+        stage = 1
+        while True:
+            _, lengths = _sweep(compact, order[len(means):size], processes)
+            means = np.concatenate([means, lengths / (num_nodes - 1)])
+            if len(means) == num_nodes:
+                error_bound = 0.0
+                break
+            error_bound = _bernstein_error(means, diameter, delta / 2 ** stage)
+            if error_bound <= epsilon * (means.mean() - error_bound):
+                break
+            size = min(2 * size, num_nodes)
+            stage += 1
+
+    return {
+        'diameter': diameter,
+        'average_shortest_path_length': float(means.mean()),
+        'eccentricities': None,
+        'error_bound': error_bound,
+        'sources': len(means)
+    }
+
+
+def double_sweep_lower_bound(graph: Any, start: Optional[int] = None) -> int:
+    """
+    Нижня межа діаметра за два проходи BFS (double sweep).
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Зв'язний граф.
+        start (int, optional): Індекс початкової вершини (за замовчуванням вершина найбільшого ступеня).
+
+    Повертає:
+        int: Ексцентриситет найвіддаленішої вершини від найвіддаленішої вершини старту.
+    """
+    compact = _as_compact(graph)
+    if start is None:
+        start = int(np.argmax(compact.degree()))
+    farthest = int(np.argmax(bfs_levels(compact, start)))
+    return int(bfs_levels(compact, farthest).max())
+
+
+def ifub_diameter(graph: Any) -> int:
+    """
+    Точний діаметр зв'язного графа за алгоритмом iFUB.
+
+    Центр обирається чотирма проходами BFS (4-sweep), після чого рівні BFS-дерева
+    від центру обробляються від найглибшого, доки нижня межа не перевищить верхню.
+    На транспортних мережах зазвичай потрібна лише невелика частка BFS від усіх вершин.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Зв'язний граф.
+
+    Повертає:
+        int: Діаметр графа.
+    """
+    compact = _as_compact(graph)
+    if compact.number_of_nodes() < 2:
+        return 0
+
+    start = int(np.argmax(compact.degree()))
+    middle, lower_bound = _sweep_middle(compact, start)
+    center, second_bound = _sweep_middle(compact, middle)
+    lower_bound = max(lower_bound, second_bound)
+
+    levels = bfs_levels(compact, center)
+    level = int(levels.max())
+    lower_bound = max(lower_bound, level)
+    upper_bound = 2 * level
+
+    while upper_bound > lower_bound:
+        fringe = np.flatnonzero(levels == level)
+        fringe_bound = max(int(bfs_levels(compact, int(node)).max()) for node in fringe)
+        lower_bound = max(lower_bound, fringe_bound)
+        if lower_bound > 2 * (level - 1):
+            return lower_bound
+        upper_bound = 2 * (level - 1)
+        level -= 1
+    return lower_bound
+
+
+def _sweep_middle(graph: CompactGraph, start: int) -> Tuple[int, int]:
+    """
+    Подвійний прохід від start: повертає середню вершину шляху a-b та ексцентриситет a.
+
+    Аргументи:
+        graph (CompactGraph): Зв'язний граф.
+        start (int): Індекс початкової вершини.
+
+    Повертає:
+        Tuple[int, int]: Індекс середньої вершини та нижня межа діаметра.
+    """
+    first = int(np.argmax(bfs_levels(graph, start)))
+    from_first = bfs_levels(graph, first)
+    second = int(np.argmax(from_first))
+    from_second = bfs_levels(graph, second)
+    length = int(from_first[second])
+
+    # Середина найкоротшого шляху first-second: відстані до обох кінців складаються в length
+    half = length // 2
+    candidates = np.flatnonzero((from_first == half) & (from_second == length - half))
+    return int(candidates[0]), length
+
+
+def _sweep(graph: CompactGraph, sources: np.ndarray, processes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Виконує BFS з кожного джерела та збирає ексцентриситети і суму відстаней.
+
+    Аргументи:
+        graph (CompactGraph): Граф.
+        sources (np.ndarray): Індекси вершин-джерел.
+        processes (int): Кількість процесів.
+
+    Повертає:
+        Tuple[np.ndarray, np.ndarray]: Ексцентриситети джерел і суми відстаней від кожного з них.
+    """
+    if processes <= 1 or len(sources) < 2 * processes:
+        return _sweep_chunk(graph, sources)
+
+    chunks = np.array_split(sources, processes * 4)
+    with Pool(processes, initializer=_init_worker, initargs=(graph,)) as pool:
+        results: List[Tuple[np.ndarray, np.ndarray]] = pool.map(_sweep_worker, chunks)
+
+    eccentricities = np.concatenate([result[0] for result in results])
+    return eccentricities, np.concatenate([result[1] for result in results])
+
+
+def _sweep_chunk(graph: CompactGraph, sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Послідовний BFS з частини джерел."""
+    eccentricities = np.empty(len(sources), dtype=np.int32)
+    lengths = np.empty(len(sources), dtype=np.int64)
+    for position, source in enumerate(sources.tolist()):
+        distances = bfs_levels(graph, source)
+        eccentricities[position] = distances.max()
+        lengths[position] = distances.sum(dtype=np.int64)
+    return eccentricities, lengths
+
+
+def _init_worker(graph: CompactGraph) -> None:
+    """Ініціалізує процес пулу: граф передається один раз на процес, а не на кожне завдання."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _sweep_worker(sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Обробляє частину джерел у процесі пулу."""
+    return _sweep_chunk(_worker_graph, sources)
+
+
+def _as_compact(graph: Any) -> CompactGraph:
+    """Повертає компактне представлення графа (без копіювання, якщо воно вже компактне)."""
+    if isinstance(graph, CompactGraph):
+        return graph
+    return CompactGraph.from_networkx(graph)
+
+
+def _bernstein_error(means: np.ndarray, diameter: int, delta: float) -> float:
+    """
+    Межа абсолютної похибки середньої довжини шляху за вибіркою джерел.
+
+    Середня відстань від джерела лежить у [1, diameter]; емпірична нерівність Бернштейна
+    (Маурер–Понтіль) враховує вибіркову дисперсію цих середніх, яка на транспортних мережах
+    значно менша за квадрат діапазону, тож потрібно набагато менше джерел, ніж за Гефдінгом.
+    """
+    sample_size = len(means)
+    log_term = math.log(4.0 / delta)
+    variance = float(means.var(ddof=1))
+    return (
+        math.sqrt(2.0 * variance * log_term / sample_size)
+        + 7.0 * (diameter - 1) * log_term / (3.0 * (sample_size - 1))
+    )
@@ -0,0 +1,246 @@
+"""
+Модуль для аналізу стійкості транспортної мережі до закриття станцій і з'єднань.
+
+Один ітеративний (без рекурсії) обхід у глибину за алгоритмом Гопкрофта–Тар'яна
+за O(V + E) знаходить:
+    - мости — з'єднання, закриття кожного з яких розділяє мережу;
+    - точки зчленування — станції, закриття кожної з яких розділяє мережу;
+    - двозв'язні компоненти (за вершинами) та компоненти реберної двозв'язності.
+
+Стягнення компонент реберної двозв'язності дає ліс мостів, тож запит «що як закрити
+ці k з'єднань» не потребує повної перевірки зв'язності: кожен закритий міст додає
+рівно одну компоненту, а всередині компоненти реберної двозв'язності закриття одного
+з'єднання нічого не розділяє, тому обхід потрібен лише для компонент, у яких закрито
+два з'єднання чи більше, і лише в їх межах.
+
+Використання:
+    resilience = ResilienceAnalysis(graph)
+    resilience.bridges, resilience.articulation_points
+    resilience.close_edges([('31', '41'), ('11', '32')]) -> dict
+    resilience.close_edges_batch(scenarios) -> list
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Set, Tuple
+import numpy as np
+from graph01.compact_graph import CompactGraph
+
+
+class ResilienceAnalysis:
+    """
+    Мости, точки зчленування та двозв'язні компоненти графа з пакетними запитами закриття з'єднань.
+
+    Атрибути:
+        graph (CompactGraph): Компактне представлення графа.
+        bridges (List[Tuple[Any, Any]]): Мости у порядку їх знаходження.
+        articulation_points (List[Any]): Точки зчленування в порядку вершин графа.
+        biconnected_components (List[Set[Any]]): Вершини кожної двозв'язної компоненти
+            (як у `nx.biconnected_components`).
+        two_edge_labels (np.ndarray): Номер компоненти реберної двозв'язності для кожної вершини.
+        num_two_edge_components (int): Кількість компонент реберної двозв'язності.
+        connected_components (int): Кількість зв'язних компонент.
+    """
+
+    def __init__(self, graph: Any) -> None:
+        self.graph = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+        compact = self.graph
+        num_nodes = compact.number_of_nodes()
+        indptr = compact.indptr.tolist()
+        indices = compact.indices.tolist()
+        edge_ids = compact.edge_ids.tolist()
+        sources = compact.edge_sources.tolist()
+        targets = compact.edge_targets.tolist()
+
+        discovery = [-1] * num_nodes
+        low = [0] * num_nodes
+        cursor = indptr[:-1]
+        labels = [-1] * num_nodes
+        is_bridge = [False] * len(sources)
+        is_articulation = [False] * num_nodes
+        bridge_ids: List[int] = []
+        blocks: List[Set[int]] = []
+        edge_stack: List[int] = []
+        node_stack: List[int] = []
+        time = 0
+        num_labels = 0
+        num_components = 0
+
+        for root in range(num_nodes):
+            if discovery[root] >= 0:
+                continue
+            num_components += 1
+            discovery[root] = low[root] = time
+            time += 1
+            node_stack.append(root)
+            root_children = 0
+            # Стек обходу: (вершина, ребро, яким до неї прийшли)
+            stack = [(root, -1)]
+            while stack:
+                node, parent_edge = stack[-1]
+                if cursor[node] < indptr[node + 1]:
+                    position = cursor[node]
+                    cursor[node] += 1
+                    adjacent, edge = indices[position], edge_ids[position]
+                    if edge == parent_edge or adjacent == node:
+                        continue
+                    if discovery[adjacent] < 0:
+                        discovery[adjacent] = low[adjacent] = time
+                        time += 1
+                        edge_stack.append(edge)
+                        node_stack.append(adjacent)
+                        stack.append((adjacent, edge))
+                    elif discovery[adjacent] < discovery[node]:
+                        # Зворотне ребро до предка
+                        low[node] = min(low[node], discovery[adjacent])
+                        edge_stack.append(edge)
+                    continue
+
+                stack.pop()
+                if not stack:
+                    break
+                parent = stack[-1][0]
+                low[parent] = min(low[parent], low[node])
+                if parent == root:
+                    root_children += 1
+                if low[node] >= discovery[parent]:
+                    # parent відокремлює піддерево node: ребра до parent_edge утворюють двозв'язну компоненту
+                    if parent != root:
+                        is_articulation[parent] = True
+                    block = set()
+                    while True:
+                        popped = edge_stack.pop()
+                        block.add(sources[popped])
+                        block.add(targets[popped])
+                        if popped == parent_edge:
+                            break
+                    blocks.append(block)
+                if low[node] > discovery[parent]:
+                    is_bridge[parent_edge] = True
+                    bridge_ids.append(parent_edge)
+                    # Вершини піддерева node, що лишились у стеку, — одна компонента реберної двозв'язності
+                    num_labels = _pop_label(node_stack, node, labels, num_labels)
+
+            num_labels = _pop_label(node_stack, root, labels, num_labels)
+            if root_children >= 2:
+                is_articulation[root] = True
+
+        node_ids = compact.node_ids
+        self.bridges = [(node_ids[sources[edge]], node_ids[targets[edge]]) for edge in bridge_ids]
+        self.articulation_points = [node_ids[node] for node in range(num_nodes) if is_articulation[node]]
+        self.biconnected_components = [{node_ids[node] for node in block} for block in blocks]
+        self.two_edge_labels = np.array(labels, dtype=np.int64)
+        self.num_two_edge_components = num_labels
+        self.connected_components = num_components
+
+        self._is_bridge = is_bridge
+        self._labels = labels
+        self._edge_index: Dict[FrozenSet[int], int] = {
+            frozenset((u, v)): edge for edge, (u, v) in enumerate(zip(sources, targets))
+        }
+
+    def results(self) -> Dict:
+        """
+        Повертає підсумок стійкості мережі.
+
+        Повертає:
+            Dict: Словник з ключами 'bridges', 'articulation_points', 'biconnected_components'
+            (кількість) та 'two_edge_connected_components' (кількість).
+        """
+        return {
+            'bridges': list(self.bridges),
+            'articulation_points': list(self.articulation_points),
+            'biconnected_components': len(self.biconnected_components),
+            'two_edge_connected_components': self.num_two_edge_components,
+        }
+
+    def close_edges(self, edges: Iterable[Tuple[Any, Any]]) -> Dict:
+        """
+        Оцінює наслідки одночасного закриття кількох з'єднань.
+
+        Аргументи:
+            edges (Iterable[Tuple[Any, Any]]): Закриті з'єднання (пари станцій).
+
+        Повертає:
+            Dict: Словник з ключами:
+                'components' — кількість зв'язних компонент після закриття;
+                'disconnected' — чи збільшилась кількість компонент;
+                'closed_bridges' — закриті мости.
+
+        Raises:
+            ValueError: Якщо з'єднання немає в графі.
+        """
+        closed = set()
+        for u, v in edges:
+            edge = None
+            if u in self.graph and v in self.graph:
+                edge = self._edge_index.get(frozenset((self.graph.index_of(u), self.graph.index_of(v))))
+            if edge is None:
+                raise ValueError(f"unknown edge ({u}, {v})")
+            closed.add(edge)
+
+        # У лісі мостів закриття кожного моста додає одну компоненту
+        closed_bridges = [edge for edge in closed if self._is_bridge[edge]]
+        components = self.connected_components + len(closed_bridges)
+
+        by_label: Dict[int, Set[int]] = {}
+        for edge in closed:
+            if not self._is_bridge[edge]:
+                by_label.setdefault(self._labels[self.graph.edge_sources[edge]], set()).add(edge)
+        for label, label_edges in by_label.items():
+            # Компонента реберної двозв'язності витримує закриття будь-якого одного з'єднання
+            if len(label_edges) >= 2:
+                components += self._count_pieces(label, label_edges) - 1
+
+        node_ids = self.graph.node_ids
+        sources, targets = self.graph.edge_sources, self.graph.edge_targets
+        return {
+            'components': components,
+            'disconnected': components > self.connected_components,
+            'closed_bridges': [(node_ids[sources[edge]], node_ids[targets[edge]]) for edge in sorted(closed_bridges)],
+        }
+
+    def close_edges_batch(self, scenarios: Iterable[Iterable[Tuple[Any, Any]]]) -> List[Dict]:
+        """
+        Оцінює наслідки закриття для кожного сценарію окремо.
+
+        Аргументи:
+            scenarios (Iterable[Iterable[Tuple[Any, Any]]]): Сценарії — набори закритих з'єднань.
+
+        Повертає:
+            List[Dict]: Результат `close_edges` для кожного сценарію.
+        """
+        return [self.close_edges(scenario) for scenario in scenarios]
+
+    def _count_pieces(self, label: int, closed: Set[int]) -> int:
+        """Кількість частин компоненти реберної двозв'язності без закритих ребер (обхід у її межах)."""
+        graph = self.graph
+        labels = self._labels
+        indptr, indices, edge_ids = graph.indptr, graph.indices, graph.edge_ids
+        members = [int(node) for edge in closed for node in (graph.edge_sources[edge], graph.edge_targets[edge])]
+
+        # Достатньо перевірити кінці закритих ребер: решта вершин з'єднана з ними
+        seen: Set[int] = set()
+        pieces = 0
+        for start in members:
+            if start in seen:
+                continue
+            pieces += 1
+            seen.add(start)
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                for position in range(indptr[node], indptr[node + 1]):
+                    adjacent = int(indices[position])
+                    if adjacent in seen or labels[adjacent] != label or int(edge_ids[position]) in closed:
+                        continue
+                    seen.add(adjacent)
+                    stack.append(adjacent)
+        return pieces
+
+
+def _pop_label(node_stack: List[int], node: int, labels: List[int], label: int) -> int:
+    """Знімає зі стеку вершини до node включно та призначає їм номер компоненти; повертає наступний номер."""
+    while True:
+        popped = node_stack.pop()
+        labels[popped] = label
+        if popped == node:
+            return label + 1
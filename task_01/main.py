@@ -6,15 +6,17 @@
 2. Використання функцій для створення, візуалізації та аналізу графа.
 """
 
-from typing import Any
+import argparse
+from typing import Any, Optional
 
 from graph01.graph_creation import create_transport_network_graph
-from graph01.graph_visualization import visualize_graph
 from graph01.graph_analysis import analyze_graph, print_analysis_results
+from graph01.degree_statistics import degree_statistics
+from graph01.centrality import centrality
 
 from edges import edges
 
-def main() -> None:
+def main(render: bool = True, size_by: str = 'degree', report_centrality: bool = True) -> None:
     """
     Головна функція для створення, візуалізації та аналізу графа транспортної мережі.
 
@@ -23,7 +25,10 @@ def main() -> None:
     - Виконує аналіз графа та виводить результати аналізу.
 
     Args:
-        Немає.
+        render (bool): Чи візуалізувати граф. Без візуалізації matplotlib не імпортується.
+        size_by (str): Розмір вузлів на зображенні: 'degree' (ступінь) або
+            'betweenness' (посередницька центральність).
+        report_centrality (bool): Чи виводити вузькі місця та центральні станції.
     
     Returns:
         Немає.
@@ -31,18 +36,47 @@ def main() -> None:
     # Створення графа транспортної мережі
     transport_network_graph: Any = create_transport_network_graph(edges)
 
-    # Візуалізація графа з можливістю передачі назви файлу та папки
-    visualize_graph(
-        transport_network_graph,
-        output_dir='task_01/results',
-        filename='transport_network_graph'
-    )
+    # Статистика ступенів обчислюється один раз для візуалізації та аналізу
+    degree_stats: dict = degree_statistics(transport_network_graph)
+
+    # Центральності обчислюються лише тоді, коли вони потрібні для виведення або розмірів вузлів,
+    # і один раз для обох
+    centrality_stats: Optional[dict] = None
+    if report_centrality or (render and size_by == 'betweenness'):
+        centrality_stats = centrality(transport_network_graph)
+
+    if render:
+        # Модуль візуалізації (і matplotlib) імпортується лише тоді, коли потрібне зображення
+        from graph01.graph_visualization import visualize_graph
 
-    # Аналіз графа транспортної мережі
-    analysis_results: dict = analyze_graph(transport_network_graph)
+        # Візуалізація графа з можливістю передачі назви файлу та папки
+        visualize_graph(
+            transport_network_graph,
+            output_dir='task_01/results',
+            filename='transport_network_graph',
+            degree_stats=degree_stats,
+            centrality_stats=centrality_stats if size_by == 'betweenness' else None
+        )
+
+    # Аналіз графа транспортної мережі разом з уже обчисленими центральностями
+    analysis_results: dict = analyze_graph(
+        transport_network_graph, degree_stats=degree_stats,
+        centrality_stats=centrality_stats if report_centrality else None
+    )
 
     # Виведення результатів аналізу
     print_analysis_results(analysis_results)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Аналіз графа транспортної мережі.")
+    parser.add_argument('--no-render', action='store_true', help="лише аналіз, без збереження зображень")
+    parser.add_argument(
+        '--size-by', choices=('degree', 'betweenness'), default='degree',
+        help="розмір вузлів на зображенні: за ступенем або посередницькою центральністю"
+    )
+    parser.add_argument(
+        '--no-centrality', action='store_true',
+        help="не виводити вузькі місця та центральні станції (без обчислення центральностей)"
+    )
+    args = parser.parse_args()
+    main(render=not args.no_render, size_by=args.size_by, report_centrality=not args.no_centrality)
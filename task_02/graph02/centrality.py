@@ -0,0 +1,217 @@
+"""
+Модуль для обчислення посередницької (betweenness) та близькісної (closeness) центральності
+вершин графа транспортної мережі.
+
+Ступінь показує лише кількість з'єднань станції. Посередницька центральність —
+частка найкоротших шляхів між іншими станціями, що проходять через станцію
+(вузькі місця мережі), а близькісна — обернена середня відстань до інших станцій (хаби).
+Обидві величини обчислюються за алгоритмом Брандеса з одних і тих самих дерев BFS,
+а вершини-джерела розподіляються між процесами.
+
+Режими:
+    - 'exact': точний алгоритм Брандеса з усіх вершин, O(V·E).
+    - 'approximate': джерела обираються випадково, внески масштабуються на V / k.
+      Нормована посередницька центральність кожної вершини відхиляється від точної
+      не більше ніж на epsilon з імовірністю confidence (нерівність Гефдінга
+      з поправкою на кількість вершин); близькісна центральність оцінюється з тієї ж вибірки.
+
+Значення збігаються з `nx.betweenness_centrality` і `nx.closeness_centrality`
+(нормовані, з поправкою Вассермана–Фауста для незв'язних графів).
+
+Використання:
+    - centrality(graph, mode='exact') -> dict: центральності та найважливіші станції.
+    - centrality_node_sizes(centrality_stats) -> np.ndarray: розміри вузлів для візуалізації.
+"""
+
+import math
+import os
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from graph02.compact_graph import CompactGraph
+
+# Мінімальна кількість вершин, з якої вмикається пул процесів за замовчуванням
+PARALLEL_THRESHOLD = 2000
+
+# Площа вузла на рисунку для найменшої та найбільшої посередницької центральності
+MIN_NODE_SIZE = 300
+MAX_NODE_SIZE = 2400
+
+_worker_graph: Optional[CompactGraph] = None
+
+
+def centrality(
+    graph: Any,
+    mode: str = 'exact',
+    processes: Optional[int] = None,
+    epsilon: float = 0.05,
+    confidence: float = 0.95,
+    seed: int = 42,
+    top: int = 5
+) -> Dict:
+    """
+    Обчислює посередницьку та близькісну центральність усіх вершин.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        mode (str): 'exact' або 'approximate'.
+        processes (int, optional): Кількість процесів. None — автоматично
+            (усі ядра для графів від PARALLEL_THRESHOLD вершин, інакше 1).
+        epsilon (float): Допустима абсолютна похибка нормованої посередницької
+            центральності в режимі 'approximate'.
+        confidence (float): Імовірність, з якою похибка всіх вершин не перевищує epsilon.
+        seed (int): Зерно для вибору джерел у режимі 'approximate'.
+        top (int): Кількість найважливіших станцій у 'bottlenecks' та 'central_stations'.
+
+    Повертає:
+        Dict: Словник з ключами:
+            'nodes' — вершини в порядку графа;
+            'betweenness', 'closeness' — вектори центральностей у тому ж порядку;
+            'bottlenecks' — станції з найбільшою посередницькою центральністю;
+            'central_stations' — станції з найбільшою близькісною центральністю;
+            'error_bound' — гарантована похибка посередницької центральності (0 у точному режимі);
+            'sources' — кількість оброблених джерел.
+
+    Raises:
+        ValueError: Якщо mode не є 'exact' або 'approximate'.
+    """
+    if mode not in ('exact', 'approximate'):
+        raise ValueError("mode must be either 'exact' or 'approximate'")
+
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+    num_nodes = compact.number_of_nodes()
+    if processes is None:
+        processes = (os.cpu_count() or 1) if num_nodes >= PARALLEL_THRESHOLD else 1
+
+    sources = np.arange(num_nodes)
+    if mode == 'approximate' and num_nodes > 2:
+        # Внесок джерела в нормовану центральність лежить у [0, 1], тож за Гефдінгом
+        # з поправкою на V вершин достатньо k = ln(2V / δ) / (2 · ε²) джерел
+        sample_size = math.ceil(math.log(2.0 * num_nodes / (1.0 - confidence)) / (2.0 * epsilon ** 2))
+        if sample_size < num_nodes:
+            sources = np.random.default_rng(seed).choice(num_nodes, size=sample_size, replace=False)
+
+    dependencies, distance_sums, reach = _accumulate(compact, sources, processes)
+    scale = num_nodes / len(sources) if len(sources) else 0.0
+    exact = len(sources) == num_nodes
+
+    betweenness = dependencies * scale
+    if num_nodes > 2:
+        betweenness /= (num_nodes - 1) * (num_nodes - 2)
+
+    # Для неорієнтованого графа відстані від вершини дорівнюють відстаням до неї від джерел
+    reached = reach * scale
+    closeness = np.zeros(num_nodes, dtype=np.float64)
+    if num_nodes > 1:
+        positive = distance_sums > 0
+        closeness[positive] = (
+            reached[positive] ** 2 / (distance_sums[positive] * scale) / (num_nodes - 1)
+        )
+
+    nodes = compact.node_ids
+    return {
+        'nodes': nodes,
+        'betweenness': betweenness,
+        'closeness': closeness,
+        'bottlenecks': [nodes[i] for i in np.argsort(-betweenness, kind='stable')[:top].tolist()],
+        'central_stations': [nodes[i] for i in np.argsort(-closeness, kind='stable')[:top].tolist()],
+        'error_bound': 0.0 if exact else epsilon * num_nodes / (num_nodes - 1),
+        'sources': len(sources),
+    }
+
+
+def centrality_node_sizes(centrality_stats: Dict) -> np.ndarray:
+    """
+    Повертає розміри вузлів для візуалізації, пропорційні посередницькій центральності.
+
+    Аргументи:
+        centrality_stats (Dict): Результат `centrality` для графа.
+
+    Повертає:
+        np.ndarray: Розміри вузлів у порядку `graph.nodes()` від MIN_NODE_SIZE до MAX_NODE_SIZE.
+    """
+    betweenness = centrality_stats['betweenness']
+    highest = betweenness.max() if betweenness.size else 0.0
+    if highest <= 0:
+        return np.full(betweenness.shape, MIN_NODE_SIZE, dtype=np.float64)
+    return MIN_NODE_SIZE + (MAX_NODE_SIZE - MIN_NODE_SIZE) * betweenness / highest
+
+
+def _accumulate(graph: CompactGraph, sources: np.ndarray, processes: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Сумує залежності Брандеса, суми відстаней і кількість досяжних джерел для всіх вершин.
+
+    Аргументи:
+        graph (CompactGraph): Граф.
+        sources (np.ndarray): Індекси вершин-джерел.
+        processes (int): Кількість процесів.
+
+    Повертає:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Суми залежностей, відстаней і кількість джерел,
+        з яких досяжна кожна вершина.
+    """
+    if processes <= 1 or len(sources) < 2 * processes:
+        return _accumulate_chunk(graph, sources)
+
+    chunks = np.array_split(sources, processes * 4)
+    with Pool(processes, initializer=_init_worker, initargs=(graph,)) as pool:
+        results: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = pool.map(_accumulate_worker, chunks)
+    return tuple(sum(result[i] for result in results) for i in range(3))
+
+
+def _accumulate_chunk(graph: CompactGraph, sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Послідовний алгоритм Брандеса з частини джерел."""
+    num_nodes = graph.number_of_nodes()
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    dependencies = [0.0] * num_nodes
+    distance_sums = [0] * num_nodes
+    reach = [0] * num_nodes
+
+    for source in sources.tolist():
+        distances = {source: 0}
+        paths = {source: 1}
+        order = [source]
+        # BFS: кількість найкоротших шляхів до кожної вершини в порядку відстаней
+        for node in order:
+            next_distance = distances[node] + 1
+            node_paths = paths[node]
+            for position in range(indptr[node], indptr[node + 1]):
+                adjacent = indices[position]
+                if adjacent not in distances:
+                    distances[adjacent] = next_distance
+                    paths[adjacent] = node_paths
+                    order.append(adjacent)
+                elif distances[adjacent] == next_distance:
+                    paths[adjacent] += node_paths
+
+        # Накопичення залежностей від найвіддаленіших вершин до джерела
+        delta = dict.fromkeys(order, 0.0)
+        for node in reversed(order):
+            coefficient = (1.0 + delta[node]) / paths[node]
+            previous_distance = distances[node] - 1
+            for position in range(indptr[node], indptr[node + 1]):
+                adjacent = indices[position]
+                if distances.get(adjacent) == previous_distance:
+                    delta[adjacent] += paths[adjacent] * coefficient
+            if node != source:
+                dependencies[node] += delta[node]
+                distance_sums[node] += distances[node]
+                reach[node] += 1
+
+    return (
+        np.array(dependencies, dtype=np.float64),
+        np.array(distance_sums, dtype=np.float64),
+        np.array(reach, dtype=np.float64),
+    )
+
+
+def _init_worker(graph: CompactGraph) -> None:
+    """Ініціалізує процес пулу: граф передається один раз на процес, а не на кожне завдання."""
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _accumulate_worker(sources: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Обробляє частину джерел у процесі пулу."""
+    return _accumulate_chunk(_worker_graph, sources)
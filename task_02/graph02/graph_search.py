@@ -4,16 +4,24 @@
 """
 
 from collections import deque
+from typing import Dict, Iterator, Optional, Tuple
 import networkx as nx
 
-def dfs(graph: nx.Graph, start: str, goal: str, path: list = None) -> list:
+# Позначка вичерпаного ітератора сусідів у стеку DFS
+_EXHAUSTED = object()
+
+def dfs(graph: nx.Graph, start: str, goal: str, path: list = None) -> Optional[list]:
     """Виконує пошук в глибину (DFS) для знаходження шляху між станціями.
 
+    Пошук ітеративний (з явним стеком), тому не впирається в ліміт рекурсії
+    на довгих ланцюгах станцій.
+
     Аргументи:
         graph: Граф станцій.
         start: Початкова станція.
         goal: Кінцева станція.
-        path: Поточний шлях (за замовчуванням None).
+        path: Вже пройдений шлях до start (за замовчуванням None).
+            Його вершини не відвідуються повторно.
 
     Повертає:
         Список станцій у знайденому шляху або None, якщо шлях не знайдено.
@@ -25,32 +33,236 @@ def dfs(graph: nx.Graph, start: str, goal: str, path: list = None) -> list:
         return path
     if start not in graph:
         return None
-    for node in graph[start]:
-        if node not in path:
-            new_path = dfs(graph, node, goal, path)
-            if new_path:
-                return new_path
-    return None
+    return next(_simple_paths(graph, path, goal), None)
 
-def bfs(graph: nx.Graph, start: str, goal: str) -> list:
-    """Виконує пошук в ширину (BFS) для знаходження шляху між станціями.
+def dfs_paths(
+    graph: nx.Graph,
+    start: str,
+    goal: str,
+    max_depth: Optional[int] = None,
+    max_count: Optional[int] = None
+) -> Iterator[list]:
+    """Генерує всі прості шляхи між станціями в порядку обходу DFS.
 
     Аргументи:
         graph: Граф станцій.
         start: Початкова станція.
         goal: Кінцева станція.
+        max_depth: Максимальна кількість ребер у шляху (за замовчуванням без обмеження).
+        max_count: Максимальна кількість шляхів (за замовчуванням без обмеження).
 
     Повертає:
-        Список станцій у знайденому шляху або None, якщо шлях не знайдено.
+        Генератор списків станцій, кожен з яких є простим шляхом від start до goal.
+    """
+    if start not in graph or goal not in graph:
+        return
+    if max_count is not None and max_count <= 0:
+        return
+    if start == goal:
+        yield [start]
+        return
+
+    for count, found in enumerate(_simple_paths(graph, [start], goal, max_depth), start=1):
+        yield found
+        if max_count is not None and count >= max_count:
+            return
+
+def _simple_paths(
+    graph: nx.Graph,
+    path: list,
+    goal: str,
+    max_depth: Optional[int] = None
+) -> Iterator[list]:
+    """Ітеративний DFS, що продовжує заданий шлях до цілі.
+
+    Стек містить ітератори сусідів для кожної вершини поточного шляху,
+    а множина on_path дає перевірку належності шляху за O(1).
+
+    Аргументи:
+        graph: Граф станцій.
+        path: Початковий шлях; останній елемент є вершиною, з якої починається пошук.
+        goal: Кінцева станція.
+        max_depth: Максимальна кількість ребер у шляху.
+
+    Повертає:
+        Генератор знайдених шляхів.
+    """
+    path = list(path)
+    on_path = set(path)
+    stack = [iter(graph[path[-1]])]
+
+    while stack:
+        adjacent = next(stack[-1], _EXHAUSTED)
+        if adjacent is _EXHAUSTED:
+            # Усі сусіди вершини переглянуті: повертаємося на крок назад
+            stack.pop()
+            on_path.discard(path.pop())
+            continue
+        if adjacent in on_path:
+            continue
+        if adjacent == goal:
+            if max_depth is None or len(path) <= max_depth:
+                yield path + [adjacent]
+            continue
+        if max_depth is not None and len(path) >= max_depth:
+            continue
+        path.append(adjacent)
+        on_path.add(adjacent)
+        stack.append(iter(graph[adjacent]))
+
+def bfs(graph: nx.Graph, start: str, goal: str, bidirectional: bool = False) -> Optional[list]:
+    """Виконує пошук в ширину (BFS) для знаходження шляху між станціями.
+
+    Кожна вершина відвідується не більше одного разу, а для неї зберігається
+    лише посилання на батьківську вершину. Шлях відновлюється один раз у кінці,
+    тому час і пам'ять становлять O(V + E).
+
+    Аргументи:
+        graph: Граф станцій (неорієнтований).
+        start: Початкова станція.
+        goal: Кінцева станція.
+        bidirectional: Якщо True, пошук ведеться одночасно від обох кінців.
+
+    Повертає:
+        Список станцій у найкоротшому (за кількістю ребер) шляху або None,
+        якщо шлях не знайдено.
     """
-    queue = deque([[start]])
+    if start not in graph or goal not in graph:
+        return None
+    if start == goal:
+        return [start]
+    if bidirectional:
+        return _bidirectional_bfs(graph, start, goal)
+
+    parents = {start: None}
+    queue = deque([start])
     while queue:
-        path = queue.popleft()
-        node = path[-1]
-        if node == goal:
-            return path
+        node = queue.popleft()
+        for adjacent in graph[node]:
+            if adjacent in parents:
+                continue
+            parents[adjacent] = node
+            if adjacent == goal:
+                return _reconstruct_path(parents, goal)
+            queue.append(adjacent)
+    return None
+
+def bfs_tree(graph: nx.Graph, start: str) -> Dict[str, Optional[str]]:
+    """Будує дерево BFS від станції до всіх досяжних станцій.
+
+    Сусіди обходяться в тому ж порядку, що й у `bfs`, тому шлях з дерева
+    до будь-якої станції збігається з результатом `bfs(graph, start, goal)`.
+
+    Аргументи:
+        graph: Граф станцій (неорієнтований).
+        start: Початкова станція.
+
+    Повертає:
+        Словник батьківських посилань (у start значення None); порожній, якщо станції немає в графі.
+    """
+    if start not in graph:
+        return {}
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
         for adjacent in graph[node]:
-            new_path = list(path)
-            new_path.append(adjacent)
-            queue.append(new_path)
+            if adjacent not in parents:
+                parents[adjacent] = node
+                queue.append(adjacent)
+    return parents
+
+def tree_path(parents: Dict[str, Optional[str]], goal: str) -> Optional[list]:
+    """Повертає шлях від кореня дерева `bfs_tree` до станції.
+
+    Аргументи:
+        parents: Результат `bfs_tree`.
+        goal: Кінцева станція.
+
+    Повертає:
+        Список станцій або None, якщо станція недосяжна.
+    """
+    if goal not in parents:
+        return None
+    return _reconstruct_path(parents, goal)
+
+def _bidirectional_bfs(graph: nx.Graph, start: str, goal: str) -> Optional[list]:
+    """Двонаправлений BFS: щоразу розширює повний рівень меншого з двох фронтів.
+
+    Аргументи:
+        graph: Граф станцій (неорієнтований).
+        start: Початкова станція.
+        goal: Кінцева станція.
+
+    Повертає:
+        Список станцій у найкоротшому шляху або None, якщо шлях не знайдено.
+    """
+    forward_parents = {start: None}
+    backward_parents = {goal: None}
+    forward_frontier = [start]
+    backward_frontier = [goal]
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_level(
+                graph, forward_frontier, forward_parents, backward_parents
+            )
+        else:
+            backward_frontier, meeting = _expand_level(
+                graph, backward_frontier, backward_parents, forward_parents
+            )
+
+        if meeting is not None:
+            # Половина шляху від старту до точки зустрічі + половина від неї до цілі
+            path = _reconstruct_path(forward_parents, meeting)
+            node = backward_parents[meeting]
+            while node is not None:
+                path.append(node)
+                node = backward_parents[node]
+            return path
     return None
+
+def _expand_level(
+    graph: nx.Graph,
+    frontier: list,
+    parents: Dict[str, Optional[str]],
+    other_parents: Dict[str, Optional[str]]
+) -> Tuple[list, Optional[str]]:
+    """Розширює один рівень фронту пошуку.
+
+    Аргументи:
+        graph: Граф станцій.
+        frontier: Вершини поточного рівня.
+        parents: Батьківські посилання для цього напрямку (оновлюються на місці).
+        other_parents: Батьківські посилання протилежного напрямку.
+
+    Повертає:
+        Кортеж (наступний рівень, точка зустрічі або None).
+    """
+    next_frontier = []
+    for node in frontier:
+        for adjacent in graph[node]:
+            if adjacent in parents:
+                continue
+            parents[adjacent] = node
+            if adjacent in other_parents:
+                return next_frontier, adjacent
+            next_frontier.append(adjacent)
+    return next_frontier, None
+
+def _reconstruct_path(parents: Dict[str, Optional[str]], node: str) -> list:
+    """Відновлює шлях від кореня пошуку до вершини за батьківськими посиланнями.
+
+    Аргументи:
+        parents: Словник батьківських посилань (у корені значення None).
+        node: Кінцева вершина шляху.
+
+    Повертає:
+        Список вершин від кореня до node.
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
@@ -6,16 +6,26 @@
 """
 
 import os
-import matplotlib.pyplot as plt
+from typing import Dict, Optional
 import networkx as nx
-from graph02.utils import find_adjusted_positions
+import numpy as np
+from graph02.centrality import centrality_node_sizes
+from graph02.degree_statistics import scaled_node_sizes
+from graph02.fast_rendering import (
+    draw_arrows_bulk, draw_graph_bulk, use_bulk_rendering, use_headless_backend
+)
+from graph02.layout_cache import get_layout
+from graph02.utils import find_adjusted_positions_batch
 
 def visualize_path_on_graph(
     graph: nx.Graph,
     path_nodes: list,
     output_dir: str = 'results',
     filename: str = 'transport_network_graph',
-    title: str = 'Транспортна мережа міста'
+    title: str = 'Транспортна мережа міста',
+    degree_stats: Optional[Dict] = None,
+    bulk: Optional[bool] = None,
+    centrality_stats: Optional[Dict] = None
 ) -> None:
     """
     Візуалізація графа транспортної мережі з промальовуванням шляху червоними стрілками
@@ -27,47 +37,65 @@ def visualize_path_on_graph(
         output_dir (str): Директорія, куди зберігати зображення.
         filename (str): Назва файлу без розширення.
         title (str): Назва графа для відображення на зображенні.
+        degree_stats (Dict, optional): Готовий результат `degree_statistics` для цього графа.
+        bulk (bool, optional): Пакетне малювання для великих графів (бекенд Agg, без підписів
+            понад поріг). None — автоматично за кількістю вузлів.
+        centrality_stats (Dict, optional): Результат `centrality` для цього графа. Якщо задано,
+            розмір вузлів залежить від посередницької центральності, а не від ступеня.
     """
+    # pyplot імпортується лише під час малювання, а не під час імпорту модуля
+    import matplotlib.pyplot as plt
+
+    bulk = use_bulk_rendering(graph, bulk)
+    if bulk:
+        use_headless_backend()
+
     plt.figure(figsize=(12, 10))
-    pos = nx.spring_layout(graph, seed=42)  # Позиціонування вузлів
+    pos = get_layout(graph, seed=42)  # Позиціонування вузлів (з кешу)
 
-    # Обчислюємо розміри вузлів пропорційно до їх ступеня
-    node_sizes = [300 * graph.degree(node) for node in graph.nodes()]
+    # Обчислюємо розміри вузлів пропорційно до їх ступеня або центральності
+    if centrality_stats is not None:
+        node_sizes = centrality_node_sizes(centrality_stats)
+    else:
+        node_sizes = scaled_node_sizes(graph, degree_stats)
 
     # Малюємо граф без шляху
-    nx.draw(
-        graph, pos, with_labels=True, node_size=node_sizes,
-        node_color='lightblue', font_size=9, font_weight='bold',
-        edge_color='gray'
-    )
+    if bulk:
+        draw_graph_bulk(graph, pos, node_sizes)
+    else:
+        nx.draw(
+            graph, pos, with_labels=True, node_size=node_sizes,
+            node_color='lightblue', font_size=9, font_weight='bold',
+            edge_color='gray'
+        )
 
     # Створюємо список ребер на основі шляху
     path_edges = [(path_nodes[i], path_nodes[i + 1]) for i in range(len(path_nodes) - 1)]
 
     # Малюємо червоні стрілки для ребер зі списку
-    for edge in path_edges:
-        start, end = edge
-        start_pos = pos[start]
-        end_pos = pos[end]
+    small = 0.028
+    diff = 0.006
 
-        small = 0.028
-        diff = 0.006
+    # Обчислюємо довжину стрілок, зменшуючи їх пропорційно до розмірів вузлів
+    start_sizes = np.array([graph.degree(start) for start, _ in path_edges], dtype=np.float64) * diff + small
+    end_sizes = np.array([graph.degree(end) for _, end in path_edges], dtype=np.float64) * diff + small
 
-        # Обчислюємо довжину стрілки, зменшуючи її пропорційно до розмірів вузлів
-        start_size = graph.degree(start) * diff + small
-        end_size = graph.degree(end) * diff + small
-
-        adjusted_start_pos, adjusted_end_pos = find_adjusted_positions(
-            start_pos, end_pos, start_size, end_size
-        )
+    adjusted_starts, adjusted_ends = find_adjusted_positions_batch(
+        [pos[start] for start, _ in path_edges], [pos[end] for _, end in path_edges],
+        start_sizes, end_sizes
+    )
 
-        arrow = plt.Arrow(
-            adjusted_start_pos[0], adjusted_start_pos[1],
-            adjusted_end_pos[0] - adjusted_start_pos[0],
-            adjusted_end_pos[1] - adjusted_start_pos[1],
-            width=0.02, color='red'
-        )
-        plt.gca().add_patch(arrow)
+    if bulk:
+        draw_arrows_bulk(adjusted_starts, adjusted_ends)
+    else:
+        for adjusted_start_pos, adjusted_end_pos in zip(adjusted_starts, adjusted_ends):
+            arrow = plt.Arrow(
+                adjusted_start_pos[0], adjusted_start_pos[1],
+                adjusted_end_pos[0] - adjusted_start_pos[0],
+                adjusted_end_pos[1] - adjusted_start_pos[1],
+                width=0.02, color='red'
+            )
+            plt.gca().add_patch(arrow)
 
     plt.suptitle(title, size=20)
 
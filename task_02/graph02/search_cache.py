@@ -0,0 +1,149 @@
+"""
+Модуль з кешем результатів пошуку шляхів (BFS та DFS) між станціями.
+
+`SearchCache` зберігає знайдені шляхи з ключем (стан графа, алгоритм, start, goal),
+де стан — версія разом з кількістю вершин і ребер (див. `graph02.query_cache.graph_state`).
+Для BFS на промах будується повне дерево BFS від початкової станції (`bfs_tree`),
+яке також зберігається і відповідає на наступні запити з тієї ж станції без нового
+обходу. Кожне дерево займає O(V) пам'яті, тому їх кількість обмежена окремо від
+кількості шляхів. DFS кешується лише для окремих пар, бо знайдений ним шлях залежить від цілі.
+Коли стан графа змінюється, записи старих станів видаляються.
+
+Використання:
+    cache = SearchCache(graph, max_entries=4096, ttl=300, max_sources=16)
+    path = cache.bfs('15', '16')
+    cache.stats()
+"""
+
+from typing import Any, Dict, Optional, Tuple
+import networkx as nx
+from graph02.graph_search import bfs, bfs_tree, dfs, tree_path
+from graph02.query_cache import MISSING, QueryCache, graph_state, track_changes
+
+
+class SearchCache:
+    """
+    Кеш LRU/TTL для запитів пошуку шляхів одного графа.
+
+    Атрибути:
+        graph (nx.Graph): Граф станцій.
+        cache (QueryCache): Сховище шляхів між парами станцій.
+        trees (QueryCache): Сховище дерев BFS з однієї станції.
+        reuse_source_trees (bool): Чи будувати та зберігати повне дерево BFS на промах.
+        source_hits (int): Запити BFS, на які відповіло збережене дерево BFS.
+        searches (int): Кількість виконаних обходів графа.
+        invalidations (int): Кількість змін стану графа, після яких кеш було очищено.
+    """
+
+    def __init__(
+        self,
+        graph: nx.Graph,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        reuse_source_trees: bool = True,
+        max_sources: int = 16
+    ) -> None:
+        """
+        Створює кеш пошуку шляхів графа.
+
+        Кеш вмикає для графа `track_changes`: зміни через `graph02.query_cache` та прямі
+        `G.add_edge`/`G.remove_edge` NetworkX (зокрема видалення одного ребра й додавання
+        іншого) скидають кеш автоматично.
+
+        Аргументи:
+            graph (nx.Graph): Граф станцій.
+            max_entries (int): Максимальна кількість збережених шляхів між парами станцій.
+            ttl (float, optional): Час життя записів у секундах (None — без обмеження).
+            reuse_source_trees (bool): Чи будувати та зберігати повне дерево BFS на промах.
+            max_sources (int): Максимальна кількість збережених дерев BFS.
+        """
+        track_changes(graph)
+        self.graph = graph
+        self.cache = QueryCache(max_entries, ttl)
+        self.trees = QueryCache(max_sources, ttl)
+        self.reuse_source_trees = reuse_source_trees
+        self.source_hits = 0
+        self.searches = 0
+        self.invalidations = 0
+        self._state = graph_state(graph)
+
+    def bfs(self, start: str, goal: str) -> Optional[list]:
+        """
+        Повертає найкоротший (за кількістю ребер) шлях, як `graph02.graph_search.bfs`.
+
+        Аргументи:
+            start (str): Початкова станція.
+            goal (str): Кінцева станція.
+
+        Повертає:
+            Optional[list]: Список станцій або None, якщо шлях не знайдено.
+        """
+        state = self._current_state()
+        key = (state, 'bfs', start, goal)
+        path = self.cache.get(key)
+        if path is MISSING:
+            if self.reuse_source_trees:
+                parents = self.trees.get((state, start), record=False)
+                if parents is MISSING:
+                    parents = bfs_tree(self.graph, start)
+                    self.searches += 1
+                    self.trees.put((state, start), parents)
+                else:
+                    self.source_hits += 1
+                path = tree_path(parents, goal)
+            else:
+                path = bfs(self.graph, start, goal)
+                self.searches += 1
+            self.cache.put(key, path)
+        return list(path) if path is not None else None
+
+    def dfs(self, start: str, goal: str) -> Optional[list]:
+        """
+        Повертає шлях, знайдений пошуком у глибину, як `graph02.graph_search.dfs`.
+
+        Аргументи:
+            start (str): Початкова станція.
+            goal (str): Кінцева станція.
+
+        Повертає:
+            Optional[list]: Список станцій або None, якщо шлях не знайдено.
+        """
+        state = self._current_state()
+        key = (state, 'dfs', start, goal)
+        path = self.cache.get(key)
+        if path is MISSING:
+            path = dfs(self.graph, start, goal)
+            self.searches += 1
+            self.cache.put(key, path)
+        return list(path) if path is not None else None
+
+    def clear(self) -> None:
+        """Видаляє всі записи кешу."""
+        self.cache.clear()
+        self.trees.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Повертає лічильники кешу для підбору його розміру.
+
+        Повертає:
+            Dict[str, Any]: Лічильники `QueryCache.stats` для шляхів разом з 'source_trees'
+            (кількість збережених дерев BFS), 'source_hits', 'searches' та 'invalidations'.
+        """
+        return {
+            **self.cache.stats(),
+            'source_trees': len(self.trees),
+            'source_hits': self.source_hits,
+            'searches': self.searches,
+            'invalidations': self.invalidations,
+        }
+
+    def _current_state(self) -> Tuple[int, int, int]:
+        """Повертає стан графа, видаляючи записи попередніх станів після його зміни."""
+        state = graph_state(self.graph)
+        if state != self._state:
+            self.cache.discard_if(lambda key: key[0] != state)
+            self.trees.discard_if(lambda key: key[0] != state)
+            self._state = state
+            self.invalidations += 1
+        return state
@@ -30,3 +30,39 @@ def find_adjusted_positions(
     adjusted_end_pos = np.array(end_pos) - direction_norm * end_size
 
     return adjusted_start_pos, adjusted_end_pos
+
+
+def find_adjusted_positions_batch(
+    start_positions: np.ndarray,
+    end_positions: np.ndarray,
+    start_sizes: np.ndarray,
+    end_sizes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Векторний варіант `find_adjusted_positions` для багатьох відрізків одночасно.
+
+    Для відрізків нульової довжини напрямок вважається нульовим, тож точки
+    залишаються на місці замість NaN від ділення на нуль.
+
+    Аргументи:
+        start_positions (np.ndarray): Координати початкових точок, масив (N, 2).
+        end_positions (np.ndarray): Координати кінцевих точок, масив (N, 2).
+        start_sizes (np.ndarray): Відстані від початкових точок, вектор довжини N або число.
+        end_sizes (np.ndarray): Відстані від кінцевих точок, вектор довжини N або число.
+
+    Повертає:
+        Tuple[np.ndarray, np.ndarray]: Масиви (N, 2) adjusted_start_positions та adjusted_end_positions.
+    """
+    start_positions = np.asarray(start_positions, dtype=np.float64).reshape(-1, 2)
+    end_positions = np.asarray(end_positions, dtype=np.float64).reshape(-1, 2)
+    start_sizes = np.asarray(start_sizes, dtype=np.float64).reshape(-1, 1)
+    end_sizes = np.asarray(end_sizes, dtype=np.float64).reshape(-1, 1)
+
+    directions = end_positions - start_positions
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    directions_norm = np.divide(directions, norms, out=np.zeros_like(directions), where=norms > 0)
+
+    adjusted_start_positions = start_positions + directions_norm * start_sizes
+    adjusted_end_positions = end_positions - directions_norm * end_sizes
+
+    return adjusted_start_positions, adjusted_end_positions
@@ -5,20 +5,30 @@
 глибини (DFS) та ширини (BFS) та візуалізує знайдені шляхи.
 """
 
+import argparse
+
 from graph02.graph_creation import create_transport_network_graph
 from graph02.graph_search import dfs, bfs
-from graph02.graph_visualization import visualize_path_on_graph
+from graph02.degree_statistics import degree_statistics
 
 from edges import edges
 
-def main() -> None:
+def main(render: bool = True) -> None:
     """Основна функція програми.
 
     Створює граф транспортної мережі, виконує пошук шляхів між
     стартовою та цільовою станцією за допомогою DFS та BFS, а також
     візуалізує знайдені шляхи.
+
+    Аргументи:
+        render (bool): Чи візуалізувати шляхи. Без візуалізації matplotlib не імпортується.
     """
+    if render:
+        # Модуль візуалізації (і matplotlib) імпортується лише тоді, коли потрібні зображення
+        from graph02.graph_visualization import visualize_path_on_graph
+
     graph = create_transport_network_graph(edges)
+    degree_stats = degree_statistics(graph)
     start_station = '15'
     goal_station = '16'
 
@@ -26,13 +36,15 @@ def main() -> None:
     dfs_path = dfs(graph, start_station, goal_station)
     if dfs_path:
         print(f"DFS шлях з {start_station} до {goal_station}: {dfs_path}")
-        visualize_path_on_graph(
-            graph,
-            dfs_path,
-            output_dir='task_02/results',
-            filename='dfs_path',
-            title='DFS Шлях у Транспортній Мережі'
-        )
+        if render:
+            visualize_path_on_graph(
+                graph,
+                dfs_path,
+                output_dir='task_02/results',
+                filename='dfs_path',
+                title='DFS Шлях у Транспортній Мережі',
+                degree_stats=degree_stats
+            )
     else:
         print(f"DFS не знайшов шлях між {start_station} та {goal_station}.")
 
@@ -40,15 +52,19 @@ def main() -> None:
     bfs_path = bfs(graph, start_station, goal_station)
     if bfs_path:
         print(f"BFS шлях з {start_station} до {goal_station}: {bfs_path}")
-        visualize_path_on_graph(
-            graph,
-            bfs_path,
-            output_dir='task_02/results',
-            filename='bfs_path',
-            title='BFS Шлях у Транспортній Мережі'
-        )
+        if render:
+            visualize_path_on_graph(
+                graph,
+                bfs_path,
+                output_dir='task_02/results',
+                filename='bfs_path',
+                title='BFS Шлях у Транспортній Мережі',
+                degree_stats=degree_stats
+            )
     else:
         print(f"BFS не знайшов шлях між {start_station} та {goal_station}.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Пошук шляхів у транспортній мережі (DFS та BFS).")
+    parser.add_argument('--no-render', action='store_true', help="лише пошук, без збереження зображень")
+    main(render=not parser.parse_args().no_render)
@@ -0,0 +1,164 @@
+"""
+Модуль для пакетного малювання багатьох зображень маршрутів на спільному макеті мережі.
+
+`visualize_path_on_weighted_graph` для кожного зображення заново створює рисунок
+і малює всю мережу. Тут статичний шар (вузли, ребра, підписи ваг і заголовок)
+малюється один раз для кожного типу ваги, його растр зберігається як фон,
+а для кожного маршруту фон відновлюється і поверх нього малюються лише стрілки
+шляху (blitting на бекенді Agg). Завдання розподіляються між процесами; кожен
+процес будує власні фони один раз, а макет вузлів обчислюється лише в головному.
+
+Використання:
+    jobs = [(paths['16'], 'distance', 'route_15_16'), (paths['17'], 'time', 'route_15_17')]
+    render_route_images(graph, jobs, output_dir='task_03/results')
+"""
+
+import math
+import os
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import matplotlib.image
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import networkx as nx
+import numpy as np
+from graph03.fast_rendering import use_bulk_rendering
+from graph03.graph_visualization import draw_edge_labels_layer, draw_network_layer, draw_route_layer, node_sizes_for
+from graph03.layout_cache import get_layout
+
+# Мінімальна кількість зображень, з якої вмикається пул процесів за замовчуванням
+PARALLEL_THRESHOLD = 32
+
+# Завдання: (вузли шляху, тип ваги, ім'я файлу без розширення)
+RouteJob = Tuple[Sequence[Any], str, str]
+
+_worker_state: Dict[str, Any] = {}
+_worker_backgrounds: Dict[str, Tuple[Figure, Any, Any, Dict]] = {}
+
+
+def render_route_images(
+    graph: nx.Graph,
+    jobs: Sequence[RouteJob],
+    output_dir: str = 'results',
+    degree_stats: Optional[Dict] = None,
+    processes: Optional[int] = None,
+    bulk: Optional[bool] = None,
+    centrality_stats: Optional[Dict] = None
+) -> List[str]:
+    """
+    Малює зображення маршрутів, повторно використовуючи статичний шар мережі.
+
+    Аргументи:
+        graph (nx.Graph): Граф транспортної мережі.
+        jobs (Sequence[RouteJob]): Завдання (вузли шляху, тип ваги, ім'я файлу).
+        output_dir (str): Директорія для збереження зображень.
+        degree_stats (Dict, optional): Готовий результат `degree_statistics` для цього графа.
+        processes (int, optional): Кількість процесів. None — автоматично
+            (усі ядра від PARALLEL_THRESHOLD завдань, інакше 1).
+        bulk (bool, optional): Пакетне малювання мережі; None — автоматично за кількістю вузлів.
+        centrality_stats (Dict, optional): Результат `centrality` для цього графа. Якщо задано,
+            розмір вузлів залежить від посередницької центральності, а не від ступеня.
+
+    Повертає:
+        List[str]: Шляхи до збережених файлів у порядку завдань.
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    state = {
+        'graph': graph,
+        'pos': get_layout(graph, seed=42),
+        'node_sizes': node_sizes_for(graph, degree_stats, centrality_stats),
+        'bulk': use_bulk_rendering(graph, bulk),
+        'output_dir': output_dir,
+    }
+    if processes is None:
+        processes = (os.cpu_count() or 1) if len(jobs) >= PARALLEL_THRESHOLD else 1
+
+    if processes <= 1 or len(jobs) <= 1:
+        _init_worker(state)
+        try:
+            return [_render_job(job) for job in jobs]
+        finally:
+            _init_worker({})
+
+    # Завдання з однаковим типом ваги йдуть поряд, щоб процеси рідше будували нові фони
+    order = sorted(range(len(jobs)), key=lambda i: jobs[i][1])
+    chunksize = max(1, math.ceil(len(jobs) / (processes * 4)))
+    with Pool(processes, initializer=_init_worker, initargs=(state,)) as pool:
+        rendered = pool.map(_render_job, [jobs[i] for i in order], chunksize=chunksize)
+
+    filepaths = [''] * len(jobs)
+    for i, filepath in zip(order, rendered):
+        filepaths[i] = filepath
+    return filepaths
+
+
+def _init_worker(state: Dict[str, Any]) -> None:
+    """Зберігає спільні дані малювання в процесі та скидає кеш фонів."""
+    _worker_state.clear()
+    _worker_state.update(state)
+    _worker_backgrounds.clear()
+
+
+def _render_job(job: RouteJob) -> str:
+    """
+    Малює один маршрут поверх кешованого фону та зберігає PNG.
+
+    Аргументи:
+        job (RouteJob): Вузли шляху, тип ваги та ім'я файлу.
+
+    Повертає:
+        str: Шлях до збереженого файлу.
+    """
+    path_nodes, weight_type, filename = job
+    figure, ax, background, label_artists = _background(weight_type)
+    canvas = figure.canvas
+
+    canvas.restore_region(background)
+    artists = draw_route_layer(
+        _worker_state['graph'], _worker_state['pos'], path_nodes, ax, _worker_state['bulk']
+    )
+    for artist in artists:
+        ax.draw_artist(artist)
+    # Підписи ваг ребер маршруту перемальовуються поверх стрілок
+    for u, v in zip(path_nodes, path_nodes[1:]):
+        text = label_artists.get((u, v), label_artists.get((v, u)))
+        if text is not None:
+            ax.draw_artist(text)
+
+    filepath = os.path.join(_worker_state['output_dir'], f"{filename}.png")
+    matplotlib.image.imsave(filepath, np.asarray(canvas.buffer_rgba()), format='png')
+
+    for artist in artists:
+        artist.remove()
+    return filepath
+
+
+def _background(weight_type: str) -> Tuple[Figure, Any, Any, Dict]:
+    """
+    Повертає рисунок зі статичним шаром для типу ваги, малюючи його при першому зверненні.
+
+    Аргументи:
+        weight_type (str): Тип ваги ('distance', 'time' або 'third_weight').
+
+    Повертає:
+        Tuple[Figure, Axes, Any, Dict]: Рисунок, його осі, збережений растр фону
+        та підписи ребер (ребро -> об'єкт тексту).
+    """
+    if weight_type not in _worker_backgrounds:
+        # Рисунок без pyplot: не залежить від активного бекенда і не реєструється в менеджері вікон
+        figure = Figure(figsize=(12, 10))
+        FigureCanvasAgg(figure)
+        ax = figure.add_axes((0, 0, 1, 1))
+
+        graph, pos = _worker_state['graph'], _worker_state['pos']
+        draw_network_layer(graph, pos, _worker_state['node_sizes'], ax, _worker_state['bulk'])
+        label_artists = draw_edge_labels_layer(graph, pos, weight_type, ax, _worker_state['bulk'])
+        # Межі осей фіксуються, щоб стрілки маршрутів не змінювали масштаб фону
+        ax.set_autoscale_on(False)
+
+        figure.canvas.draw()
+        background = figure.canvas.copy_from_bbox(figure.bbox)
+        _worker_backgrounds[weight_type] = (figure, ax, background, label_artists)
+    return _worker_backgrounds[weight_type]
@@ -0,0 +1,224 @@
+"""
+Модуль для пакетного обчислення найкоротших шляхів з багатьох джерел за кількома метриками.
+
+Замість окремого виклику `dijkstra` для кожної пари (джерело, метрика) функція
+`batch_dijkstra` повертає щільні матриці відстаней NumPy та матриці попередників
+(індекси вершин замість списків шляхів). Обчислення розподіляються між процесами,
+які отримують граф і записують результати через спільну пам'ять
+(`multiprocessing.shared_memory`), тож жоден процес не серіалізує власну копію графа.
+
+Використання:
+    - batch_dijkstra(graph, sources, metrics) -> dict: матриці відстаней і попередників.
+    - predecessor_path(graph, predecessors, source, target) -> list: відновлення шляху з рядка попередників.
+"""
+
+import heapq
+import os
+from multiprocessing import Pool, shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from graph03.compact_graph import CompactGraph
+
+# Мінімальна кількість джерел, з якої вмикається пул процесів за замовчуванням
+PARALLEL_THRESHOLD = 64
+
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+def batch_dijkstra(
+    graph: Any,
+    sources: Iterable[str],
+    metrics: Sequence[str] = ('distance',),
+    processes: Optional[int] = None
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Обчислює найкоротші відстані від багатьох джерел за кількома метриками.
+
+    Рядок i матриць відповідає i-му джерелу, стовпець j — вершині з індексом j
+    у `CompactGraph` (для `nx.Graph` — порядку `graph.nodes()`).
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        sources (Iterable[str]): Вершини-джерела.
+        metrics (Sequence[str]): Назви ваг ребер ('distance', 'time', 'third_weight').
+        processes (int, optional): Кількість процесів. None — автоматично
+            (усі ядра від PARALLEL_THRESHOLD джерел, інакше 1).
+
+    Повертає:
+        Dict[str, Tuple[np.ndarray, np.ndarray]]: Для кожної метрики пара
+        (відстані float64 розміру S×V з inf для недосяжних,
+        попередники int32 розміру S×V з -1 для джерела та недосяжних).
+
+    Raises:
+        ValueError: Якщо граф не містить ваги з назвою метрики.
+    """
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+    for metric in metrics:
+        if metric not in compact.weights:
+            raise ValueError(f"graph has no '{metric}' edge weight")
+
+    source_indices = np.array([compact.index_of(source) for source in sources], dtype=np.int64)
+    shape = (len(source_indices), compact.number_of_nodes())
+    if processes is None:
+        processes = (os.cpu_count() or 1) if len(source_indices) >= PARALLEL_THRESHOLD else 1
+
+    arrays = {'indptr': compact.indptr, 'indices': compact.indices}
+    for metric in metrics:
+        # Ваги розгортаються до довжини indices, щоб сусіди й ваги читались одним зрізом
+        arrays[f"weights:{metric}"] = compact.weights[metric][compact.edge_ids].astype(np.float64)
+        arrays[f"distances:{metric}"] = np.empty(shape, dtype=np.float64)
+        arrays[f"predecessors:{metric}"] = np.empty(shape, dtype=np.int32)
+
+    tasks = [
+        (metric, int(row), int(row_end), source_indices[row:row_end])
+        for metric in metrics
+        for row, row_end in _row_ranges(len(source_indices), processes)
+    ]
+
+    if processes <= 1:
+        for task in tasks:
+            _run_task(arrays, task)
+        return {
+            metric: (arrays[f"distances:{metric}"], arrays[f"predecessors:{metric}"])
+            for metric in metrics
+        }
+
+    blocks = {name: _to_shared(array) for name, array in arrays.items()}
+    try:
+        layout = {name: (block.name, arrays[name].shape, arrays[name].dtype.str) for name, block in blocks.items()}
+        with Pool(processes, initializer=_init_worker, initargs=(layout,)) as pool:
+            pool.map(_worker_task, tasks)
+
+        return {
+            metric: tuple(
+                np.ndarray(shape, dtype=arrays[name].dtype, buffer=blocks[name].buf).copy()
+                for name in (f"distances:{metric}", f"predecessors:{metric}")
+            )
+            for metric in metrics
+        }
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def predecessor_path(
+    graph: CompactGraph,
+    predecessors: np.ndarray,
+    source: str,
+    target: str
+) -> Optional[List[str]]:
+    """
+    Відновлює шлях до вершини з рядка матриці попередників.
+
+    Аргументи:
+        graph (CompactGraph): Граф, для якого обчислено матрицю.
+        predecessors (np.ndarray): Рядок матриці попередників для джерела source.
+        source (str): Початкова вершина рядка.
+        target (str): Кінцева вершина.
+
+    Повертає:
+        List[str]: Шлях від source до target або None, якщо target недосяжна.
+    """
+    node = graph.index_of(target)
+    path = [node]
+    while predecessors[node] >= 0:
+        node = int(predecessors[node])
+        path.append(node)
+    if node != graph.index_of(source):
+        return None
+    return [graph.node_ids[index] for index in reversed(path)]
+
+
+def dijkstra_into(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    weights: Sequence[float],
+    source: int,
+    distances: np.ndarray,
+    predecessors: np.ndarray
+) -> None:
+    """
+    Алгоритм Дейкстри з одного джерела над масивами CSR із записом у готові масиви.
+
+    Релаксація ведеться над списками Python (як у `graph_search._compact_dijkstra`):
+    поелементні звернення до NumPy на кожну встановлену вершину повільніші за сам пошук.
+    NumPy використовується лише для запису готових рядків результату.
+
+    Аргументи:
+        indptr (Sequence[int]): Зміщення списків сусідів (список або np.ndarray).
+        indices (Sequence[int]): Індекси сусідів.
+        weights (Sequence[float]): Ваги, вирівняні з indices.
+        source (int): Індекс джерела.
+        distances (np.ndarray): Вихідний рядок відстаней (заповнюється).
+        predecessors (np.ndarray): Вихідний рядок попередників (заповнюється).
+    """
+    if isinstance(indptr, np.ndarray):
+        indptr, indices, weights = indptr.tolist(), indices.tolist(), weights.tolist()
+
+    num_nodes = len(distances)
+    best = [np.inf] * num_nodes
+    parents = [-1] * num_nodes
+    settled = [False] * num_nodes
+    best[source] = 0.0
+    heap = [(0.0, source)]
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if settled[node]:
+            continue
+        settled[node] = True
+        for position in range(indptr[node], indptr[node + 1]):
+            adjacent = indices[position]
+            candidate = distance + weights[position]
+            if candidate < best[adjacent]:
+                best[adjacent] = candidate
+                parents[adjacent] = node
+                heapq.heappush(heap, (candidate, adjacent))
+
+    distances[:] = best
+    predecessors[:] = parents
+
+
+def _row_ranges(num_rows: int, processes: int) -> List[Tuple[int, int]]:
+    """Ділить рядки на частини для процесів (по кілька частин на процес для балансування)."""
+    parts = max(1, min(num_rows, processes * 4))
+    bounds = np.linspace(0, num_rows, parts + 1).astype(int)
+    return [(bounds[i], bounds[i + 1]) for i in range(parts) if bounds[i] < bounds[i + 1]]
+
+
+def _run_task(arrays: Dict[str, np.ndarray], task: tuple) -> None:
+    """Обчислює рядки матриць для частини джерел однієї метрики."""
+    metric, row, _, source_indices = task
+    distances = arrays[f"distances:{metric}"]
+    predecessors = arrays[f"predecessors:{metric}"]
+    # Списки будуються один раз на завдання, а не для кожного джерела
+    indptr = arrays['indptr'].tolist()
+    indices = arrays['indices'].tolist()
+    weights = arrays[f"weights:{metric}"].tolist()
+    for offset, source in enumerate(source_indices.tolist()):
+        dijkstra_into(
+            indptr, indices, weights, source,
+            distances[row + offset], predecessors[row + offset]
+        )
+
+
+def _to_shared(array: np.ndarray) -> shared_memory.SharedMemory:
+    """Копіює масив у новий блок спільної пам'яті."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block
+
+
+def _init_worker(layout: Dict[str, Tuple[str, tuple, str]]) -> None:
+    """Підключає процес пулу до блоків спільної пам'яті (без копіювання графа)."""
+    for name, (block_name, shape, dtype) in layout.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_blocks.append(block)
+        _worker_arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _worker_task(task: tuple) -> None:
+    """Виконує завдання в процесі пулу, записуючи результати у спільну пам'ять."""
+    _run_task(_worker_arrays, task)
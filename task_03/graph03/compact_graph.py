@@ -0,0 +1,360 @@
+"""
+Модуль з компактним представленням графа транспортної мережі у форматі CSR.
+
+CSR (Compressed Sparse Row) зберігає суміжність у двох масивах:
+`indptr` (зміщення списку сусідів кожної вершини) та `indices` (індекси сусідів).
+Рядкові ідентифікатори станцій відображаються в цілі індекси, а ваги ребер
+(`distance`, `time`, `third_weight` тощо) зберігаються як колонки float32
+окремо для кожного неорієнтованого ребра.
+
+Клас `CompactGraph` підтримує ту частину інтерфейсу `networkx.Graph`, яку
+використовують функції пошуку та аналізу (`graph[node]`, `node in graph`,
+`nodes()`, `degree()`, `number_of_edges()` тощо), тому вони працюють з ним напряму.
+"""
+
+from array import array
+from numbers import Real
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+
+WEIGHT_COLUMNS = ('distance', 'time', 'third_weight')
+
+
+class CompactGraph:
+    """
+    Неорієнтований граф у форматі CSR з колонками ваг float32.
+
+    Атрибути:
+        node_ids (List[str]): Ідентифікатори станцій у порядку їх індексів.
+        indptr (np.ndarray): Зміщення списків сусідів, довжина V + 1.
+        indices (np.ndarray): Індекси сусідів, довжина 2E.
+        edge_ids (np.ndarray): Номер неорієнтованого ребра для кожного елемента `indices`.
+        edge_sources (np.ndarray): Перша вершина кожного ребра, довжина E.
+        edge_targets (np.ndarray): Друга вершина кожного ребра, довжина E.
+        weights (Dict[str, np.ndarray]): Колонки ваг довжиною E.
+        version (int): Лічильник змін ребер і ваг (ключ для кешів запитів).
+    """
+
+    def __init__(
+        self,
+        node_ids: List[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        edge_ids: np.ndarray,
+        edge_sources: np.ndarray,
+        edge_targets: np.ndarray,
+        weights: Optional[Dict[str, np.ndarray]] = None
+    ) -> None:
+        self.node_ids = list(node_ids)
+        self.node_index = {node: i for i, node in enumerate(self.node_ids)}
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_ids = edge_ids
+        self.edge_sources = edge_sources
+        self.edge_targets = edge_targets
+        self.weights = dict(weights) if weights else {}
+        self.version = 0
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple]) -> 'CompactGraph':
+        """
+        Будує граф з тих самих кортежів, що й `create_transport_network_graph`.
+
+        Приймаються як пари `(u, v)`, так і трійки `(u, v, {'distance': ..., 'time': ...})`.
+        Повторні ребра об'єднуються (як у `nx.Graph`): зберігається позиція першого
+        входження та ваги останнього. Нечислові атрибути (наприклад, назва лінії) пропускаються.
+
+        Аргументи:
+            edges (Iterable[tuple]): Ребра графа.
+
+        Повертає:
+            CompactGraph: Побудований граф.
+        """
+        node_index: Dict[str, int] = {}
+        node_ids: List[str] = []
+        sources = array('i')
+        targets = array('i')
+        columns: Dict[str, array] = {}
+
+        for edge in edges:
+            endpoints = []
+            for node in edge[:2]:
+                index = node_index.get(node)
+                if index is None:
+                    index = len(node_ids)
+                    node_index[node] = index
+                    node_ids.append(node)
+                endpoints.append(index)
+            sources.append(endpoints[0])
+            targets.append(endpoints[1])
+
+            attributes = edge[2] if len(edge) > 2 else {}
+            attributes = {name: value for name, value in attributes.items() if _is_number(value)}
+            for name in attributes:
+                if name not in columns:
+                    columns[name] = array('f', [np.nan]) * (len(sources) - 1)
+            for name, column in columns.items():
+                column.append(attributes.get(name, np.nan))
+
+        return cls.from_arrays(
+            node_ids,
+            np.frombuffer(sources, dtype=np.int32),
+            np.frombuffer(targets, dtype=np.int32),
+            {name: np.frombuffer(column, dtype=np.float32) for name, column in columns.items()}
+        )
+
+    @classmethod
+    def from_networkx(cls, graph) -> 'CompactGraph':
+        """
+        Перетворює `networkx.Graph` у компактний граф зі збереженням порядку вершин.
+
+        Числові атрибути ребер стають колонками ваг (відсутні та нечислові значення — NaN);
+        атрибути без жодного числового значення (наприклад, назва лінії) пропускаються.
+
+        Аргументи:
+            graph (nx.Graph): Граф NetworkX.
+
+        Повертає:
+            CompactGraph: Побудований граф.
+        """
+        node_ids = list(graph.nodes())
+        node_index = {node: i for i, node in enumerate(node_ids)}
+        edge_data = list(graph.edges(data=True))
+        count = len(edge_data)
+        names = sorted({name for _, _, data in edge_data for name, value in data.items() if _is_number(value)})
+
+        return cls.from_arrays(
+            node_ids,
+            np.fromiter((node_index[u] for u, _, _ in edge_data), dtype=np.int64, count=count),
+            np.fromiter((node_index[v] for _, v, _ in edge_data), dtype=np.int64, count=count),
+            {
+                name: np.fromiter(
+                    (data[name] if _is_number(data.get(name)) else np.nan for _, _, data in edge_data),
+                    dtype=np.float32, count=count
+                )
+                for name in names
+            }
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        node_ids: List[str],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: Optional[Dict[str, np.ndarray]] = None
+    ) -> 'CompactGraph':
+        """
+        Будує граф з масивів кінців ребер (індексів у `node_ids`) і колонок ваг.
+
+        Аргументи:
+            node_ids (List[str]): Ідентифікатори станцій.
+            sources (np.ndarray): Індекси перших вершин ребер.
+            targets (np.ndarray): Індекси других вершин ребер.
+            weights (Dict[str, np.ndarray], optional): Колонки ваг тієї ж довжини.
+
+        Повертає:
+            CompactGraph: Побудований граф.
+
+        Raises:
+            ValueError: Якщо довжини sources, targets і колонок ваг не збігаються.
+        """
+        num_nodes = len(node_ids)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = {name: np.asarray(column, dtype=np.float32) for name, column in (weights or {}).items()}
+        if len(targets) != len(sources):
+            raise ValueError(f"sources and targets differ in length: {len(sources)} != {len(targets)}")
+        for name, column in weights.items():
+            if len(column) != len(sources):
+                raise ValueError(f"weight column '{name}' has {len(column)} values for {len(sources)} edges")
+
+        # Об'єднання повторних ребер: ключ пари не залежить від напрямку
+        low = np.minimum(sources, targets)
+        high = np.maximum(sources, targets)
+        keys = low * num_nodes + high
+        _, first = np.unique(keys, return_index=True)
+        if len(first) < len(keys):
+            _, last_reversed = np.unique(keys[::-1], return_index=True)
+            last = len(keys) - 1 - last_reversed
+            order = np.argsort(first, kind='stable')
+            first, last = first[order], last[order]
+            sources, targets = sources[first], targets[first]
+            weights = {name: column[last] for name, column in weights.items()}
+
+        num_edges = len(sources)
+        loops = sources == targets
+        edge_numbers = np.arange(num_edges, dtype=np.int64)
+        heads = np.concatenate([sources, targets[~loops]])
+        tails = np.concatenate([targets, sources[~loops]])
+        edge_ids = np.concatenate([edge_numbers, edge_numbers[~loops]])
+
+        # Сусіди кожної вершини впорядковані за часом додавання ребра, як у nx.Graph
+        order = np.lexsort((edge_ids, heads))
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=num_nodes), out=indptr[1:])
+
+        return cls(
+            node_ids,
+            indptr,
+            tails[order].astype(np.int32),
+            edge_ids[order].astype(np.int32),
+            sources.astype(np.int32),
+            targets.astype(np.int32),
+            weights
+        )
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.node_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.node_ids)
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __getitem__(self, node: str) -> List[str]:
+        return self.neighbors(node)
+
+    def nodes(self) -> List[str]:
+        """Повертає список ідентифікаторів станцій."""
+        return self.node_ids
+
+    def number_of_nodes(self) -> int:
+        """Повертає кількість вершин."""
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        """Повертає кількість неорієнтованих ребер."""
+        return len(self.edge_sources)
+
+    def index_of(self, node: str) -> int:
+        """Повертає цілий індекс станції (KeyError, якщо її немає)."""
+        return self.node_index[node]
+
+    def neighbor_indices(self, index: int) -> np.ndarray:
+        """Повертає індекси сусідів вершини з індексом `index`."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def neighbor_weights(self, index: int, weight: str) -> np.ndarray:
+        """Повертає ваги ребер до сусідів вершини `index` у тому ж порядку, що й `neighbor_indices`."""
+        return self.weights[weight][self.edge_ids[self.indptr[index]:self.indptr[index + 1]]]
+
+    def neighbors(self, node: str) -> List[str]:
+        """Повертає список сусідніх станцій."""
+        node_ids = self.node_ids
+        return [node_ids[i] for i in self.neighbor_indices(self.node_index[node]).tolist()]
+
+    def degree(self, node: Optional[str] = None):
+        """
+        Повертає ступінь станції або масив ступенів усіх вершин, якщо `node` не задано.
+
+        Петля зберігається в списку сусідів один раз, але, як у NetworkX, додає до ступеня 2.
+        """
+        if node is None:
+            degrees = np.diff(self.indptr)
+            loops = self.edge_sources[self.edge_sources == self.edge_targets]
+            if loops.size:
+                degrees = degrees + np.bincount(loops, minlength=len(degrees))
+            return degrees
+        index = self.node_index[node]
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return int(end - start + np.count_nonzero(self.indices[start:end] == index))
+
+    def has_edge(self, u: str, v: str) -> bool:
+        """Перевіряє наявність ребра між двома станціями."""
+        if u not in self.node_index or v not in self.node_index:
+            return False
+        return bool(np.any(self.neighbor_indices(self.node_index[u]) == self.node_index[v]))
+
+    def edges(self, data: bool = False) -> Iterator[tuple]:
+        """
+        Ітерує ребра графа у вигляді `(u, v)` або `(u, v, {вага: значення})`.
+
+        Аргументи:
+            data (bool): Чи додавати словник ваг до кожного ребра.
+        """
+        node_ids = self.node_ids
+        columns = {name: column.tolist() for name, column in self.weights.items()} if data else {}
+        for edge, (u, v) in enumerate(zip(self.edge_sources.tolist(), self.edge_targets.tolist())):
+            if data:
+                yield node_ids[u], node_ids[v], {name: column[edge] for name, column in columns.items()}
+            else:
+                yield node_ids[u], node_ids[v]
+
+    def to_networkx(self):
+        """Перетворює граф у `networkx.Graph` (наприклад, для візуалізації)."""
+        import networkx as nx
+
+        graph = nx.Graph()
+        graph.add_nodes_from(self.node_ids)
+        graph.add_edges_from(self.edges(data=bool(self.weights)))
+        return graph
+
+
+def _is_number(value) -> bool:
+    """Перевіряє, чи можна зберегти значення атрибута ребра в колонці ваг."""
+    return isinstance(value, (Real, np.number))
+
+
+def bfs_levels(graph: CompactGraph, source: int) -> np.ndarray:
+    """
+    Обчислює відстані (у кількості ребер) від вершини до всіх інших.
+
+    Кожен рівень BFS розширюється одним векторизованим кроком NumPy.
+
+    Аргументи:
+        graph (CompactGraph): Граф.
+        source (int): Індекс початкової вершини.
+
+    Повертає:
+        np.ndarray: Масив відстаней int32, -1 для недосяжних вершин.
+    """
+    distances = np.full(graph.number_of_nodes(), -1, dtype=np.int32)
+    distances[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        level += 1
+        neighbors = _frontier_neighbors(graph, frontier)
+        neighbors = np.unique(neighbors[distances[neighbors] < 0])
+        distances[neighbors] = level
+        frontier = neighbors
+    return distances
+
+
+def connected_component_labels(graph: CompactGraph) -> Tuple[int, np.ndarray]:
+    """
+    Знаходить зв'язні компоненти графа.
+
+    Аргументи:
+        graph (CompactGraph): Граф.
+
+    Повертає:
+        Tuple[int, np.ndarray]: Кількість компонент і номер компоненти для кожної вершини.
+    """
+    labels = np.full(graph.number_of_nodes(), -1, dtype=np.int32)
+    count = 0
+    for source in range(graph.number_of_nodes()):
+        if labels[source] >= 0:
+            continue
+        labels[source] = count
+        frontier = np.array([source], dtype=np.int64)
+        while frontier.size:
+            neighbors = _frontier_neighbors(graph, frontier)
+            neighbors = np.unique(neighbors[labels[neighbors] < 0])
+            labels[neighbors] = count
+            frontier = neighbors
+        count += 1
+    return count, labels
+
+
+def _frontier_neighbors(graph: CompactGraph, frontier: np.ndarray) -> np.ndarray:
+    """Повертає конкатенацію списків сусідів усіх вершин фронту (з повтореннями)."""
+    starts = graph.indptr[frontier]
+    counts = graph.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return graph.indices[offsets + np.arange(total)]
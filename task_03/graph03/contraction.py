@@ -0,0 +1,369 @@
+"""
+Модуль з індексом ієрархій стиснення (contraction hierarchies) для запитів найкоротшого
+шляху між двома станціями.
+
+Під час попередньої обробки вершини по черзі «стискаються» в порядку важливості
+(різниця ребер: кількість потрібних ярликів мінус ступінь, плюс кількість уже стиснутих
+сусідів). Для кожної пари сусідів стиснутої вершини додається ярлик (shortcut), якщо
+обмежений пошук свідка (witness search) не знаходить іншого шляху, не довшого за шлях
+через неї. Для кожної ваги (`distance`, `time`, `third_weight`) будується окрема ієрархія:
+висхідний граф CSR, у якому кожне ребро веде до вершини вищого рангу.
+
+Запит — двонаправлений пошук Дейкстри лише висхідними ребрами від обох станцій,
+тож він встановлює невелику частку вершин. Ярлики розгортаються через збережену
+середню вершину, і шлях повертається у звичному форматі списку станцій.
+
+Використання:
+    - ContractionIndex.build(graph): побудова ієрархій (по процесу на метрику за потреби).
+    - index.query(start, goal, metric_type='distance') -> (відстань, шлях).
+    - index.save(path) / ContractionIndex.load(path): збереження та завантаження без графа.
+"""
+
+import heapq
+import os
+from multiprocessing import Pool
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from graph03.compact_graph import CompactGraph
+
+# Максимальна кількість вершин, що встановлює один пошук свідка
+WITNESS_SETTLE_LIMIT = 64
+
+_HIERARCHY_ARRAYS = ('rank', 'indptr', 'indices', 'weights', 'middles')
+
+
+class Hierarchy(NamedTuple):
+    """
+    Ієрархія стиснення для однієї ваги.
+
+    Атрибути:
+        rank (np.ndarray): Порядок стиснення кожної вершини.
+        indptr (np.ndarray): Зміщення висхідних ребер кожної вершини, довжина V + 1.
+        indices (np.ndarray): Вершина вищого рангу для кожного висхідного ребра.
+        weights (np.ndarray): Довжина висхідного ребра (float64).
+        middles (np.ndarray): Середня вершина ярлика або -1 для ребра вихідного графа.
+    """
+    rank: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    middles: np.ndarray
+
+
+class ContractionIndex:
+    """
+    Індекс ієрархій стиснення для запитів найкоротшого шляху між двома вершинами.
+
+    Атрибути:
+        node_ids (List[str]): Ідентифікатори станцій у порядку індексів `CompactGraph`.
+        hierarchies (Dict[str, Hierarchy]): Ієрархія для кожної ваги.
+        settled (int): Кількість вершин, встановлених останнім запитом (в обох напрямках).
+    """
+
+    def __init__(self, node_ids: List[str], hierarchies: Dict[str, Hierarchy]) -> None:
+        self.node_ids = list(node_ids)
+        self.node_index = {node: i for i, node in enumerate(self.node_ids)}
+        self.hierarchies = hierarchies
+        self.settled = 0
+        # Списки Python для запитів: доступ до елементів швидший, ніж до масивів NumPy
+        self._lists = {
+            metric: tuple(array.tolist() for array in hierarchy)
+            for metric, hierarchy in hierarchies.items()
+        }
+
+    @classmethod
+    def build(
+        cls,
+        graph: Any,
+        metrics: Sequence[str] = ('distance', 'time', 'third_weight'),
+        processes: Optional[int] = None
+    ) -> 'ContractionIndex':
+        """
+        Будує ієрархії стиснення для кожної ваги.
+
+        Аргументи:
+            graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+            metrics (Sequence[str]): Ваги, для яких будуються ієрархії.
+            processes (int, optional): Кількість процесів (кожна ієрархія будується в окремому).
+                None — по процесу на метрику, але не більше за кількість ядер.
+
+        Повертає:
+            ContractionIndex: Побудований індекс.
+        """
+        compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+        metrics = [metric for metric in metrics if metric in compact.weights]
+        if processes is None:
+            processes = min(len(metrics), os.cpu_count() or 1)
+
+        tasks = [(compact, metric) for metric in metrics]
+        if processes <= 1:
+            built = [_build_hierarchy(*task) for task in tasks]
+        else:
+            with Pool(processes) as pool:
+                built = pool.starmap(_build_hierarchy, tasks)
+        return cls(compact.node_ids, dict(zip(metrics, built)))
+
+    def query(self, start: str, goal: str, metric_type: str = 'distance') -> Tuple[float, Optional[List[str]]]:
+        """
+        Знаходить найкоротший шлях між двома станціями двонаправленим висхідним пошуком.
+
+        Аргументи:
+            start (str): Початкова станція.
+            goal (str): Кінцева станція.
+            metric_type (str): Назва ваги ('distance', 'time' або 'third_weight').
+
+        Повертає:
+            Tuple[float, Optional[List[str]]]: Довжина шляху та список станцій
+            (inf і None, якщо шлях не існує).
+
+        Raises:
+            ValueError: Якщо для metric_type не побудовано ієрархії.
+        """
+        if metric_type not in self._lists:
+            raise ValueError(f"index has no hierarchy for '{metric_type}'")
+        rank, indptr, indices, weights, middles = self._lists[metric_type]
+        source = self.node_index[start]
+        target = self.node_index[goal]
+
+        distances = ({source: 0.0}, {target: 0.0})
+        parents = ({source: None}, {target: None})
+        closed = (set(), set())
+        heaps = ([(0.0, source)], [(0.0, target)])
+        best, meeting = (0.0, source) if source == target else (np.inf, None)
+
+        while heaps[0] or heaps[1]:
+            # Розширюється напрямок з меншою поточною відстанню
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            distance, node = heapq.heappop(heaps[side])
+            if distance >= best:
+                # Усі вершини цього напрямку вже не покращать знайдений шлях
+                heaps[side].clear()
+                continue
+            if node in closed[side]:
+                continue
+            closed[side].add(node)
+
+            own, other = distances[side], distances[1 - side]
+            for position in range(indptr[node], indptr[node + 1]):
+                adjacent = indices[position]
+                candidate = distance + weights[position]
+                if candidate >= own.get(adjacent, np.inf):
+                    continue
+                own[adjacent] = candidate
+                parents[side][adjacent] = node
+                heapq.heappush(heaps[side], (candidate, adjacent))
+                if adjacent in other and candidate + other[adjacent] < best:
+                    best, meeting = candidate + other[adjacent], adjacent
+
+        self.settled = len(closed[0]) + len(closed[1])
+        if meeting is None:
+            return np.inf, None
+
+        upward = _parent_chain(parents[0], meeting)[::-1] + _parent_chain(parents[1], meeting)[1:]
+        path = [upward[0]]
+        for u, v in zip(upward, upward[1:]):
+            path.extend(_unpack(rank, indptr, indices, middles, u, v))
+        return float(best), [self.node_ids[node] for node in path]
+
+    def save(self, path: str) -> None:
+        """
+        Зберігає індекс у файл `.npz`.
+
+        Розширення `.npz` до шляху не додається, тож `load` приймає той самий шлях.
+
+        Аргументи:
+            path (str): Шлях до файлу.
+        """
+        with open(path, 'wb') as file:
+            np.savez(
+                file,
+                node_ids=np.array(self.node_ids, dtype=str),
+                metrics=np.array(list(self.hierarchies), dtype=str),
+                **{
+                    f"{name}_{metric}": getattr(hierarchy, name)
+                    for metric, hierarchy in self.hierarchies.items()
+                    for name in _HIERARCHY_ARRAYS
+                }
+            )
+
+    @classmethod
+    def load(cls, path: str, graph: Any = None) -> 'ContractionIndex':
+        """
+        Завантажує індекс, збережений методом `save`.
+
+        Граф для запитів не потрібен; якщо його передано, перевіряється, що індекс
+        побудовано саме для нього.
+
+        Аргументи:
+            path (str): Шлях до файлу `.npz`.
+            graph (nx.Graph | CompactGraph, optional): Граф, для якого будувався індекс.
+
+        Повертає:
+            ContractionIndex: Завантажений індекс.
+
+        Raises:
+            ValueError: Якщо вершини графа не збігаються з вершинами індексу.
+        """
+        with np.load(path) as data:
+            node_ids = data['node_ids'].tolist()
+            if graph is not None:
+                compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+                if node_ids != [str(node) for node in compact.node_ids]:
+                    raise ValueError("contraction index was built for a different graph")
+            hierarchies = {
+                metric: Hierarchy(*(data[f"{name}_{metric}"] for name in _HIERARCHY_ARRAYS))
+                for metric in data['metrics'].tolist()
+            }
+        return cls(node_ids, hierarchies)
+
+
+def _build_hierarchy(graph: CompactGraph, metric_type: str) -> Hierarchy:
+    """Стискає всі вершини графа для однієї ваги та повертає висхідний граф."""
+    num_nodes = graph.number_of_nodes()
+    edge_weights = graph.weights[metric_type][graph.edge_ids].astype(np.float64).tolist()
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+
+    # Залишковий граф: сусід -> (вага, середня вершина ярлика або -1); паралельні ребра — найкоротше
+    adjacency: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(num_nodes)]
+    for node in range(num_nodes):
+        for position in range(indptr[node], indptr[node + 1]):
+            adjacent, weight = indices[position], edge_weights[position]
+            if adjacent != node and weight < adjacency[node].get(adjacent, (np.inf,))[0]:
+                adjacency[node][adjacent] = (weight, -1)
+
+    deleted = [0] * num_nodes
+    priorities = [0] * num_nodes
+    for node in range(num_nodes):
+        priorities[node] = _priority(adjacency, deleted, node)[0]
+    heap = [(priority, node) for node, priority in enumerate(priorities)]
+    heapq.heapify(heap)
+
+    rank = np.empty(num_nodes, dtype=np.int64)
+    upward: List[Tuple[int, int, float, int]] = []
+    order = 0
+    while heap:
+        priority, node = heapq.heappop(heap)
+        if priority != priorities[node]:
+            continue
+        # Ліниве оновлення: пріоритет міг зрости після стиснення сусідів
+        priority, shortcuts = _priority(adjacency, deleted, node)
+        if heap and priority > heap[0][0]:
+            priorities[node] = priority
+            heapq.heappush(heap, (priority, node))
+            continue
+
+        rank[node] = order
+        order += 1
+        priorities[node] = None
+        neighbors = adjacency[node]
+        for adjacent, (weight, middle) in neighbors.items():
+            upward.append((node, adjacent, weight, middle))
+            del adjacency[adjacent][node]
+            deleted[adjacent] += 1
+        for u, v, weight in shortcuts:
+            if weight < adjacency[u].get(v, (np.inf,))[0]:
+                adjacency[u][v] = (weight, node)
+                adjacency[v][u] = (weight, node)
+        adjacency[node] = {}
+
+        for adjacent in neighbors:
+            priorities[adjacent] = _priority(adjacency, deleted, adjacent)[0]
+            heapq.heappush(heap, (priorities[adjacent], adjacent))
+
+    upward.sort(key=lambda edge: edge[0])
+    sources = np.array([edge[0] for edge in upward], dtype=np.int64)
+    up_indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=up_indptr[1:])
+    return Hierarchy(
+        rank,
+        up_indptr,
+        np.array([edge[1] for edge in upward], dtype=np.int64),
+        np.array([edge[2] for edge in upward], dtype=np.float64),
+        np.array([edge[3] for edge in upward], dtype=np.int64),
+    )
+
+
+def _priority(
+    adjacency: List[Dict[int, Tuple[float, int]]],
+    deleted: List[int],
+    node: int
+) -> Tuple[int, List[Tuple[int, int, float]]]:
+    """Пріоритет стиснення вершини та ярлики, які воно додасть."""
+    neighbors = [(adjacent, weight) for adjacent, (weight, _) in adjacency[node].items()]
+    shortcuts = []
+    for i, (u, to_u) in enumerate(neighbors[:-1]):
+        targets = neighbors[i + 1:]
+        limit = to_u + max(weight for _, weight in targets)
+        witness = _witness_search(adjacency, u, node, limit, {v for v, _ in targets})
+        for v, to_v in targets:
+            if witness.get(v, np.inf) > to_u + to_v:
+                shortcuts.append((u, v, to_u + to_v))
+    return len(shortcuts) - len(neighbors) + deleted[node], shortcuts
+
+
+def _witness_search(
+    adjacency: List[Dict[int, Tuple[float, int]]],
+    source: int,
+    excluded: int,
+    limit: float,
+    targets: set
+) -> Dict[int, float]:
+    """Обмежений пошук Дейкстри в залишковому графі без вершини excluded."""
+    distances = {source: 0.0}
+    closed = set()
+    heap = [(0.0, source)]
+    remaining = len(targets)
+    while heap and len(closed) < WITNESS_SETTLE_LIMIT:
+        distance, node = heapq.heappop(heap)
+        if distance > limit:
+            break
+        if node in closed:
+            continue
+        closed.add(node)
+        if node in targets:
+            remaining -= 1
+            if remaining == 0:
+                break
+        for adjacent, (weight, _) in adjacency[node].items():
+            candidate = distance + weight
+            if adjacent != excluded and candidate < distances.get(adjacent, np.inf):
+                distances[adjacent] = candidate
+                heapq.heappush(heap, (candidate, adjacent))
+    return distances
+
+
+def _parent_chain(parents: Dict[int, Optional[int]], node: int) -> List[int]:
+    """Вершини від node до початку пошуку за батьківськими посиланнями."""
+    chain = []
+    while node is not None:
+        chain.append(node)
+        node = parents[node]
+    return chain
+
+
+def _unpack(
+    rank: List[int],
+    indptr: List[int],
+    indices: List[int],
+    middles: List[int],
+    u: int,
+    v: int
+) -> List[int]:
+    """Розгортає висхідне ребро u-v у вершини вихідного графа (без u, з v)."""
+    unpacked = []
+    stack = [(u, v)]
+    while stack:
+        a, b = stack.pop()
+        # Ребро зберігається при вершині меншого рангу
+        low, high = (a, b) if rank[a] < rank[b] else (b, a)
+        middle = next(
+            middles[position] for position in range(indptr[low], indptr[low + 1])
+            if indices[position] == high
+        )
+        if middle < 0:
+            unpacked.append(b)
+        else:
+            stack.append((middle, b))
+            stack.append((a, middle))
+    return unpacked
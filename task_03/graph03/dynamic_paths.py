@@ -0,0 +1,219 @@
+"""
+Модуль для динамічної підтримки найкоротших шляхів з одного джерела при зміні ваг ребер.
+
+Клас `DynamicShortestPaths` стартує з результату `dijkstra` (тобто
+`nx.single_source_dijkstra`) і зберігає дерево найкоротших шляхів. Коли вага одного ребра
+змінюється (наприклад, час `time` через затор), перераховується лише уражена частина:
+    - при зменшенні ваги — поширення покращень від кінця ребра (обмежена Дейкстра);
+    - при збільшенні ваги ребра дерева — піддерево під цим ребром: його вершини
+      отримують кандидатів від сусідів поза піддеревом і доопрацьовуються Дейкстрою
+      лише всередині піддерева.
+Кожне оновлення повертає множину вершин, шлях до яких змінився.
+
+Використання:
+    dynamic = DynamicShortestPaths(graph, '15', metric_type='time')
+    changed = dynamic.update_edge_weight('33', '50', 4.2)
+    dynamic.path('16')
+"""
+
+import heapq
+import math
+from itertools import count
+from typing import Any, Dict, List, Optional, Set, Tuple
+import networkx as nx
+from graph03.graph_search import dijkstra
+from graph03.query_cache import mark_graph_changed
+
+
+class DynamicShortestPaths:
+    """
+    Дерево найкоротших шляхів з одного джерела, що оновлюється при зміні ваг ребер.
+
+    Атрибути:
+        graph (nx.Graph): Граф транспортної мережі (ваги змінюються на місці).
+        source (Any): Вершина-джерело.
+        metric_type (str): Назва ваги ('distance', 'time' або 'third_weight').
+        distances (Dict[Any, float]): Найкоротші відстані до досяжних вершин.
+        parents (Dict[Any, Any]): Попередник кожної вершини в дереві (None для джерела).
+    """
+
+    def __init__(self, graph: nx.Graph, source: Any, metric_type: str = 'distance') -> None:
+        self.graph = graph
+        self.source = source
+        self.metric_type = metric_type
+
+        path_metrics, paths = dijkstra(graph, source, metric_type=metric_type)
+        self.distances: Dict[Any, float] = dict(path_metrics)
+        self.parents: Dict[Any, Any] = {
+            node: (path[-2] if len(path) > 1 else None) for node, path in paths.items()
+        }
+        self._children: Dict[Any, Set[Any]] = {node: set() for node in self.distances}
+        for node, parent in self.parents.items():
+            if parent is not None:
+                self._children[parent].add(node)
+
+    def distance(self, target: Any) -> float:
+        """Повертає найкоротшу відстань до вершини (inf, якщо вона недосяжна)."""
+        return self.distances.get(target, math.inf)
+
+    def path(self, target: Any) -> Optional[List[Any]]:
+        """
+        Повертає поточний найкоротший шлях від джерела до вершини.
+
+        Аргументи:
+            target (Any): Кінцева вершина.
+
+        Повертає:
+            List[Any]: Список вершин або None, якщо вершина недосяжна.
+        """
+        if target not in self.parents:
+            return None
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = self.parents[node]
+        path.reverse()
+        return path
+
+    def results(self) -> Tuple[Dict[Any, float], Dict[Any, List[Any]]]:
+        """
+        Повертає відстані та шляхи у форматі `dijkstra`.
+
+        Повертає:
+            Tuple[Dict[Any, float], Dict[Any, List[Any]]]: Відстані та шляхи до всіх досяжних вершин.
+        """
+        return dict(self.distances), {node: self.path(node) for node in self.distances}
+
+    def update_edge_weight(self, u: Any, v: Any, weight: float) -> Set[Any]:
+        """
+        Змінює вагу ребра в графі та ремонтує дерево найкоротших шляхів.
+
+        Аргументи:
+            u (Any): Перша вершина ребра.
+            v (Any): Друга вершина ребра.
+            weight (float): Нова вага ребра.
+
+        Повертає:
+            Set[Any]: Вершини, відстань або шлях до яких змінилися.
+
+        Raises:
+            ValueError: Якщо вага від'ємна.
+            KeyError: Якщо ребра немає в графі.
+        """
+        if weight < 0:
+            raise ValueError("edge weight must be non-negative")
+        data = self.graph[u][v]
+        old_weight = data[self.metric_type]
+        data[self.metric_type] = weight
+        mark_graph_changed(self.graph)
+
+        if weight < old_weight:
+            return self._decrease(u, v, weight)
+        if weight > old_weight:
+            return self._increase(u, v)
+        return set()
+
+    def _decrease(self, u: Any, v: Any, weight: float) -> Set[Any]:
+        """Поширює покращення від кінця ребра, до якого тепер ближче."""
+        if u not in self.distances:
+            return set()
+        if self.distances[u] > self.distances[v]:
+            u, v = v, u
+        candidate = self.distances[u] + weight
+        if candidate >= self.distances[v]:
+            return set()
+
+        changed = set()
+        self._attach(v, u, candidate)
+        # Лічильник розв'язує нічиї без порівняння вершин (їх мітки можуть бути непорівнюваними)
+        order = count()
+        heap = [(candidate, next(order), v)]
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if distance > self.distances[node]:
+                continue
+            changed.add(node)
+            for adjacent, edge in self.graph[node].items():
+                candidate = distance + edge[self.metric_type]
+                if candidate < self.distances[adjacent]:
+                    self._attach(adjacent, node, candidate)
+                    heapq.heappush(heap, (candidate, next(order), adjacent))
+
+        # Покращені вершини змінюють префікс шляху всього свого піддерева
+        return self._with_descendants(changed)
+
+    def _increase(self, u: Any, v: Any) -> Set[Any]:
+        """Перераховує піддерево під ребром дерева, вага якого зросла."""
+        if self.parents.get(v) == u:
+            root = v
+        elif self.parents.get(u) == v:
+            root = u
+        else:
+            # Ребро не входить у дерево найкоротших шляхів: відстані не змінюються
+            return set()
+
+        subtree = self._subtree(root)
+        old = {node: (self.distances[node], self.parents[node]) for node in subtree}
+        for node in subtree:
+            del self.distances[node]
+            self._children[self.parents.pop(node)].discard(node)
+
+        # Найкращі кандидати для вершин піддерева від сусідів, чиї відстані не змінились
+        order = count()
+        heap = []
+        for node in subtree:
+            best, best_parent = math.inf, None
+            for adjacent, edge in self.graph[node].items():
+                if adjacent in self.distances:
+                    candidate = self.distances[adjacent] + edge[self.metric_type]
+                    if candidate < best:
+                        best, best_parent = candidate, adjacent
+            if best_parent is not None:
+                heap.append((best, next(order), node, best_parent))
+        heapq.heapify(heap)
+
+        changed = set()
+        while heap:
+            distance, _, node, parent = heapq.heappop(heap)
+            if node in self.distances:
+                continue
+            self._attach(node, parent, distance)
+            if distance != old[node][0] or parent != old[node][1] or parent in changed:
+                changed.add(node)
+            for adjacent, edge in self.graph[node].items():
+                if adjacent in subtree and adjacent not in self.distances:
+                    heapq.heappush(heap, (distance + edge[self.metric_type], next(order), adjacent, node))
+
+        # Вершини піддерева без кандидатів стали недосяжними
+        changed.update(node for node in subtree if node not in self.distances)
+        return changed
+
+    def _attach(self, node: Any, parent: Any, distance: float) -> None:
+        """Підвішує вершину до нового батька в дереві з новою відстанню."""
+        previous = self.parents.get(node)
+        if previous is not None:
+            self._children[previous].discard(node)
+        self.parents[node] = parent
+        self.distances[node] = distance
+        self._children.setdefault(parent, set()).add(node)
+        self._children.setdefault(node, set())
+
+    def _subtree(self, root: Any) -> Set[Any]:
+        """Повертає всі вершини піддерева з коренем root."""
+        subtree = {root}
+        stack = [root]
+        while stack:
+            for child in self._children.get(stack.pop(), ()):
+                if child not in subtree:
+                    subtree.add(child)
+                    stack.append(child)
+        return subtree
+
+    def _with_descendants(self, nodes: Set[Any]) -> Set[Any]:
+        """Доповнює множину вершин усіма їхніми нащадками в дереві."""
+        result = set()
+        for node in nodes:
+            if node not in result:
+                result |= self._subtree(node)
+        return result
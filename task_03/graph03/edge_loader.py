@@ -0,0 +1,301 @@
+"""
+Модуль для потокового завантаження ребер транспортної мережі з файлів.
+
+Замість модулів `edges.py` зі списками-літералами Python ребра читаються з файлів
+частинами (chunks), тож пам'ять не зростає разом із розміром файлу до моменту
+побудови графа. Підтримуються формати:
+    - CSV (`.csv`) і TSV (`.tsv`) з рядком заголовка (`source,target,distance,time`);
+    - текстові списки ребер через пробіли (`.txt`, `.edges` тощо) без заголовка;
+    - NDJSON (`.jsonl`, `.ndjson`): один об'єкт `{"source": ..., "target": ..., ...}` на рядок.
+Файли з розширенням `.gz` розпаковуються на льоту.
+
+Числові колонки (`distance`, `time`) кожної частини перетворюються одразу в масиви NumPy,
+без створення словника на кожне ребро. Нечислові колонки (наприклад, назва лінії)
+пропускаються, як у `CompactGraph.from_edges`.
+
+Використання:
+    - iter_edge_chunks(path) -> Iterator[EdgeChunk]: частини ребер з колонками-масивами.
+    - iter_weighted_edges(path) -> Iterator[tuple]: ребра для `create_transport_network_graph`.
+    - load_compact_graph(path) -> CompactGraph: компактний граф без проміжного списку ребер.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+from array import array
+from itertools import chain, islice
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO
+import numpy as np
+from graph03.compact_graph import CompactGraph
+
+DEFAULT_COLUMNS = ('source', 'target', 'distance', 'time')
+
+
+class EdgeChunk(NamedTuple):
+    """
+    Частина ребер, прочитана з файлу.
+
+    Атрибути:
+        sources (List[str]): Перші вершини ребер.
+        targets (List[str]): Другі вершини ребер.
+        weights (Dict[str, np.ndarray]): Числові колонки (float64) тієї ж довжини.
+    """
+    sources: List[str]
+    targets: List[str]
+    weights: Dict[str, np.ndarray]
+
+
+def iter_edge_chunks(
+    path: str,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None
+) -> Iterator[EdgeChunk]:
+    """
+    Читає файл ребер частинами по chunk_size рядків.
+
+    Аргументи:
+        path (str): Шлях до файлу ребер.
+        chunk_size (int): Кількість ребер у частині.
+        columns (Sequence[str], optional): Назви колонок для файлів без заголовка
+            (за замовчуванням 'source', 'target', 'distance', 'time').
+            Для CSV/TSV назви беруться із заголовка, якщо columns не задано;
+            якщо задано, а файл має заголовок (рядок з полями 'source' і 'target'),
+            заголовок пропускається.
+
+    Повертає:
+        Iterator[EdgeChunk]: Генератор частин ребер. Колонка ваги, значення якої в першому
+        рядку даних не є числом, пропускається.
+
+    Raises:
+        ValueError: Якщо у файлі немає колонок 'source' і 'target', кількість полів
+            у рядку відрізняється від кількості колонок або числова колонка містить
+            нечислове значення (з номером рядка).
+    """
+    file_format = _detect_format(path)
+    with _open_text(path) as stream:
+        if file_format == 'ndjson':
+            yield from _iter_ndjson_chunks(stream, chunk_size)
+            return
+
+        if file_format in ('csv', 'tsv'):
+            delimiter = ',' if file_format == 'csv' else '\t'
+            reader = csv.reader(stream, delimiter=delimiter)
+            # Порожні рядки (зокрема в кінці файлу) csv.reader повертає як []
+            rows = ((reader.line_num, row) for row in reader if row)
+            first = next(rows, None)
+            if columns is None:
+                columns = [name.strip() for name in first[1]] if first is not None else []
+            elif first is not None and not _is_header(first[1]):
+                rows = chain([first], rows)
+        else:
+            rows = (
+                (line_number, line.split())
+                for line_number, line in enumerate(stream, start=1)
+                if line.strip() and not line.startswith('#')
+            )
+            if columns is None:
+                # Без заголовка кількість колонок визначає перший рядок: 'source target' або з вагами
+                first = next(rows, None)
+                if first is None:
+                    return
+                columns = DEFAULT_COLUMNS[:len(first[1])]
+                rows = chain([first], rows)
+
+        columns = list(columns)
+        width = len(columns)
+        if 'source' not in columns or 'target' not in columns:
+            raise ValueError("edge file must have 'source' and 'target' columns")
+        source_position = columns.index('source')
+        target_position = columns.index('target')
+        weight_positions = {
+            name: position for position, name in enumerate(columns) if name not in ('source', 'target')
+        }
+
+        numeric = None
+        while True:
+            block = list(islice(rows, chunk_size))
+            if not block:
+                return
+            for line_number, row in block:
+                if len(row) != width:
+                    raise ValueError(f"line {line_number}: expected {width} fields, got {len(row)}")
+            if numeric is None:
+                # Числові колонки визначає перший рядок даних
+                numeric = {
+                    name: position for name, position in weight_positions.items()
+                    if _is_float(block[0][1][position])
+                }
+            # Транспонування частини: кожна колонка стає одним списком рядків
+            fields = list(zip(*(row for _, row in block)))
+            weights = {
+                name: _float_column(block, fields[position], name, position)
+                for name, position in numeric.items()
+            }
+            yield EdgeChunk(list(fields[source_position]), list(fields[target_position]), weights)
+
+
+def iter_weighted_edges(
+    path: str,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None
+) -> Iterator[tuple]:
+    """
+    Генерує ребра у форматі `create_transport_network_graph`.
+
+    Для файлів з вагами ребро має вигляд `(u, v, {'distance': ..., 'time': ...})`,
+    для файлів без ваг — `(u, v)`.
+
+    Аргументи:
+        path (str): Шлях до файлу ребер.
+        chunk_size (int): Кількість ребер, що читаються за раз.
+        columns (Sequence[str], optional): Назви колонок (див. `iter_edge_chunks`).
+
+    Повертає:
+        Iterator[tuple]: Генератор ребер.
+    """
+    for chunk in iter_edge_chunks(path, chunk_size, columns):
+        if not chunk.weights:
+            yield from zip(chunk.sources, chunk.targets)
+            continue
+        names = list(chunk.weights)
+        rows = zip(*(chunk.weights[name].tolist() for name in names))
+        for u, v, row in zip(chunk.sources, chunk.targets, rows):
+            yield u, v, dict(zip(names, row))
+
+
+def load_compact_graph(
+    path: str,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None
+) -> CompactGraph:
+    """
+    Будує компактний граф безпосередньо з файлу ребер.
+
+    Ваги накопичуються як масиви float32 по частинах, а вершини — як цілі індекси.
+
+    Аргументи:
+        path (str): Шлях до файлу ребер.
+        chunk_size (int): Кількість ребер, що читаються за раз.
+        columns (Sequence[str], optional): Назви колонок (див. `iter_edge_chunks`).
+
+    Повертає:
+        CompactGraph: Граф транспортної мережі у форматі CSR.
+    """
+    node_index: Dict[str, int] = {}
+    node_ids: List[str] = []
+    sources = array('i')
+    targets = array('i')
+    weight_chunks: Dict[str, List[np.ndarray]] = {}
+    num_edges = 0
+
+    for chunk in iter_edge_chunks(path, chunk_size, columns):
+        for names, output in ((chunk.sources, sources), (chunk.targets, targets)):
+            for node in names:
+                index = node_index.get(node)
+                if index is None:
+                    index = len(node_ids)
+                    node_index[node] = index
+                    node_ids.append(node)
+                output.append(index)
+        # Колонки, яких немає в частині (NDJSON), доповнюються NaN, щоб ваги лишались вирівняними з ребрами
+        for name in chunk.weights:
+            if name not in weight_chunks:
+                weight_chunks[name] = [np.full(num_edges, np.nan, dtype=np.float32)]
+        size = len(chunk.sources)
+        for name, parts in weight_chunks.items():
+            values = chunk.weights.get(name)
+            parts.append(np.full(size, np.nan, dtype=np.float32) if values is None else values.astype(np.float32))
+        num_edges += size
+
+    weights = {name: np.concatenate(parts) for name, parts in weight_chunks.items()}
+    return CompactGraph.from_arrays(
+        node_ids,
+        np.frombuffer(sources, dtype=np.int32),
+        np.frombuffer(targets, dtype=np.int32),
+        weights
+    )
+
+
+def _iter_ndjson_chunks(stream: TextIO, chunk_size: int) -> Iterator[EdgeChunk]:
+    """
+    Читає NDJSON частинами; числові поля кожної частини збираються в масиви.
+
+    Колонки — об'єднання числових полів усіх записів частини; записи без поля
+    (або з нечисловим значенням) отримують NaN.
+    """
+    lines = (line for line in stream if line.strip())
+    while True:
+        block = [json.loads(line) for line in islice(lines, chunk_size)]
+        if not block:
+            return
+        names = list(dict.fromkeys(
+            name for record in block for name, value in record.items()
+            if name not in ('source', 'target') and _is_number(value)
+        ))
+        weights = {
+            name: np.array(
+                [record[name] if _is_number(record.get(name)) else np.nan for record in block],
+                dtype=np.float64
+            )
+            for name in names
+        }
+        yield EdgeChunk(
+            [str(record['source']) for record in block],
+            [str(record['target']) for record in block],
+            weights
+        )
+
+
+def _float_column(block: List[tuple], values: Sequence[str], name: str, position: int) -> np.ndarray:
+    """Перетворює колонку частини в масив float64; нечислове значення — ValueError з номером рядка."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except ValueError:
+        for line_number, row in block:
+            if not _is_float(row[position]):
+                raise ValueError(
+                    f"line {line_number}: column '{name}' has non-numeric value {row[position]!r}"
+                ) from None
+        raise
+
+
+def _is_float(value: str) -> bool:
+    """Перевіряє, чи перетворюється поле рядка на число."""
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_header(row: List[str]) -> bool:
+    """Перевіряє, чи є рядок CSV/TSV заголовком (містить поля 'source' і 'target')."""
+    fields = {field.strip() for field in row}
+    return 'source' in fields and 'target' in fields
+
+
+def _is_number(value) -> bool:
+    """Перевіряє, чи є значення поля NDJSON числом (логічні значення не вважаються вагами)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _detect_format(path: str) -> str:
+    """Визначає формат файлу за розширенням (без урахування `.gz`)."""
+    name = path[:-3] if path.endswith('.gz') else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension == '.tsv':
+        return 'tsv'
+    if extension in ('.jsonl', '.ndjson'):
+        return 'ndjson'
+    return 'text'
+
+
+def _open_text(path: str) -> TextIO:
+    """Відкриває файл (зокрема стиснений gzip) для читання тексту."""
+    if path.endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path, 'rb'), encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
@@ -1,17 +1,22 @@
 """
 Модуль для створення та аналізу графу транспортної мережі.
 Цей модуль містить функцію для створення графа на основі з'єднань з вагами,
-а також функцію для додавання третьої ваги, що враховує час і відстань.
+а також функції для додавання третьої ваги, що враховує час і відстань,
+та для пакетного векторизованого обчислення кількох складених ваг.
 """
 
-from typing import List, Tuple, Dict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
 import networkx as nx
+from graph03.compact_graph import CompactGraph
+from graph03.query_cache import mark_graph_changed
 
-def create_transport_network_graph(edges: List[Tuple[str, str, Dict[str, float]]]) -> nx.Graph:
+def create_transport_network_graph(edges: Iterable[Tuple[str, str, Dict[str, float]]]) -> nx.Graph:
     """
     Створює граф транспортної мережі на основі заданих з'єднань з вагами.
 
-    :param edges: Список з'єднань, де кожне з'єднання представляє собою кортеж,
+    :param edges: Список (або генератор, наприклад `edge_loader.iter_weighted_edges`) з'єднань,
+                  де кожне з'єднання представляє собою кортеж,
                   що містить два вузли та словник з вагами (distance, time).
     :return: Об'єкт графа, що представляє транспортну мережу.
     """
@@ -19,7 +24,18 @@ def create_transport_network_graph(edges: List[Tuple[str, str, Dict[str, float]]
     graph.add_edges_from(edges)
     return graph
 
-def add_third_weight(graph: nx.Graph, alpha: float, beta: float) -> None:
+def create_compact_transport_network_graph(edges: List[Tuple[str, str, Dict[str, float]]]) -> CompactGraph:
+    """
+    Створює компактний (CSR) граф транспортної мережі з тих самих з'єднань з вагами.
+
+    Ваги `distance`, `time` (та інші числові атрибути) зберігаються як колонки float32.
+
+    :param edges: Список з'єднань у форматі `create_transport_network_graph`.
+    :return: Об'єкт `CompactGraph`, що представляє транспортну мережу.
+    """
+    return CompactGraph.from_edges(edges)
+
+def add_third_weight(graph: Union[nx.Graph, CompactGraph], alpha: float, beta: float) -> None:
     """
     Додає третю вагу до графа, яка враховує час і відстань.
 
@@ -27,13 +43,88 @@ def add_third_weight(graph: nx.Graph, alpha: float, beta: float) -> None:
     :param alpha: Вага для відстані.
     :param beta: Вага для часу.
     """
-    for edge in graph.edges(data=True):
-        distance = edge[2]['distance']
-        time = edge[2]['time']
-        # Обчислюємо третю вагу як зважену суму відстані та часу
-        third_weight = round(alpha * distance + beta * time, 2)
-        # Додаємо третю вагу до графа
-        graph[edge[0]][edge[1]]['third_weight'] = third_weight
+    compute_composite_weights(graph, {'third_weight': (alpha, beta)}, decimals=2)
+
+def edge_attribute_arrays(
+    graph: Union[nx.Graph, CompactGraph],
+    names: Iterable[str] = ('distance', 'time')
+) -> Dict[str, np.ndarray]:
+    """
+    Збирає атрибути ребер у масиви NumPy (по одному елементу на ребро).
+
+    Для `CompactGraph` повертаються наявні колонки, для `nx.Graph` виконується
+    один прохід по ребрах у порядку `graph.edges()`.
+
+    :param graph: Граф транспортної мережі.
+    :param names: Назви атрибутів ребер.
+    :return: Словник назва атрибута -> масив значень.
+    """
+    names = list(names)
+    if isinstance(graph, CompactGraph):
+        return {name: graph.weights[name] for name in names}
+
+    edge_data = [data for _, _, data in graph.edges(data=True)]
+    return {
+        name: np.fromiter((data[name] for data in edge_data), dtype=np.float64, count=len(edge_data))
+        for name in names
+    }
+
+def compute_composite_weights(
+    graph: Union[nx.Graph, CompactGraph],
+    weights: Dict[str, Union[Tuple[float, float], Callable[[Dict[str, np.ndarray]], np.ndarray]]],
+    write_back: bool = True,
+    decimals: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Обчислює довільну кількість складених ваг ребер за один векторизований прохід.
+
+    Кожна вага задається або парою (alpha, beta) для `alpha * distance + beta * time`,
+    або функцією, що отримує словник колонок атрибутів ребер і повертає масив значень.
+
+    :param graph: Граф транспортної мережі (`nx.Graph` або `CompactGraph`).
+    :param weights: Словник назва ваги -> (alpha, beta) або векторизований вираз.
+    :param write_back: Чи записувати обчислені ваги в граф як атрибути ребер.
+    :param decimals: Кількість знаків після коми для округлення (None — без округлення).
+    :return: Словник назва ваги -> масив значень у порядку ребер графа.
+    """
+    columns = edge_attribute_arrays(graph)
+    results = {}
+    for name, spec in weights.items():
+        if callable(spec):
+            values = np.asarray(spec(columns), dtype=np.float64)
+        else:
+            alpha, beta = spec
+            values = alpha * columns['distance'].astype(np.float64) + beta * columns['time']
+        if decimals is not None:
+            values = np.round(values, decimals)
+        results[name] = values
+
+    if write_back:
+        _write_edge_columns(graph, results)
+    return results
+
+def _write_edge_columns(graph: Union[nx.Graph, CompactGraph], columns: Dict[str, np.ndarray]) -> None:
+    """
+    Записує колонки ваг у граф.
+
+    :param graph: Граф транспортної мережі.
+    :param columns: Словник назва ваги -> масив значень у порядку ребер графа.
+    """
+    if isinstance(graph, CompactGraph):
+        # Колонки графа з `track_changes` лишаються доступними лише для читання
+        locked = any(not column.flags.writeable for column in graph.weights.values())
+        for name, values in columns.items():
+            graph.weights[name] = values.astype(np.float32)
+            graph.weights[name].flags.writeable = not locked
+    else:
+        names = list(columns)
+        rows = zip(*(columns[name].tolist() for name in names))
+        # Один update словника атрибутів на ребро для всіх ваг одразу
+        for (_, _, data), row in zip(graph.edges(data=True), rows):
+            data.update(zip(names, row))
+
+    # Кешовані маршрути (graph03.route_cache) обчислені для старих ваг
+    mark_graph_changed(graph)
 
 # Зразок вагових з'єднань
 weighted_edges = [
@@ -3,11 +3,13 @@
 
 Цей модуль містить функцію для знаходження найкоротших шляхів у графі,
 використовуючи алгоритм Дейкстри, з можливістю вибору метрики:
-відстань або час.
+відстань або час. Граф може бути як `nx.Graph`, так і компактним `CompactGraph`.
 """
 
+import heapq
 from typing import Dict, List, Tuple
 import networkx as nx
+from graph03.compact_graph import CompactGraph
 
 def dijkstra(
     graph: nx.Graph,
@@ -18,7 +20,7 @@ def dijkstra(
     Використання алгоритму Дейкстри для знаходження найкоротших шляхів.
 
     Args:
-        graph (nx.Graph): Вхідний граф, в якому виконуються обчислення.
+        graph (nx.Graph | CompactGraph): Вхідний граф, в якому виконуються обчислення.
         start (any): Вершина, з якої починається пошук.
         metric_type (str): Тип метрики, за якою буде виконуватись пошук.
             Може бути 'distance' або 'time'.
@@ -34,5 +36,58 @@ def dijkstra(
     if metric_type not in ['distance', 'time', 'third_weight']:
         raise ValueError("metric_type must be either 'distance' or 'time'")
 
+    if isinstance(graph, CompactGraph):
+        return _compact_dijkstra(graph, start, metric_type)
+
     path_metrics, paths = nx.single_source_dijkstra(graph, start, weight=metric_type)
     return path_metrics, paths
+
+def _compact_dijkstra(
+    graph: CompactGraph,
+    start: any,
+    metric_type: str
+) -> Tuple[Dict[any, float], Dict[any, List[any]]]:
+    """
+    Алгоритм Дейкстри над масивами CSR з бінарною купою.
+
+    Args:
+        graph (CompactGraph): Компактний граф.
+        start (any): Вершина, з якої починається пошук.
+        metric_type (str): Назва колонки ваг.
+
+    Returns:
+        Tuple[Dict[any, float], Dict[any, List[any]]]: Той самий формат, що й у `dijkstra`.
+    """
+    source = graph.index_of(start)
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    edge_weights = graph.weights[metric_type][graph.edge_ids].tolist()
+
+    distances = {source: 0.0}
+    predecessors = {source: None}
+    settled = []
+    visited = set()
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in visited:
+            continue
+        visited.add(node)
+        settled.append(node)
+        for position in range(indptr[node], indptr[node + 1]):
+            adjacent = indices[position]
+            candidate = distance + edge_weights[position]
+            if adjacent not in distances or candidate < distances[adjacent]:
+                distances[adjacent] = candidate
+                predecessors[adjacent] = node
+                heapq.heappush(heap, (candidate, adjacent))
+
+    # Шляхи будуються в порядку встановлення вершин, тому батьківський шлях уже готовий
+    node_ids = graph.node_ids
+    path_metrics = {}
+    paths = {}
+    for node in settled:
+        parent = predecessors[node]
+        path_metrics[node_ids[node]] = distances[node]
+        paths[node_ids[node]] = [node_ids[node]] if parent is None else paths[node_ids[parent]] + [node_ids[node]]
+    return path_metrics, paths
@@ -4,18 +4,30 @@
 Функції:
 - visualize_graph: Візуалізує граф з можливістю відображення відстані або часу.
 - visualize_path_on_graph: Візуалізує шлях на графі з стрілками між вузлами.
+- node_sizes_for: Розміри вузлів за ступенем або посередницькою центральністю.
+- draw_network_layer, draw_route_layer: Окремі шари рисунка (мережа з підписами та стрілки шляху),
+  які також використовує пакетне малювання в `graph03.batch_rendering`.
 """
 
 import os
-import matplotlib.pyplot as plt
 import networkx as nx
-from graph03.utils import find_adjusted_positions
+import numpy as np
+from graph03.centrality import centrality_node_sizes
+from graph03.degree_statistics import scaled_node_sizes
+from graph03.fast_rendering import (
+    LABEL_NODE_THRESHOLD, draw_arrows_bulk, draw_graph_bulk, use_bulk_rendering, use_headless_backend
+)
+from graph03.layout_cache import get_layout
+from graph03.utils import find_adjusted_positions_batch
 
 def visualize_graph(
     graph,
     weight_type='distance',
     output_dir='results',
-    filename='transport_network_graph'
+    filename='transport_network_graph',
+    degree_stats=None,
+    bulk=None,
+    centrality_stats=None
 ):
     """Візуалізація графа та збереження зображення у файл.
 
@@ -24,31 +36,26 @@ def visualize_graph(
     weight_type (str): Тип ваги ('distance' або 'time') для позначення на краях графа.
     output_dir (str): Директорія для збереження графіка.
     filename (str): Ім'я файлу для збереження графіка.
+    degree_stats (dict): Готовий результат `degree_statistics` для цього графа (необов'язково).
+    bulk (bool): Пакетне малювання для великих графів (бекенд Agg, без підписів понад поріг);
+        None — автоматично за кількістю вузлів.
+    centrality_stats (dict): Результат `centrality` для цього графа (необов'язково); якщо задано,
+        розмір вузлів залежить від посередницької центральності, а не від ступеня.
     """
-    plt.figure(figsize=(12, 10))
-    pos = nx.spring_layout(graph, seed=42)
-    node_sizes = [300 * graph.degree(node) for node in graph.nodes()]
+    # pyplot імпортується лише під час малювання, а не під час імпорту модуля
+    import matplotlib.pyplot as plt
 
-    nx.draw(
-        graph, pos, with_labels=True, node_size=node_sizes,
-        node_color='lightblue', font_size=9, font_weight='bold', edge_color='gray'
-    )
-
-    if weight_type == 'distance':
-        edge_labels = nx.get_edge_attributes(graph, 'distance')
-        label = "Відстань (км)"
-    elif weight_type == 'time':
-        edge_labels = nx.get_edge_attributes(graph, 'time')
-        label = "Час (год)"
-    elif weight_type == 'third_weight':
-        edge_labels = nx.get_edge_attributes(graph, 'third_weight')
-        label = "Оптимізована вага"
-    else:
-        raise ValueError("weight_type must be either 'distance', 'time' or 'third_weight'.")
+    bulk = use_bulk_rendering(graph, bulk)
+    if bulk:
+        use_headless_backend()
 
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=6)
+    figure = plt.figure(figsize=(12, 10))
+    ax = figure.add_axes((0, 0, 1, 1))
+    pos = get_layout(graph, seed=42)
+    node_sizes = node_sizes_for(graph, degree_stats, centrality_stats)
 
-    plt.suptitle(f"Транспортна мережа міста\n{label}", size=20)
+    draw_network_layer(graph, pos, node_sizes, ax, bulk)
+    draw_edge_labels_layer(graph, pos, weight_type, ax, bulk)
 
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -62,7 +69,10 @@ def visualize_path_on_weighted_graph(
     path_nodes,
     output_dir='results',
     filename='path_graph',
-    weight_type='distance'
+    weight_type='distance',
+    degree_stats=None,
+    bulk=None,
+    centrality_stats=None
 ):
     """Візуалізація шляху на графі.
 
@@ -72,39 +82,80 @@ def visualize_path_on_weighted_graph(
     output_dir (str): Директорія для збереження графіка.
     filename (str): Ім'я файлу для збереження графіка.
     title (str): Заголовок для графіка.
+    degree_stats (dict): Готовий результат `degree_statistics` для цього графа (необов'язково).
+    bulk (bool): Пакетне малювання для великих графів (бекенд Agg, без підписів понад поріг);
+        None — автоматично за кількістю вузлів.
+    centrality_stats (dict): Результат `centrality` для цього графа (необов'язково); якщо задано,
+        розмір вузлів залежить від посередницької центральності, а не від ступеня.
     """
-    plt.figure(figsize=(12, 10))
-    pos = nx.spring_layout(graph, seed=42)
-    node_sizes = [300 * graph.degree(node) for node in graph.nodes()]
+    import matplotlib.pyplot as plt
 
-    nx.draw(
-        graph, pos, with_labels=True, node_size=node_sizes,
-        node_color='lightblue', font_size=9, font_weight='bold', edge_color='gray'
-    )
+    bulk = use_bulk_rendering(graph, bulk)
+    if bulk:
+        use_headless_backend()
 
-    path_edges = [(path_nodes[i], path_nodes[i + 1]) for i in range(len(path_nodes) - 1)]
+    figure = plt.figure(figsize=(12, 10))
+    ax = figure.add_axes((0, 0, 1, 1))
+    pos = get_layout(graph, seed=42)
+    node_sizes = node_sizes_for(graph, degree_stats, centrality_stats)
 
-    for edge in path_edges:
-        start, end = edge
-        start_pos = pos[start]
-        end_pos = pos[end]
+    draw_network_layer(graph, pos, node_sizes, ax, bulk)
+    draw_route_layer(graph, pos, path_nodes, ax, bulk)
+    draw_edge_labels_layer(graph, pos, weight_type, ax, bulk)
 
-        small = 0.028
-        diff = 0.006
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
 
-        start_size = graph.degree(start) * diff + small
-        end_size = graph.degree(end) * diff + small
+    filepath = os.path.join(output_dir, f"{filename}.png")
+    plt.savefig(filepath, format='png')
+    plt.close()
 
-        adjusted_start_pos, adjusted_end_pos = find_adjusted_positions(start_pos, end_pos, start_size, end_size)
+def node_sizes_for(graph, degree_stats=None, centrality_stats=None):
+    """Повертає розміри вузлів за посередницькою центральністю, якщо її задано, інакше за ступенем.
 
-        arrow = plt.Arrow(
-            adjusted_start_pos[0], adjusted_start_pos[1],
-            adjusted_end_pos[0] - adjusted_start_pos[0],
-            adjusted_end_pos[1] - adjusted_start_pos[1],
-            width=0.02, color='red'
+    Параметри:
+    graph (nx.Graph): Граф для візуалізації.
+    degree_stats (dict): Готовий результат `degree_statistics` для цього графа (необов'язково).
+    centrality_stats (dict): Результат `centrality` для цього графа (необов'язково).
+
+    Повертає:
+    np.ndarray: Розміри вузлів у порядку `graph.nodes()`.
+    """
+    if centrality_stats is not None:
+        return centrality_node_sizes(centrality_stats)
+    return scaled_node_sizes(graph, degree_stats)
+
+def draw_network_layer(graph, pos, node_sizes, ax, bulk=False):
+    """Малює вузли та ребра мережі на осях.
+
+    Параметри:
+    graph (nx.Graph): Граф для візуалізації.
+    pos (dict): Позиції вузлів.
+    node_sizes (np.ndarray): Розміри вузлів у порядку `graph.nodes()`.
+    ax (plt.Axes): Осі для малювання.
+    bulk (bool): Пакетне малювання (див. `graph03.fast_rendering`).
+    """
+    if bulk:
+        draw_graph_bulk(graph, pos, node_sizes, ax=ax)
+    else:
+        nx.draw(
+            graph, pos, ax=ax, with_labels=True, node_size=node_sizes,
+            node_color='lightblue', font_size=9, font_weight='bold', edge_color='gray'
         )
-        plt.gca().add_patch(arrow)
 
+def draw_edge_labels_layer(graph, pos, weight_type, ax, bulk=False):
+    """Малює підписи ваг ребер і заголовок рисунка.
+
+    Параметри:
+    graph (nx.Graph): Граф для візуалізації.
+    pos (dict): Позиції вузлів.
+    weight_type (str): Тип ваги ('distance', 'time' або 'third_weight').
+    ax (plt.Axes): Осі для малювання.
+    bulk (bool): Пакетне малювання; підписи ребер пропускаються для великих графів.
+
+    Повертає:
+    dict: Підписи ребер (ребро -> об'єкт тексту); порожній, якщо підписи пропущено.
+    """
     if weight_type == 'distance':
         edge_labels = nx.get_edge_attributes(graph, 'distance')
         label = "Відстань (км)"
@@ -117,13 +168,53 @@ def visualize_path_on_weighted_graph(
     else:
         raise ValueError("weight_type must be either 'distance', 'time' or 'third_weight'.")
 
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=6)
+    label_artists = {}
+    if not bulk or graph.number_of_nodes() <= LABEL_NODE_THRESHOLD:
+        label_artists = nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=6, ax=ax)
 
-    plt.suptitle(f"Транспортна мережа міста\n{label}", size=20)
+    ax.figure.suptitle(f"Транспортна мережа міста\n{label}", size=20)
+    return label_artists
 
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+def draw_route_layer(graph, pos, path_nodes, ax, bulk=False):
+    """Малює червоні стрілки вздовж шляху.
 
-    filepath = os.path.join(output_dir, f"{filename}.png")
-    plt.savefig(filepath, format='png')
-    plt.close()
+    Параметри:
+    graph (nx.Graph): Граф, на якому відображається шлях.
+    pos (dict): Позиції вузлів.
+    path_nodes (list): Список вузлів, які формують шлях.
+    ax (plt.Axes): Осі для малювання.
+    bulk (bool): Пакетне малювання (усі стрілки одним `quiver`).
+
+    Повертає:
+    list: Додані на осі об'єкти matplotlib.
+    """
+    path_edges = [(path_nodes[i], path_nodes[i + 1]) for i in range(len(path_nodes) - 1)]
+
+    small = 0.028
+    diff = 0.006
+
+    start_sizes = np.array([graph.degree(start) for start, _ in path_edges], dtype=np.float64) * diff + small
+    end_sizes = np.array([graph.degree(end) for _, end in path_edges], dtype=np.float64) * diff + small
+
+    adjusted_starts, adjusted_ends = find_adjusted_positions_batch(
+        [pos[start] for start, _ in path_edges], [pos[end] for _, end in path_edges],
+        start_sizes, end_sizes
+    )
+
+    if bulk:
+        quiver = draw_arrows_bulk(adjusted_starts, adjusted_ends, ax=ax)
+        return [quiver] if quiver is not None else []
+
+    # Без pyplot: шар малює й пакетне малювання на рисунках Figure без менеджера вікон
+    from matplotlib.patches import Arrow
+
+    artists = []
+    for adjusted_start_pos, adjusted_end_pos in zip(adjusted_starts, adjusted_ends):
+        arrow = Arrow(
+            adjusted_start_pos[0], adjusted_start_pos[1],
+            adjusted_end_pos[0] - adjusted_start_pos[0],
+            adjusted_end_pos[1] - adjusted_start_pos[1],
+            width=0.02, color='red'
+        )
+        artists.append(ax.add_patch(arrow))
+    return artists
@@ -0,0 +1,212 @@
+"""
+Модуль з пошуком k найкоротших простих шляхів (алгоритм Йена) для альтернативних маршрутів.
+
+`k_shortest_paths` — генератор: кожен наступний шлях обчислюється лише тоді, коли
+його запитують, тому перші варіанти повертаються одразу, а решта не рахуються зовсім.
+
+Дерево найкоротших шляхів до цілі будується один раз (зворотний пошук Дейкстри від цілі
+до встановлення початкової станції) і використовується всіма пошуками відгалужень (spur):
+якщо шлях дерева від вершини відгалуження не проходить через видалені вершини та ребра,
+він і є відповіддю без жодного пошуку; інакше пошук A* використовує відстані дерева
+як нижню межу (видалення ребер лише збільшує відстані), а для вершин поза деревом —
+його радіус. Сусіди вершин читаються з графа лише під час першого звернення, тож
+запит не перетворює всю мережу. Параметр `max_overlap` відкидає варіанти, що надто
+збігаються з уже поверненими маршрутами.
+
+Використання:
+    from itertools import islice
+    for length, path in islice(k_shortest_paths(graph, '15', '16', 'time'), 5): ...
+"""
+
+import heapq
+import math
+from itertools import count
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+from graph03.compact_graph import CompactGraph
+
+
+def k_shortest_paths(
+    graph: Any,
+    start: Any,
+    goal: Any,
+    metric_type: str = 'distance',
+    max_overlap: Optional[float] = None
+) -> Iterator[Tuple[float, List[Any]]]:
+    """
+    Повертає прості шляхи між двома станціями в порядку зростання довжини.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        start (Any): Початкова станція.
+        goal (Any): Кінцева станція.
+        metric_type (str): 'distance', 'time' або 'third_weight'.
+        max_overlap (float, optional): Найбільша частка ребер шляху (від 0 до 1), спільних
+            з будь-яким уже поверненим шляхом. Шляхи з більшим збігом пропускаються.
+
+    Повертає:
+        Iterator[Tuple[float, List[Any]]]: Пари (довжина, список станцій).
+
+    Raises:
+        ValueError: Якщо metric_type невідомий або станції немає в графі.
+    """
+    if metric_type not in ['distance', 'time', 'third_weight']:
+        raise ValueError("metric_type must be 'distance', 'time' or 'third_weight'")
+    for node in (start, goal):
+        if node not in graph:
+            raise ValueError(f"unknown station '{node}'")
+
+    adjacency = _Adjacency(graph, metric_type)
+    tree = _ReverseTree(adjacency, goal, start)
+    if start not in tree.distances:
+        return
+
+    found = [tree.path(start)]
+    candidates: List[Tuple[float, int, List[Any]]] = []
+    seen = {tuple(found[0])}
+    returned: List[Set[FrozenSet[Any]]] = []
+    order = count()
+    length = tree.distances[start]
+
+    while True:
+        path = found[-1]
+        edges = {frozenset(edge) for edge in zip(path, path[1:])}
+        if max_overlap is None or not edges or all(
+            len(edges & other) / len(edges) <= max_overlap for other in returned
+        ):
+            returned.append(edges)
+            yield length, list(path)
+
+        root_length = 0.0
+        for i, spur in enumerate(path[:-1]):
+            root = path[:i + 1]
+            removed_edges = {
+                other[i + 1] for other in found if len(other) > i + 1 and other[:i + 1] == root
+            }
+            spur_length, spur_path = _spur_search(adjacency, tree, spur, goal, set(root[:-1]), removed_edges)
+            if spur_path is not None:
+                candidate = root[:-1] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    # Лічильник розв'язує нічиї без порівняння списків станцій
+                    heapq.heappush(candidates, (root_length + spur_length, next(order), candidate))
+            root_length += adjacency[spur][path[i + 1]]
+
+        if not candidates:
+            return
+        length, _, path = heapq.heappop(candidates)
+        found.append(path)
+
+
+class _Adjacency(dict):
+    """Словники сусідів з вагами, що читаються з графа під час першого звернення до вершини."""
+
+    def __init__(self, graph: Any, metric_type: str) -> None:
+        super().__init__()
+        self.graph = graph
+        self.metric_type = metric_type
+        self._compact = isinstance(graph, CompactGraph)
+
+    def __missing__(self, node: Any) -> Dict[Any, float]:
+        if self._compact:
+            graph = self.graph
+            index = graph.index_of(node)
+            neighbors = zip(
+                (graph.node_ids[adjacent] for adjacent in graph.neighbor_indices(index).tolist()),
+                graph.neighbor_weights(index, self.metric_type).tolist()
+            )
+        else:
+            neighbors = ((adjacent, data[self.metric_type]) for adjacent, data in self.graph.adj[node].items())
+
+        # Паралельні ребра — найкоротше, петлі не потрібні простим шляхам
+        weights: Dict[Any, float] = {}
+        for adjacent, weight in neighbors:
+            if adjacent != node and weight < weights.get(adjacent, math.inf):
+                weights[adjacent] = weight
+        self[node] = weights
+        return weights
+
+
+class _ReverseTree:
+    """
+    Дерево найкоротших шляхів до цілі, побудоване до встановлення початкової станції.
+
+    Вершини поза деревом мають відстань до цілі не меншу за радіус дерева, тож оцінка
+    `bound` (відстань дерева або радіус) допустима й узгоджена для A*.
+    """
+
+    def __init__(self, adjacency: _Adjacency, goal: Any, start: Any) -> None:
+        self.distances: Dict[Any, float] = {}
+        self.next_hop: Dict[Any, Any] = {goal: None}
+        self.radius = math.inf
+        tentative = {goal: 0.0}
+        heap = [(0.0, 0, goal)]
+        order = count(1)
+        while heap:
+            distance, _, node = heapq.heappop(heap)
+            if node in self.distances:
+                continue
+            self.distances[node] = distance
+            if node == start:
+                self.radius = distance
+                break
+            for adjacent, weight in adjacency[node].items():
+                candidate = distance + weight
+                if adjacent not in self.distances and candidate < tentative.get(adjacent, math.inf):
+                    tentative[adjacent] = candidate
+                    self.next_hop[adjacent] = node
+                    heapq.heappush(heap, (candidate, next(order), adjacent))
+
+    def bound(self, node: Any) -> float:
+        """Нижня межа відстані від вершини до цілі."""
+        return self.distances.get(node, self.radius)
+
+    def path(self, node: Any) -> List[Any]:
+        """Шлях дерева від встановленої вершини до цілі."""
+        path = [node]
+        while self.next_hop[node] is not None:
+            node = self.next_hop[node]
+            path.append(node)
+        return path
+
+
+def _spur_search(
+    adjacency: _Adjacency,
+    tree: _ReverseTree,
+    spur: Any,
+    goal: Any,
+    removed_nodes: Set[Any],
+    removed_edges: Set[Any]
+) -> Tuple[float, Optional[List[Any]]]:
+    """Найкоротший шлях від вершини відгалуження до цілі без видалених вершин і ребер з неї."""
+    # Видалені ребра виходять лише з вершини відгалуження, тож шлях дерева перевіряється за першим кроком
+    if spur in tree.distances:
+        tree_path = tree.path(spur)
+        if tree_path[1] not in removed_edges and removed_nodes.isdisjoint(tree_path):
+            return tree.distances[spur], tree_path
+
+    distances = {spur: 0.0}
+    parents = {spur: None}
+    closed = set()
+    order = count(1)
+    heap = [(tree.bound(spur), 0.0, 0, spur)]
+    while heap:
+        _, distance, _, node = heapq.heappop(heap)
+        if node in closed:
+            continue
+        closed.add(node)
+        if node == goal:
+            path = [node]
+            while parents[node] is not None:
+                node = parents[node]
+                path.append(node)
+            return distance, path[::-1]
+
+        for adjacent, weight in adjacency[node].items():
+            if adjacent in removed_nodes or adjacent in closed or (node == spur and adjacent in removed_edges):
+                continue
+            candidate = distance + weight
+            if candidate < distances.get(adjacent, math.inf):
+                distances[adjacent] = candidate
+                parents[adjacent] = node
+                heapq.heappush(heap, (candidate + tree.bound(adjacent), candidate, next(order), adjacent))
+    return math.inf, None
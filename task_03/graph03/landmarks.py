@@ -0,0 +1,250 @@
+"""
+Модуль з індексом орієнтирів (landmarks) для пошуку A* між двома станціями (алгоритм ALT).
+
+Під час попередньої обробки обираються k орієнтирів і для кожної ваги
+(`distance`, `time`, `third_weight`) зберігаються таблиці відстаней від кожного
+орієнтира до всіх вершин. За нерівністю трикутника |d(L, t) - d(L, v)| є нижньою
+межею відстані від v до t, тож A* з цією евристикою встановлює лише невелику частку
+вершин замість повного обходу Дейкстри з одного джерела.
+
+Використання:
+    - LandmarkIndex.build(graph, num_landmarks=8): побудова індексу.
+    - index.query(start, goal, metric_type='distance') -> (відстань, шлях).
+    - index.save(path) / LandmarkIndex.load(path, graph): збереження та завантаження.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from graph03.batch_search import batch_dijkstra
+from graph03.compact_graph import CompactGraph
+
+
+class LandmarkIndex:
+    """
+    Індекс орієнтирів для запитів найкоротшого шляху між двома вершинами.
+
+    Атрибути:
+        graph (CompactGraph): Граф, для якого побудовано індекс.
+        landmarks (np.ndarray): Індекси вершин-орієнтирів.
+        tables (Dict[str, np.ndarray]): Для кожної ваги матриця V×k відстаней від орієнтирів.
+        settled (int): Кількість вершин, встановлених останнім запитом.
+    """
+
+    def __init__(self, graph: CompactGraph, landmarks: np.ndarray, tables: Dict[str, np.ndarray]) -> None:
+        self.graph = graph
+        self.landmarks = landmarks
+        self.tables = tables
+        self.settled = 0
+        # Списки Python для пошуку будуються під час першого запиту за кожною вагою
+        self._adjacency: Optional[Tuple[List[int], List[int]]] = None
+        self._edge_weights: Dict[str, List[float]] = {}
+        self._rows: Dict[str, List[List[float]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        graph: Any,
+        num_landmarks: int = 8,
+        metrics: Sequence[str] = ('distance', 'time', 'third_weight'),
+        processes: Optional[int] = None
+    ) -> 'LandmarkIndex':
+        """
+        Обирає орієнтири та обчислює таблиці відстаней.
+
+        Орієнтири обираються жадібно за першою метрикою: кожен наступний —
+        вершина, найвіддаленіша від уже обраних (farthest selection).
+
+        Аргументи:
+            graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+            num_landmarks (int): Кількість орієнтирів k.
+            metrics (Sequence[str]): Ваги, для яких будуються таблиці.
+            processes (int, optional): Кількість процесів для `batch_dijkstra`.
+
+        Повертає:
+            LandmarkIndex: Побудований індекс.
+
+        Raises:
+            ValueError: Якщо граф не містить жодної з ваг metrics.
+        """
+        compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+        requested = list(metrics)
+        metrics = [metric for metric in requested if metric in compact.weights]
+        if not metrics:
+            raise ValueError(f"graph has none of the edge weights {requested}")
+        num_landmarks = min(num_landmarks, compact.number_of_nodes())
+
+        # Перший орієнтир — найвіддаленіша вершина від вершини найбільшого ступеня
+        landmarks: List[int] = []
+        nearest = _single_source(compact, int(np.argmax(compact.degree())), metrics[0])
+        while len(landmarks) < num_landmarks:
+            reachable = np.where(np.isfinite(nearest), nearest, -1.0)
+            candidate = int(np.argmax(reachable))
+            if candidate in landmarks:
+                # Досяжні вершини вичерпано: переходимо до іншої зв'язної компоненти
+                unreached = np.flatnonzero(np.isinf(nearest))
+                if unreached.size == 0:
+                    break
+                candidate = int(unreached[0])
+            landmarks.append(candidate)
+            nearest = np.fmin(nearest, _single_source(compact, candidate, metrics[0]))
+            nearest[landmarks] = 0.0
+
+        landmark_ids = [compact.node_ids[index] for index in landmarks]
+        results = batch_dijkstra(compact, landmark_ids, metrics, processes=processes)
+        tables = {metric: np.ascontiguousarray(results[metric][0].T) for metric in metrics}
+        return cls(compact, np.array(landmarks, dtype=np.int64), tables)
+
+    def heuristic(self, node: int, goal: int, metric_type: str) -> float:
+        """
+        Нижня межа відстані між вершинами за нерівністю трикутника.
+
+        Аргументи:
+            node (int): Індекс поточної вершини.
+            goal (int): Індекс цільової вершини.
+            metric_type (str): Назва ваги.
+
+        Повертає:
+            float: max по орієнтирах |d(L, goal) - d(L, node)|.
+        """
+        table = self.tables[metric_type]
+        return _landmark_bound(table[node].tolist(), _goal_values(table[goal].tolist()))
+
+    def query(self, start: str, goal: str, metric_type: str = 'distance') -> Tuple[float, Optional[List[str]]]:
+        """
+        Знаходить найкоротший шлях між двома станціями пошуком A* з евристикою орієнтирів.
+
+        Аргументи:
+            start (str): Початкова станція.
+            goal (str): Кінцева станція.
+            metric_type (str): Назва ваги ('distance', 'time' або 'third_weight').
+
+        Повертає:
+            Tuple[float, Optional[List[str]]]: Довжина шляху та список станцій
+            (inf і None, якщо шлях не існує).
+
+        Raises:
+            ValueError: Якщо для metric_type не побудовано таблиць.
+        """
+        if metric_type not in self.tables:
+            raise ValueError(f"index has no tables for '{metric_type}'")
+
+        graph = self.graph
+        indptr, indices, weights, rows = self._search_lists(metric_type)
+        source = graph.index_of(start)
+        target = graph.index_of(goal)
+        goal_values = _goal_values(rows[target])
+
+        distances = {source: 0.0}
+        parents = {source: None}
+        closed = set()
+        heap = [(_landmark_bound(rows[source], goal_values), 0.0, source)]
+
+        while heap:
+            _, distance, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            closed.add(node)
+            if node == target:
+                self.settled = len(closed)
+                return distance, _unwind(graph, parents, target)
+
+            for position in range(indptr[node], indptr[node + 1]):
+                adjacent = indices[position]
+                candidate = distance + weights[position]
+                if adjacent in closed or candidate >= distances.get(adjacent, np.inf):
+                    continue
+                distances[adjacent] = candidate
+                parents[adjacent] = node
+                estimate = candidate + _landmark_bound(rows[adjacent], goal_values)
+                heapq.heappush(heap, (estimate, candidate, adjacent))
+
+        self.settled = len(closed)
+        return np.inf, None
+
+    def _search_lists(self, metric_type: str) -> Tuple[List[int], List[int], List[float], List[List[float]]]:
+        """
+        Повертає CSR-масиви, ваги та рядки таблиці як списки Python.
+
+        Поелементні звернення до NumPy на кожне релаксоване ребро повільніші за сам пошук,
+        тому масиви перетворюються один раз і використовуються всіма запитами.
+        """
+        graph = self.graph
+        if self._adjacency is None:
+            self._adjacency = (graph.indptr.tolist(), graph.indices.tolist())
+        if metric_type not in self._rows:
+            self._edge_weights[metric_type] = graph.weights[metric_type][graph.edge_ids].astype(np.float64).tolist()
+            self._rows[metric_type] = self.tables[metric_type].tolist()
+        return (*self._adjacency, self._edge_weights[metric_type], self._rows[metric_type])
+
+    def save(self, path: str) -> None:
+        """
+        Зберігає індекс у файл `.npz`.
+
+        Файл записується саме за шляхом path: `np.savez` отримує відкритий файл
+        і не додає розширення `.npz`, тож `load` приймає той самий шлях.
+
+        Аргументи:
+            path (str): Шлях до файлу.
+        """
+        with open(path, 'wb') as file:
+            np.savez(
+                file,
+                node_ids=np.array(self.graph.node_ids, dtype=str),
+                landmarks=self.landmarks,
+                metrics=np.array(list(self.tables), dtype=str),
+                **{f"table_{metric}": table for metric, table in self.tables.items()}
+            )
+
+    @classmethod
+    def load(cls, path: str, graph: Any) -> 'LandmarkIndex':
+        """
+        Завантажує індекс, збережений методом `save`.
+
+        Аргументи:
+            path (str): Шлях до файлу `.npz`.
+            graph (nx.Graph | CompactGraph): Той самий граф, для якого будувався індекс.
+
+        Повертає:
+            LandmarkIndex: Завантажений індекс.
+
+        Raises:
+            ValueError: Якщо вершини графа не збігаються з вершинами індексу.
+        """
+        compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+        with np.load(path) as data:
+            if data['node_ids'].tolist() != [str(node) for node in compact.node_ids]:
+                raise ValueError("landmark index was built for a different graph")
+            tables = {metric: data[f"table_{metric}"] for metric in data['metrics'].tolist()}
+            return cls(compact, data['landmarks'], tables)
+
+
+def _goal_values(goal_row: List[float]) -> List[Tuple[int, float]]:
+    """Пари (номер орієнтира, відстань до цілі) для орієнтирів, з яких ціль досяжна."""
+    return [(landmark, distance) for landmark, distance in enumerate(goal_row) if distance != np.inf]
+
+
+def _landmark_bound(node_row: List[float], goal_values: List[Tuple[int, float]]) -> float:
+    """Оцінка ALT; орієнтири, з яких одна з вершин недосяжна, не враховуються."""
+    bound = 0.0
+    for landmark, goal_distance in goal_values:
+        difference = abs(goal_distance - node_row[landmark])
+        if bound < difference < np.inf:
+            bound = difference
+    return bound
+
+
+def _single_source(graph: CompactGraph, source: int, metric_type: str) -> np.ndarray:
+    """Відстані від однієї вершини до всіх (inf для недосяжних)."""
+    distances, _ = batch_dijkstra(graph, [graph.node_ids[source]], [metric_type], processes=1)[metric_type]
+    return distances[0]
+
+
+def _unwind(graph: CompactGraph, parents: Dict[int, Optional[int]], node: int) -> List[str]:
+    """Відновлює шлях за батьківськими посиланнями A*."""
+    path = []
+    while node is not None:
+        path.append(graph.node_ids[node])
+        node = parents[node]
+    path.reverse()
+    return path
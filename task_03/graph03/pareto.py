@@ -0,0 +1,155 @@
+"""
+Модуль з багатокритеріальним пошуком маршрутів за двома вагами (відстанню та часом).
+
+`add_third_weight` зводить `distance` і `time` до однієї ваги з фіксованими alpha/beta,
+тож кожна пара коефіцієнтів дає лише одну точку компромісу. `pareto_routes` за один
+пошук знаходить усю множину Парето: маршрути, для яких жоден інший не кращий
+за обома критеріями одночасно.
+
+Пошук встановлює мітки (відстань, час) у лексикографічному порядку ключів
+(мітка плюс нижня межа до цілі за кожним критерієм). Тому нова мітка вершини
+домінується тоді й лише тоді, коли її час не менший за найменший час уже
+встановлених міток цієї вершини, і перевірка домінування займає O(1). Мітки,
+які не можуть покращити вже знайдені маршрути до цілі, відкидаються одразу.
+Для великих мереж множину міток можна обмежити: `epsilon` об'єднує маршрути,
+що відрізняються менше ніж на частку epsilon, а `max_labels` обмежує кількість
+міток однієї вершини (обидва параметри роблять результат наближеним).
+
+Використання:
+    routes = pareto_routes(graph, '15', '16')
+    for (distance, time), path in routes: ...
+"""
+
+import heapq
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+from graph03.compact_graph import CompactGraph
+
+
+def pareto_routes(
+    graph: Any,
+    start: Any,
+    goal: Any,
+    criteria: Sequence[str] = ('distance', 'time'),
+    epsilon: float = 0.0,
+    max_labels: Optional[int] = None
+) -> List[Tuple[Tuple[float, float], List[Any]]]:
+    """
+    Знаходить множину Парето маршрутів між двома станціями за двома вагами.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        start (Any): Початкова станція.
+        goal (Any): Кінцева станція.
+        criteria (Sequence[str]): Дві назви ваг ребер.
+        epsilon (float): Допуск домінування: мітка відкидається, якщо інша не гірша
+            за обома критеріями більше ніж у (1 + epsilon) раз (0 — точна множина).
+        max_labels (int, optional): Максимальна кількість міток однієї вершини.
+
+    Повертає:
+        List[Tuple[Tuple[float, float], List[Any]]]: Пари ((вага 1, вага 2), шлях),
+        упорядковані за зростанням першої ваги (і спаданням другої);
+        порожній список, якщо ціль недосяжна.
+
+    Raises:
+        ValueError: Якщо передано не дві ваги або станції немає в графі.
+    """
+    if len(criteria) != 2:
+        raise ValueError("pareto_routes expects exactly two criteria")
+    for node in (start, goal):
+        if node not in graph:
+            raise ValueError(f"unknown station '{node}'")
+
+    node_ids, adjacency = _adjacency(graph, criteria)
+    index = {node: i for i, node in enumerate(node_ids)}
+    source, target = index[start], index[goal]
+
+    # Нижні межі до цілі за кожним критерієм окремо (граф неорієнтований)
+    first_bound = _single_criterion(adjacency, target, 0)
+    second_bound = _single_criterion(adjacency, target, 1)
+    if math.isinf(first_bound[source]):
+        return []
+
+    scale = 1.0 + epsilon
+    # Найменший час серед встановлених міток вершини та їх кількість
+    best_second = [math.inf] * len(node_ids)
+    counts = [0] * len(node_ids)
+    labels: List[Tuple[int, int, float, float]] = []
+    results = []
+
+    heap = [(first_bound[source], second_bound[source], 0.0, 0.0, source, -1)]
+    while heap:
+        _, key_second, first, second, node, parent = heapq.heappop(heap)
+        # Домінування мітками вершини або вже знайденими маршрутами до цілі
+        if best_second[node] <= second * scale or best_second[target] <= key_second * scale:
+            continue
+        if max_labels is not None and counts[node] >= max_labels:
+            continue
+        best_second[node] = second
+        counts[node] += 1
+        labels.append((node, parent, first, second))
+        label = len(labels) - 1
+        if node == target:
+            results.append(label)
+            continue
+
+        for adjacent, first_weight, second_weight in adjacency[node]:
+            if math.isinf(first_bound[adjacent]):
+                continue
+            next_first, next_second = first + first_weight, second + second_weight
+            key_second = next_second + second_bound[adjacent]
+            if best_second[adjacent] <= next_second * scale or best_second[target] <= key_second * scale:
+                continue
+            heapq.heappush(heap, (
+                next_first + first_bound[adjacent], key_second,
+                next_first, next_second, adjacent, label
+            ))
+
+    routes = []
+    for label in results:
+        _, _, first, second = labels[label]
+        path = []
+        while label >= 0:
+            node, label, _, _ = labels[label]
+            path.append(node_ids[node])
+        routes.append(((first, second), path[::-1]))
+    return routes
+
+
+def _adjacency(graph: Any, criteria: Sequence[str]) -> Tuple[List[Any], List[List[Tuple[int, float, float]]]]:
+    """Списки сусідів з обома вагами для `nx.Graph` або `CompactGraph`."""
+    if isinstance(graph, CompactGraph):
+        first = graph.weights[criteria[0]][graph.edge_ids].astype(float).tolist()
+        second = graph.weights[criteria[1]][graph.edge_ids].astype(float).tolist()
+        indptr = graph.indptr.tolist()
+        indices = graph.indices.tolist()
+        adjacency = [
+            [(indices[position], first[position], second[position]) for position in range(indptr[node], indptr[node + 1])]
+            for node in range(graph.number_of_nodes())
+        ]
+        return graph.node_ids, adjacency
+
+    node_ids = list(graph.nodes())
+    index = {node: i for i, node in enumerate(node_ids)}
+    adjacency = [
+        [(index[adjacent], data[criteria[0]], data[criteria[1]]) for adjacent, data in graph.adj[node].items()]
+        for node in node_ids
+    ]
+    return node_ids, adjacency
+
+
+def _single_criterion(adjacency: List[List[Tuple[int, float, float]]], source: int, criterion: int) -> List[float]:
+    """Відстані Дейкстри від однієї вершини за одним критерієм (inf для недосяжних)."""
+    distances = [math.inf] * len(adjacency)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for edge in adjacency[node]:
+            candidate = distance + edge[1 + criterion]
+            if candidate < distances[edge[0]]:
+                distances[edge[0]] = candidate
+                heapq.heappush(heap, (candidate, edge[0]))
+    return distances
@@ -0,0 +1,329 @@
+"""
+Модуль з базовим кешем результатів запитів до графа та лічильником версій графа.
+
+`QueryCache` — обмежений кеш LRU з необов'язковим часом життя записів (TTL)
+та лічильниками влучань, промахів і витіснень для підбору його розміру.
+
+Версія графа — лічильник змін ребер і ваг: `graph.graph['version']` для `nx.Graph`
+та атрибут `version` для `CompactGraph`. Кеші запитів додають до ключа стан графа
+(версію разом з кількістю вершин і ребер), тож після зміни графа старі результати
+більше не повертаються. Функції модуля `add_edge`, `remove_edge` та `set_edge_weight`
+змінюють граф і збільшують версію.
+
+`track_changes` (його викликають кеші запитів) робить так, що й прямі зміни не лишаються
+непоміченими: у `nx.Graph` словники атрибутів ребер (наявних і нових) збільшують версію
+за кожної зміни (`G[u][v]['time'] = ...`, `G.add_edge(...)`), а колонки ваг `CompactGraph`
+стають доступними лише для читання, тож змінити їх можна тільки через `set_edge_weight`.
+
+Використання:
+    - graph_version(graph) -> int: поточна версія графа.
+    - graph_state(graph) -> tuple: версія, кількість вершин і ребер для ключів кешу.
+    - mark_graph_changed(graph): збільшення версії після зміни графа.
+    - track_changes(graph): автоматичне збільшення версії при прямих змінах графа.
+    - set_edge_weight(graph, u, v, name, weight): зміна ваги ребра зі збільшенням версії.
+    - QueryCache(max_entries, ttl): кеш LRU/TTL з методами get/put та stats().
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from graph03.compact_graph import CompactGraph
+
+# Позначка відсутнього запису (None може бути збереженим результатом)
+MISSING = object()
+
+
+def graph_version(graph: Any) -> int:
+    """
+    Повертає версію графа (кількість зафіксованих змін ребер і ваг).
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+
+    Повертає:
+        int: Версія графа (0 для щойно створеного графа).
+    """
+    if isinstance(graph, CompactGraph):
+        return graph.version
+    return graph.graph.get('version', 0)
+
+
+def graph_state(graph: Any) -> Tuple[int, int, int]:
+    """
+    Повертає стан графа для ключів кешу: версію, кількість вершин і кількість ребер.
+
+    Кількості помічають прямі зміни через API NetworkX (`G.add_edge`, `G.remove_node`),
+    після яких версію не було збільшено.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+
+    Повертає:
+        Tuple[int, int, int]: Версія, кількість вершин і кількість ребер.
+    """
+    return graph_version(graph), graph.number_of_nodes(), graph.number_of_edges()
+
+
+def mark_graph_changed(graph: Any) -> int:
+    """
+    Збільшує версію графа, щоб кеші запитів не повертали застарілі результати.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Змінений граф.
+
+    Повертає:
+        int: Нова версія графа.
+    """
+    if isinstance(graph, CompactGraph):
+        graph.version += 1
+        return graph.version
+    graph.graph['version'] = graph.graph.get('version', 0) + 1
+    return graph.graph['version']
+
+
+def track_changes(graph: Any) -> None:
+    """
+    Вмикає автоматичне збільшення версії графа при прямих змінах ребер і ваг.
+
+    Для `nx.Graph` словники атрибутів наявних ребер замінюються на `TrackedEdgeData`,
+    а нові ребра отримують такі словники через `edge_attr_dict_factory`. Для `CompactGraph`
+    колонки ваг стають доступними лише для читання (їх змінює `set_edge_weight`).
+    Повторний виклик нічого не змінює.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+    """
+    if isinstance(graph, CompactGraph):
+        for column in graph.weights.values():
+            column.flags.writeable = False
+        return
+    if isinstance(graph.__dict__.get('edge_attr_dict_factory'), _TrackedEdgeDataFactory):
+        return
+    graph.edge_attr_dict_factory = _TrackedEdgeDataFactory(graph)
+    adjacency = graph._adj  # pylint: disable=protected-access
+    for u, v, data in list(graph.edges(data=True)):
+        # Обидва напрямки неорієнтованого ребра посилаються на один словник
+        adjacency[u][v] = adjacency[v][u] = TrackedEdgeData(graph, data)
+
+
+class TrackedEdgeData(dict):
+    """Словник атрибутів ребра `nx.Graph`, що збільшує версію графа за кожної зміни."""
+
+    def __init__(self, graph: Any, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._graph = graph
+
+    def _changed(self) -> None:
+        # Під час розпакування (pickle) елементи відновлюються раніше за атрибут _graph
+        graph = self.__dict__.get('_graph')
+        if graph is not None:
+            mark_graph_changed(graph)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+
+class _TrackedEdgeDataFactory:
+    """Фабрика словників атрибутів нових ребер (`edge_attr_dict_factory`) графа з `track_changes`."""
+
+    def __init__(self, graph: Any) -> None:
+        self.graph = graph
+
+    def __call__(self) -> TrackedEdgeData:
+        return TrackedEdgeData(self.graph)
+
+
+def add_edge(graph: Any, u: Any, v: Any, **attributes: Any) -> None:
+    """
+    Додає ребро до `nx.Graph` та збільшує версію графа.
+
+    Аргументи:
+        graph (nx.Graph): Граф транспортної мережі.
+        u (Any): Перша вершина.
+        v (Any): Друга вершина.
+        **attributes: Атрибути ребра (наприклад, distance і time).
+    """
+    graph.add_edge(u, v, **attributes)
+    mark_graph_changed(graph)
+
+
+def remove_edge(graph: Any, u: Any, v: Any) -> None:
+    """
+    Видаляє ребро з `nx.Graph` та збільшує версію графа.
+
+    Аргументи:
+        graph (nx.Graph): Граф транспортної мережі.
+        u (Any): Перша вершина.
+        v (Any): Друга вершина.
+    """
+    graph.remove_edge(u, v)
+    mark_graph_changed(graph)
+
+
+def set_edge_weight(graph: Any, u: Any, v: Any, name: str, weight: float) -> None:
+    """
+    Змінює вагу ребра та збільшує версію графа.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        u (Any): Перша вершина ребра.
+        v (Any): Друга вершина ребра.
+        name (str): Назва ваги ('distance', 'time' або 'third_weight').
+        weight (float): Нове значення ваги.
+
+    Raises:
+        KeyError: Якщо ребра немає в графі.
+    """
+    if isinstance(graph, CompactGraph):
+        source, target = graph.index_of(u), graph.index_of(v)
+        start, end = graph.indptr[source], graph.indptr[source + 1]
+        positions = (graph.indices[start:end] == target).nonzero()[0]
+        if len(positions) == 0:
+            raise KeyError((u, v))
+        column = graph.weights[name]
+        # Колонка графа з `track_changes` доступна лише для читання поза цією функцією
+        locked = not column.flags.writeable
+        column.flags.writeable = True
+        column[graph.edge_ids[start + positions[0]]] = weight
+        column.flags.writeable = not locked
+    else:
+        graph[u][v][name] = weight
+    mark_graph_changed(graph)
+
+
+class QueryCache:
+    """
+    Кеш LRU з необов'язковим часом життя записів.
+
+    Атрибути:
+        max_entries (int): Максимальна кількість записів; найдавніше використаний витісняється першим.
+        ttl (float, optional): Час життя запису в секундах (None — без обмеження).
+        hits (int): Кількість влучань.
+        misses (int): Кількість промахів (зокрема через прострочені записи).
+        evictions (int): Кількість записів, витіснених через обмеження розміру.
+        expirations (int): Кількість прострочених записів.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, record: bool = True) -> Any:
+        """
+        Повертає збережене значення та позначає запис як нещодавно використаний.
+
+        Аргументи:
+            key (Hashable): Ключ запиту.
+            record (bool): Чи враховувати звернення в лічильниках влучань і промахів.
+
+        Повертає:
+            Any: Значення або MISSING, якщо запису немає чи він прострочений.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] < self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += record
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += record
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Зберігає значення, витісняючи найдавніше використаний запис за переповнення.
+
+        Аргументи:
+            key (Hashable): Ключ запиту.
+            value (Any): Результат запиту.
+        """
+        expires_at = self._clock() + self.ttl if self.ttl is not None else float('inf')
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Видаляє записи, ключі яких задовольняють умову.
+
+        Аргументи:
+            predicate (Callable[[Hashable], bool]): Умова для ключа.
+
+        Повертає:
+            int: Кількість видалених записів.
+        """
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Видаляє всі записи (лічильники зберігаються)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Повертає лічильники кешу.
+
+        Повертає:
+            Dict[str, Any]: 'entries', 'max_entries', 'hits', 'misses', 'hit_rate',
+            'evictions' та 'expirations'.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
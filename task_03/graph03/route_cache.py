@@ -0,0 +1,189 @@
+"""
+Модуль з кешем результатів пошуку маршрутів між станціями.
+
+`RouteCache` стоїть перед `dijkstra` і зберігає два види записів з ключами,
+що містять стан графа (див. `graph03.query_cache.graph_state`) та метрику:
+    - (стан, start, goal, метрика) -> (відстань, шлях) для окремих маршрутів;
+    - (стан, start, метрика) -> дерево найкоротших шляхів з однієї станції.
+Оскільки `dijkstra` і так обчислює шляхи до всіх станцій, дерево з однієї станції
+відповідає і на наступні запити з тієї ж станції без нового пошуку. Дерево зберігає
+лише відстані та попередника кожної станції (O(V) пам'яті), шлях відновлюється
+за попередниками, а кількість дерев обмежена окремо від кількості маршрутів.
+Коли стан графа змінюється, записи старих станів видаляються.
+
+Використання:
+    cache = RouteCache(graph, max_entries=4096, ttl=300, max_sources=16)
+    distance, path = cache.shortest_path('15', '16', 'time')
+    cache.stats()
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+from graph03.graph_search import dijkstra
+from graph03.query_cache import MISSING, QueryCache, graph_state, track_changes
+
+# Дерево з однієї станції: відстані та попередники (у початкової станції попередника немає)
+SourceTree = Tuple[Dict[Any, float], Dict[Any, Any]]
+
+
+class RouteCache:
+    """
+    Кеш LRU/TTL для запитів найкоротших шляхів одного графа.
+
+    Атрибути:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        cache (QueryCache): Сховище маршрутів між парами станцій.
+        trees (QueryCache): Сховище дерев найкоротших шляхів з однієї станції.
+        source_hits (int): Запити, на які відповів збережений результат з однієї станції.
+        searches (int): Кількість виконаних пошуків `dijkstra`.
+        invalidations (int): Кількість змін стану графа, після яких кеш було очищено.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        max_sources: int = 16
+    ) -> None:
+        """
+        Створює кеш маршрутів графа.
+
+        Кеш вмикає для графа `track_changes`: зміни через `graph03.query_cache`,
+        прямі `G.add_edge`/`G.remove_edge` та зміни ваг (`G[u][v]['time'] = ...`)
+        скидають кеш автоматично, а колонки ваг `CompactGraph` змінюються лише
+        через `set_edge_weight`.
+
+        Аргументи:
+            graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+            max_entries (int): Максимальна кількість збережених маршрутів між парами станцій.
+            ttl (float, optional): Час життя записів у секундах (None — без обмеження).
+            max_sources (int): Максимальна кількість збережених дерев з однієї станції;
+                кожне займає O(V) пам'яті.
+        """
+        track_changes(graph)
+        self.graph = graph
+        self.cache = QueryCache(max_entries, ttl)
+        self.trees = QueryCache(max_sources, ttl)
+        self.source_hits = 0
+        self.searches = 0
+        self.invalidations = 0
+        self._state = graph_state(graph)
+
+    def shortest_path(
+        self,
+        start: Any,
+        goal: Any,
+        metric_type: str = 'distance'
+    ) -> Tuple[float, Optional[List[Any]]]:
+        """
+        Повертає найкоротший шлях між двома станціями.
+
+        Аргументи:
+            start (Any): Початкова станція.
+            goal (Any): Кінцева станція.
+            metric_type (str): 'distance', 'time' або 'third_weight'.
+
+        Повертає:
+            Tuple[float, Optional[List[Any]]]: Відстань і список вершин шляху
+            (inf і None, якщо станція недосяжна).
+        """
+        state = self._current_state()
+        key = (state, start, goal, metric_type)
+        result = self.cache.get(key)
+        if result is MISSING:
+            tree = self.trees.get((state, start, metric_type), record=False)
+            if tree is MISSING:
+                tree = self._search(state, start, metric_type)
+            else:
+                self.source_hits += 1
+            result = (tree[0].get(goal, math.inf), _tree_path(tree, goal))
+            self.cache.put(key, result)
+
+        distance, path = result
+        return distance, list(path) if path is not None else None
+
+    def single_source(self, start: Any, metric_type: str = 'distance') -> Tuple[Dict[Any, float], Dict[Any, List[Any]]]:
+        """
+        Повертає результат `dijkstra` з однієї станції (дерево зберігається в кеші).
+
+        Шляхи відновлюються із збереженого дерева на кожен виклик; словник відстаней
+        спільний з кешем, тому його не слід змінювати.
+
+        Аргументи:
+            start (Any): Початкова станція.
+            metric_type (str): 'distance', 'time' або 'third_weight'.
+
+        Повертає:
+            Tuple[Dict[Any, float], Dict[Any, List[Any]]]: Відстані та шляхи до всіх досяжних станцій.
+        """
+        state = self._current_state()
+        tree = self.trees.get((state, start, metric_type))
+        if tree is MISSING:
+            tree = self._search(state, start, metric_type)
+        distances, parents = tree
+        paths: Dict[Any, List[Any]] = {start: [start]}
+        for node in distances:
+            if node not in paths:
+                # Шлях до станції — шлях до попередника з цією станцією в кінці
+                chain = [node]
+                while chain[-1] not in paths:
+                    chain.append(parents[chain[-1]])
+                prefix = paths[chain.pop()]
+                for current in reversed(chain):
+                    prefix = prefix + [current]
+                    paths[current] = prefix
+        return distances, paths
+
+    def clear(self) -> None:
+        """Видаляє всі записи кешу."""
+        self.cache.clear()
+        self.trees.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Повертає лічильники кешу для підбору його розміру.
+
+        Повертає:
+            Dict[str, Any]: Лічильники `QueryCache.stats` для маршрутів разом з 'source_trees'
+            (кількість збережених дерев), 'source_hits', 'searches' та 'invalidations'.
+        """
+        return {
+            **self.cache.stats(),
+            'source_trees': len(self.trees),
+            'source_hits': self.source_hits,
+            'searches': self.searches,
+            'invalidations': self.invalidations,
+        }
+
+    def _search(self, state: Tuple[int, int, int], start: Any, metric_type: str) -> SourceTree:
+        """Виконує `dijkstra` з однієї станції та зберігає дерево найкоротших шляхів."""
+        distances, paths = dijkstra(self.graph, start, metric_type=metric_type)
+        self.searches += 1
+        # Шляхи `dijkstra` утворюють дерево, тож достатньо передостанньої вершини кожного
+        parents = {node: path[-2] for node, path in paths.items() if len(path) > 1}
+        tree = (distances, parents)
+        self.trees.put((state, start, metric_type), tree)
+        return tree
+
+    def _current_state(self) -> Tuple[int, int, int]:
+        """Повертає стан графа, видаляючи записи попередніх станів після його зміни."""
+        state = graph_state(self.graph)
+        if state != self._state:
+            self.cache.discard_if(lambda key: key[0] != state)
+            self.trees.discard_if(lambda key: key[0] != state)
+            self._state = state
+            self.invalidations += 1
+        return state
+
+
+def _tree_path(tree: SourceTree, goal: Any) -> Optional[List[Any]]:
+    """Відновлює шлях від кореня дерева до станції за попередниками (None, якщо станція недосяжна)."""
+    distances, parents = tree
+    if goal not in distances:
+        return None
+    path = [goal]
+    while path[-1] in parents:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
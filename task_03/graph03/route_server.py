@@ -0,0 +1,322 @@
+"""
+Модуль з асинхронним сервером запитів маршрутів над транспортною мережею.
+
+`RouteServer` завантажує граф один раз і відповідає на запити JSON
+{"start": "15", "goal": "16", "metric": "time"} двома протоколами на одному сокеті
+(TCP або Unix):
+    - JSON по рядках: кожен рядок запиту — об'єкт JSON, кожен рядок відповіді — результат;
+    - HTTP: `GET /route?start=15&goal=16&metric=time`, `POST /route` з тілом JSON та `GET /stats`.
+Протокол визначається за першим рядком з'єднання.
+
+Пошук `dijkstra` виконується в пулі процесів, тож цикл подій не блокується.
+Процеси запускаються та отримують граф ще до прийому з'єднань (копією або
+відображенням знімка з `graph03.snapshot`, якщо вказано `snapshot_path`), тож перший
+запит не чекає на їх запуск. Кожен процес тримає `RouteCache`, і дерево найкоротших
+шляхів з однієї станції відповідає на наступні запити з неї без нового пошуку.
+Готові відповіді зберігаються в `QueryCache`, а однакові запити, що надійшли одночасно,
+чекають на один спільний пошук.
+Сервер розрахований на незмінний граф: процеси пулу не бачать змін графа після запуску.
+Якщо пошук у пулі завершився помилкою, клієнт отримує {"error": ...}, а пул з аварійно
+завершеним процесом перезапускається під час наступного пошуку.
+
+Використання:
+    server = RouteServer(graph, processes=4)
+    asyncio.run(server.serve(host='127.0.0.1', port=8765))
+"""
+
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from graph03.query_cache import MISSING, QueryCache, graph_state
+from graph03.route_cache import RouteCache
+from graph03.snapshot import load_snapshot
+
+METRICS = ('distance', 'time', 'third_weight')
+
+# Обмеження розміру рядка запиту та тіла HTTP (байти)
+MAX_REQUEST_BYTES = 64 * 1024
+
+_HTTP_METHODS = (b'GET ', b'POST ')
+_HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large',
+                 500: 'Internal Server Error'}
+
+_worker_routes: Optional[RouteCache] = None
+
+
+class RouteServer:
+    """
+    Асинхронний сервер запитів найкоротших маршрутів.
+
+    Атрибути:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        cache (QueryCache): Кеш готових відповідей.
+        requests (int): Кількість оброблених запитів маршрутів.
+        coalesced (int): Запити, що приєднались до вже запущеного однакового пошуку.
+        searches (int): Кількість пошуків, виконаних у пулі процесів.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        processes: Optional[int] = None,
+        max_entries: int = 4096,
+        ttl: Optional[float] = None,
+        snapshot_path: Optional[str] = None
+    ) -> None:
+        self.graph = graph
+        self.cache = QueryCache(max_entries, ttl)
+        self.requests = 0
+        self.coalesced = 0
+        self.searches = 0
+        self._processes = processes or os.cpu_count() or 1
+        self._snapshot_path = snapshot_path
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def start(self) -> None:
+        """Запускає пул процесів і чекає, доки процеси завантажать граф (викликається автоматично з `serve`)."""
+        if self._executor is None:
+            # Зі знімком процеси відображають файл у пам'ять, інакше отримують копію графа
+            source = None if self._snapshot_path else self.graph
+            self._executor = ProcessPoolExecutor(
+                self._processes, initializer=_init_worker, initargs=(source, self._snapshot_path)
+            )
+            executor = self._executor
+            loop = asyncio.get_running_loop()
+            try:
+                # Порожні завдання запускають процеси та їх ініціалізацію до першого запиту
+                await asyncio.gather(*(loop.run_in_executor(executor, _noop) for _ in range(self._processes)))
+            except BrokenProcessPool:
+                self._discard_pool(executor)
+                raise
+
+    def close(self) -> None:
+        """Зупиняє пул процесів."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _discard_pool(self, executor: ProcessPoolExecutor) -> None:
+        """Зупиняє пул з аварійно завершеним процесом, щоб наступний пошук запустив новий."""
+        # Одночасні пошуки можуть отримати помилку того самого пулу: новий пул не чіпаємо
+        if self._executor is executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def route(self, start: str, goal: str, metric_type: str = 'distance') -> Dict[str, Any]:
+        """
+        Повертає найкоротший маршрут між двома станціями.
+
+        Аргументи:
+            start (str): Початкова станція.
+            goal (str): Кінцева станція.
+            metric_type (str): 'distance', 'time' або 'third_weight'.
+
+        Повертає:
+            Dict[str, Any]: 'start', 'goal', 'metric', 'distance' (None, якщо станція
+            недосяжна) та 'path' (список станцій або None).
+
+        Raises:
+            ValueError: Якщо метрика невідома або станції немає в графі.
+            BrokenProcessPool: Якщо процес пулу аварійно завершився (наступний пошук
+                запустить новий пул).
+        """
+        if metric_type not in METRICS:
+            raise ValueError(f"unknown metric '{metric_type}'")
+        for node in (start, goal):
+            if node not in self.graph:
+                raise ValueError(f"unknown station '{node}'")
+        self.requests += 1
+
+        key = (graph_state(self.graph), start, goal, metric_type)
+        result = self.cache.get(key)
+        if result is MISSING:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self.coalesced += 1
+            else:
+                pending = asyncio.ensure_future(self._search(key))
+                self._inflight[key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+            # shield: скасування одного клієнта не скасовує спільний пошук для інших
+            result = await asyncio.shield(pending)
+
+        distance, path = result
+        return {
+            'start': start,
+            'goal': goal,
+            'metric': metric_type,
+            'distance': distance if math.isfinite(distance) else None,
+            'path': list(path) if path is not None else None,
+        }
+
+    async def handle_query(self, query: Any) -> Dict[str, Any]:
+        """
+        Обробляє розібраний запит JSON.
+
+        Аргументи:
+            query (Any): Об'єкт запиту з ключами 'start', 'goal' та необов'язковим 'metric'
+                або {"stats": true}.
+
+        Повертає:
+            Dict[str, Any]: Результат `route`, статистика або {"error": ...}.
+        """
+        return (await self._answer(query))[1]
+
+    async def _answer(self, query: Any) -> Tuple[int, Dict[str, Any]]:
+        """Повертає код статусу HTTP і відповідь на розібраний запит JSON."""
+        if not isinstance(query, dict):
+            return 400, {'error': 'request must be a JSON object'}
+        if query.get('stats'):
+            return 200, self.stats()
+        if 'start' not in query or 'goal' not in query:
+            return 400, {'error': "request must contain 'start' and 'goal'"}
+        try:
+            return 200, await self.route(str(query['start']), str(query['goal']), query.get('metric', 'distance'))
+        except ValueError as error:
+            return 400, {'error': str(error)}
+        except Exception as error:
+            # Помилка процесу пулу стосується лише цього запиту: з'єднання обслуговується далі
+            return 500, {'error': f'route search failed: {type(error).__name__}'}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Повертає лічильники сервера та кешу.
+
+        Повертає:
+            Dict[str, Any]: Лічильники `QueryCache.stats` разом з 'requests',
+            'coalesced', 'searches' та 'in_flight'.
+        """
+        return {
+            **self.cache.stats(),
+            'requests': self.requests,
+            'coalesced': self.coalesced,
+            'searches': self.searches,
+            'in_flight': len(self._inflight),
+        }
+
+    async def serve(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 8765,
+        unix_path: Optional[str] = None
+    ) -> None:
+        """
+        Запускає сервер і обробляє з'єднання до скасування.
+
+        Аргументи:
+            host (str): Адреса TCP.
+            port (int): Порт TCP.
+            unix_path (str, optional): Шлях до сокета Unix (замість TCP).
+        """
+        await self.start()
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(self._handle_connection, path=unix_path, limit=MAX_REQUEST_BYTES)
+        else:
+            server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_REQUEST_BYTES)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    async def _search(self, key: Tuple) -> Tuple[float, Optional[List[str]]]:
+        """Виконує пошук у пулі процесів і зберігає відповідь у кеші."""
+        await self.start()
+        executor = self._executor
+        _, start, goal, metric_type = key
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(executor, _route, start, goal, metric_type)
+        except BrokenProcessPool:
+            self._discard_pool(executor)
+            raise
+        self.searches += 1
+        self.cache.put(key, result)
+        return result
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Визначає протокол за першим рядком і обслуговує з'єднання."""
+        try:
+            line = await reader.readline()
+            if line.startswith(_HTTP_METHODS):
+                await self._handle_http(line, reader, writer)
+            else:
+                while line:
+                    if line.strip():
+                        _, body = await self._answer_line(line)
+                        writer.write(json.dumps(body, ensure_ascii=False).encode('utf-8') + b'\n')
+                        await writer.drain()
+                    line = await reader.readline()
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+            # ValueError — рядок довший за MAX_REQUEST_BYTES
+            pass
+        finally:
+            writer.close()
+
+    async def _answer_line(self, line: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Повертає код статусу HTTP і відповідь на рядок JSON."""
+        try:
+            query = json.loads(line)
+        except ValueError:
+            return 400, {'error': 'invalid JSON'}
+        return await self._answer(query)
+
+    async def _handle_http(self, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обробляє один запит HTTP/1.1 і закриває з'єднання."""
+        method, target = request_line.decode('latin-1').split()[:2]
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        if url.path == '/stats' and method == 'GET':
+            status, body = 200, self.stats()
+        elif url.path != '/route':
+            status, body = 404, {'error': 'not found'}
+        elif method == 'GET':
+            status, body = await self._answer(dict(parse_qsl(url.query)))
+        elif method == 'POST':
+            length = headers.get('content-length', '0')
+            length = int(length) if length.isdigit() else -1
+            if length < 0:
+                status, body = 400, {'error': 'invalid Content-Length'}
+            elif length > MAX_REQUEST_BYTES:
+                status, body = 413, {'error': 'request too large'}
+            else:
+                status, body = await self._answer_line(await reader.readexactly(length))
+        else:
+            status, body = 405, {'error': 'method not allowed'}
+
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_HTTP_REASONS[status]}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + payload
+        )
+        await writer.drain()
+
+
+def _init_worker(graph: Any, snapshot_path: Optional[str]) -> None:
+    """Зберігає граф і кеш маршрутів у процесі пулу (один раз на процес)."""
+    global _worker_routes
+    _worker_routes = RouteCache(load_snapshot(snapshot_path) if snapshot_path else graph)
+
+
+def _noop() -> None:
+    """Порожнє завдання для запуску процесів пулу."""
+
+
+def _route(start: str, goal: str, metric_type: str) -> Tuple[float, Optional[List[str]]]:
+    """Повертає маршрут до goal з кешу процесу, виконуючи `dijkstra` лише для нових станцій."""
+    return _worker_routes.shortest_path(start, goal, metric_type)
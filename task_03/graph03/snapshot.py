@@ -0,0 +1,130 @@
+"""
+Модуль для збереження побудованої транспортної мережі у бінарний знімок
+та його завантаження через `numpy.memmap`.
+
+Формат файлу:
+    - 8 байтів сигнатури `TNGRAPH1`;
+    - 8 байтів довжини заголовка (little-endian);
+    - заголовок JSON з описом масивів (зміщення, тип, форма);
+    - масиви, вирівняні на 64 байти: таблиця ідентифікаторів станцій (UTF-8 та зміщення),
+      `indptr`, `indices`, `edge_ids`, кінці ребер і колонки ваг.
+
+Під час завантаження масиви не читаються з диска, а відображаються в пам'ять
+лише для читання, тому кілька процесів-обробників спільно використовують ті самі
+сторінки кешу ОС, а запуск не потребує побудови графа з ребер.
+
+Використання:
+    - save_snapshot(graph, path): збереження `nx.Graph` або `CompactGraph`.
+    - load_snapshot(path) -> CompactGraph: завантаження з відображенням у пам'ять.
+"""
+
+import json
+import struct
+from typing import Any, Dict
+import numpy as np
+from graph03.compact_graph import CompactGraph
+
+MAGIC = b'TNGRAPH1'
+ALIGNMENT = 64
+
+_GRAPH_ARRAYS = ('indptr', 'indices', 'edge_ids', 'edge_sources', 'edge_targets')
+
+
+def save_snapshot(graph: Any, path: str) -> None:
+    """
+    Зберігає граф у бінарний файл знімка.
+
+    Аргументи:
+        graph (nx.Graph | CompactGraph): Граф транспортної мережі.
+        path (str): Шлях до файлу знімка.
+    """
+    compact = graph if isinstance(graph, CompactGraph) else CompactGraph.from_networkx(graph)
+
+    encoded = [str(node).encode('utf-8') for node in compact.node_ids]
+    node_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=node_offsets[1:])
+
+    arrays: Dict[str, np.ndarray] = {
+        'node_names': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+        'node_offsets': node_offsets,
+    }
+    for name in _GRAPH_ARRAYS:
+        arrays[name] = np.ascontiguousarray(getattr(compact, name))
+    for name, column in compact.weights.items():
+        arrays[f"weight:{name}"] = np.ascontiguousarray(column, dtype=np.float32)
+
+    # Зміщення рахуються від початку області даних, що йде одразу за заголовком
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({'arrays': layout}).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    with open(path, 'wb') as stream:
+        stream.write(MAGIC)
+        stream.write(struct.pack('<Q', len(header)))
+        stream.write(header)
+        for name, array in arrays.items():
+            stream.seek(data_start + layout[name]['offset'])
+            stream.write(array.tobytes())
+        stream.truncate(data_start + offset)
+
+
+def load_snapshot(path: str) -> CompactGraph:
+    """
+    Завантажує знімок графа з відображенням масивів у пам'ять (лише для читання).
+
+    Аргументи:
+        path (str): Шлях до файлу знімка.
+
+    Повертає:
+        CompactGraph: Граф, масиви якого є поданнями `numpy.memmap`.
+
+    Raises:
+        ValueError: Якщо файл не є знімком графа.
+    """
+    arrays = _map_arrays(path)
+
+    names = bytes(arrays['node_names'])
+    offsets = arrays['node_offsets'].tolist()
+    node_ids = [names[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+    weights = {
+        name[len('weight:'):]: array for name, array in arrays.items() if name.startswith('weight:')
+    }
+    return CompactGraph(node_ids, *(arrays[name] for name in _GRAPH_ARRAYS), weights)
+
+
+def _map_arrays(path: str) -> Dict[str, np.ndarray]:
+    """
+    Відображає файл знімка в пам'ять і повертає подання всіх масивів.
+
+    Аргументи:
+        path (str): Шлях до файлу знімка.
+
+    Повертає:
+        Dict[str, np.ndarray]: Масиви за назвами (подання одного відображення файлу).
+    """
+    with open(path, 'rb') as stream:
+        if stream.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a transport graph snapshot")
+        (header_length,) = struct.unpack('<Q', stream.read(8))
+        header = json.loads(stream.read(header_length).decode('utf-8'))
+
+    data_start = _align(len(MAGIC) + 8 + header_length)
+    mapping = np.memmap(path, dtype=np.uint8, mode='r')
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        start = data_start + spec['offset']
+        arrays[name] = mapping[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+    return arrays
+
+
+def _align(offset: int) -> int:
+    """Округлює зміщення вгору до кратного ALIGNMENT."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
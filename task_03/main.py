@@ -5,11 +5,17 @@
 візуалізації графа та виконання алгоритму Дейкстри для пошуку найкоротших шляхів.
 """
 
+import argparse
+
 from edges import weighted_edges
 
 from graph03.graph_creation import create_transport_network_graph, add_third_weight
-from graph03.graph_visualization import visualize_graph, visualize_path_on_weighted_graph
 from graph03.graph_search import dijkstra
+from graph03.degree_statistics import degree_statistics
+
+parser = argparse.ArgumentParser(description="Найкоротші шляхи в транспортній мережі (алгоритм Дейкстри).")
+parser.add_argument('--no-render', action='store_true', help="лише пошук, без збереження зображень")
+RENDER = not parser.parse_args().no_render
 
 # Створюємо граф
 transport_graph = create_transport_network_graph(weighted_edges)
@@ -17,29 +23,43 @@ transport_graph = create_transport_network_graph(weighted_edges)
 # Додаємо третю вагу до графа
 add_third_weight(transport_graph, alpha=0.4, beta=0.6)
 
-# Візуалізація графа з використанням відстані, часу та оптимізованої ваги
-visualize_graph(
-    transport_graph,
-    output_dir='task_03/results',
-    weight_type='distance',
-    filename='transport_network_graph_distance'
-)
-visualize_graph(
-    transport_graph,
-    output_dir='task_03/results',
-    weight_type='time',
-    filename='transport_network_graph_time'
-)
-visualize_graph(
-    transport_graph,
-    output_dir='task_03/results',
-    weight_type='third_weight',
-    filename='transport_network_graph_optimized'
-)
+# Статистика ступенів (розміри вузлів) спільна для всіх зображень
+degree_stats = degree_statistics(transport_graph)
+
+if RENDER:
+    # Модулі візуалізації (і matplotlib) імпортуються лише тоді, коли потрібні зображення
+    from graph03.graph_visualization import visualize_graph
+    from graph03.batch_rendering import render_route_images
+
+    # Візуалізація графа з використанням відстані, часу та оптимізованої ваги
+    visualize_graph(
+        transport_graph,
+        output_dir='task_03/results',
+        weight_type='distance',
+        filename='transport_network_graph_distance',
+        degree_stats=degree_stats
+    )
+    visualize_graph(
+        transport_graph,
+        output_dir='task_03/results',
+        weight_type='time',
+        filename='transport_network_graph_time',
+        degree_stats=degree_stats
+    )
+    visualize_graph(
+        transport_graph,
+        output_dir='task_03/results',
+        weight_type='third_weight',
+        filename='transport_network_graph_optimized',
+        degree_stats=degree_stats
+    )
 
 START_NODE = '15'
 END_VERTEX = '16'
 
+# Маршрути для візуалізації: (шлях, тип ваги, ім'я файлу)
+route_jobs = []
+
 #######################################################
 # Виклик функції Дейкстри для відстаней
 path_metrics, paths_len = dijkstra(transport_graph, START_NODE, metric_type='distance')
@@ -54,14 +74,7 @@ for node in sorted(path_metrics.keys(), key=int):
 
 path_to_visualize_len = paths_len[END_VERTEX]
 
-# Візуалізація найкоротшого шляху
-visualize_path_on_weighted_graph(
-    transport_graph,
-    path_to_visualize_len,
-    output_dir='task_03/results',
-    filename='path_15_to_16_len',
-    weight_type='distance'
-)
+route_jobs.append((path_to_visualize_len, 'distance', 'path_15_to_16_len'))
 
 #######################################################
 # Виклик функції Дейкстри для часу
@@ -77,14 +90,7 @@ for node in sorted(time_metrics.keys(), key=int):
 
 path_to_visualize_time = paths_time[END_VERTEX]
 
-# Візуалізація найшвидшого шляху
-visualize_path_on_weighted_graph(
-    transport_graph,
-    path_to_visualize_time,
-    output_dir='task_03/results',
-    filename='path_15_to_16_time',
-    weight_type='time'
-)
+route_jobs.append((path_to_visualize_time, 'time', 'path_15_to_16_time'))
 
 #######################################################
 # Виклик функції Дейкстри для оптимізованої ваги
@@ -100,11 +106,9 @@ for node in sorted(opt_metrics.keys(), key=int):
 
 path_to_visualize_opt = paths_opt[END_VERTEX]
 
-# Візуалізація найкоротшого шляху
-visualize_path_on_weighted_graph(
-    transport_graph,
-    path_to_visualize_opt,
-    output_dir='task_03/results',
-    filename='path_15_to_16_opt',
-    weight_type='third_weight'
-)
+route_jobs.append((path_to_visualize_opt, 'third_weight', 'path_15_to_16_opt'))
+
+#######################################################
+# Візуалізація всіх маршрутів на спільному статичному шарі мережі
+if RENDER:
+    render_route_images(transport_graph, route_jobs, output_dir='task_03/results', degree_stats=degree_stats)
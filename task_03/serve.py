@@ -0,0 +1,48 @@
+"""
+Сервер запитів найкоротших маршрутів у транспортній мережі.
+
+Граф будується (або завантажується зі знімка) один раз, після чого сервер
+відповідає на запити JSON по рядках або HTTP, наприклад:
+    curl 'http://127.0.0.1:8765/route?start=15&goal=16&metric=time'
+    echo '{"start": "15", "goal": "16", "metric": "distance"}' | nc -N 127.0.0.1 8765
+"""
+
+import argparse
+import asyncio
+
+from edges import weighted_edges
+
+from graph03.graph_creation import create_transport_network_graph, add_third_weight
+from graph03.route_server import RouteServer
+from graph03.snapshot import load_snapshot
+
+parser = argparse.ArgumentParser(description="Сервер запитів найкоротших маршрутів (алгоритм Дейкстри).")
+parser.add_argument('--host', default='127.0.0.1', help="адреса TCP")
+parser.add_argument('--port', type=int, default=8765, help="порт TCP")
+parser.add_argument('--unix', help="шлях до сокета Unix замість TCP")
+parser.add_argument('--processes', type=int, help="кількість процесів пошуку (за замовчуванням — усі ядра)")
+parser.add_argument('--snapshot', help="знімок графа (graph03.snapshot) замість edges.py")
+parser.add_argument('--cache-size', type=int, default=4096, help="максимальна кількість відповідей у кеші")
+parser.add_argument('--ttl', type=float, help="час життя відповіді в кеші, секунди")
+args = parser.parse_args()
+
+if args.snapshot:
+    transport_graph = load_snapshot(args.snapshot)
+else:
+    # Той самий граф, що й у main.py
+    transport_graph = create_transport_network_graph(weighted_edges)
+    add_third_weight(transport_graph, alpha=0.4, beta=0.6)
+
+server = RouteServer(
+    transport_graph,
+    processes=args.processes,
+    max_entries=args.cache_size,
+    ttl=args.ttl,
+    snapshot_path=args.snapshot
+)
+
+print(f"Сервер маршрутів: {args.unix or f'{args.host}:{args.port}'}")
+try:
+    asyncio.run(server.serve(host=args.host, port=args.port, unix_path=args.unix))
+except KeyboardInterrupt:
+    pass
@@ -0,0 +1,42 @@
+"""
+Спільні налаштування тестів.
+
+Пакети `graph01`, `graph02` і `graph03` лежать у каталогах завдань, а генератор мереж —
+у `benchmarks`, тож ці каталоги додаються до шляху пошуку модулів. Модулі `edges.py`
+завдань мають однакові назви, тому тести будують мережі генератором, а не імпортують їх.
+"""
+
+import os
+import sys
+
+import networkx as nx
+import pytest
+
+# Зображення в тестах малюються без вікон
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ('task_01', 'task_02', 'task_03', 'benchmarks'):
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from network_generator import generate_edges, generate_weighted_edges  # noqa: E402
+
+
+@pytest.fixture
+def network() -> nx.Graph:
+    """Незважена синтетична мережа з 300 станцій."""
+    graph = nx.Graph()
+    graph.add_edges_from(generate_edges(300, seed=7))
+    return graph
+
+
+@pytest.fixture
+def weighted_network() -> nx.Graph:
+    """Зважена синтетична мережа з 300 станцій з вагами distance, time і third_weight."""
+    graph = nx.Graph()
+    graph.add_edges_from(generate_weighted_edges(300, average_degree=2.6, seed=7))
+    for _, _, data in graph.edges(data=True):
+        data['third_weight'] = 0.4 * data['distance'] + 0.6 * data['time']
+    return graph
@@ -0,0 +1,32 @@
+"""Тести векторного find_adjusted_positions_batch порівняно з поелементним варіантом."""
+
+import importlib
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(params=['graph02.utils', 'graph03.utils'])
+def utils(request):
+    return importlib.import_module(request.param)
+
+
+def test_batch_matches_scalar_version(utils):
+    generator = np.random.default_rng(0)
+    starts = generator.normal(size=(50, 2))
+    ends = generator.normal(size=(50, 2))
+    start_sizes = generator.uniform(0.0, 0.1, size=50)
+    end_sizes = generator.uniform(0.0, 0.1, size=50)
+
+    batch_starts, batch_ends = utils.find_adjusted_positions_batch(starts, ends, start_sizes, end_sizes)
+    for i in range(50):
+        expected_start, expected_end = utils.find_adjusted_positions(starts[i], ends[i], start_sizes[i], end_sizes[i])
+        np.testing.assert_allclose(batch_starts[i], expected_start)
+        np.testing.assert_allclose(batch_ends[i], expected_end)
+
+
+def test_zero_length_segments_stay_in_place(utils):
+    points = np.array([[1.0, 2.0], [3.0, 4.0]])
+    starts, ends = utils.find_adjusted_positions_batch(points, points, 0.5, 0.5)
+    np.testing.assert_array_equal(starts, points)
+    np.testing.assert_array_equal(ends, points)
@@ -0,0 +1,39 @@
+"""Тести пакетного малювання маршрутів (graph03.batch_rendering)."""
+
+import os
+
+import matplotlib.image
+import networkx as nx
+import numpy as np
+
+from graph03.batch_rendering import render_route_images
+from graph03.centrality import centrality
+
+
+def test_renders_one_image_per_job(weighted_network, tmp_path):
+    graph = weighted_network.subgraph(list(weighted_network)[:60]).copy()
+    start = next(iter(graph))
+    paths = nx.single_source_dijkstra_path(graph, start, weight='time')
+    targets = [node for node in paths if node != start][:3]
+    jobs = [(paths[target], weight, f"route_{target}_{weight}") for target in targets for weight in ('distance', 'time')]
+
+    filepaths = render_route_images(graph, jobs, output_dir=str(tmp_path), processes=1)
+    assert [os.path.basename(path) for path in filepaths] == [f"{name}.png" for _, _, name in jobs]
+
+    images = [matplotlib.image.imread(path) for path in filepaths]
+    assert len({image.shape for image in images}) == 1
+    # Різні маршрути на спільному фоні дають різні зображення
+    assert not np.array_equal(images[0], images[2])
+
+
+def test_nodes_sized_by_centrality(weighted_network, tmp_path):
+    graph = weighted_network.subgraph(list(weighted_network)[:60]).copy()
+    path_nodes = nx.shortest_path(graph, *list(graph)[:2])
+
+    by_degree, = render_route_images(graph, [(path_nodes, 'time', 'degree')], output_dir=str(tmp_path))
+    by_betweenness, = render_route_images(
+        graph, [(path_nodes, 'time', 'betweenness')], output_dir=str(tmp_path),
+        centrality_stats=centrality(graph, processes=1)
+    )
+
+    assert not np.array_equal(matplotlib.image.imread(by_degree), matplotlib.image.imread(by_betweenness))
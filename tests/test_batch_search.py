@@ -0,0 +1,47 @@
+"""Тести пакетного алгоритму Дейкстри (graph03.batch_search) порівняно з networkx."""
+
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph03.batch_search import batch_dijkstra, predecessor_path
+from graph03.compact_graph import CompactGraph
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_distances_match_networkx(weighted_network, processes):
+    weighted_network.add_edge('x', 'y', distance=1.0, time=1.0, third_weight=1.0)
+    compact = CompactGraph.from_networkx(weighted_network)
+    sources = list(weighted_network)[:12]
+    results = batch_dijkstra(compact, sources, ('distance', 'time'), processes=processes)
+
+    for metric, (distances, predecessors) in results.items():
+        assert distances.shape == predecessors.shape == (len(sources), compact.number_of_nodes())
+        for row, source in enumerate(sources):
+            expected = nx.single_source_dijkstra_path_length(weighted_network, source, weight=metric)
+            for node in weighted_network:
+                actual = distances[row, compact.index_of(node)]
+                if node in expected:
+                    assert actual == pytest.approx(expected[node], rel=1e-5)
+                else:
+                    assert math.isinf(actual)
+
+
+def test_predecessor_paths_are_shortest(weighted_network):
+    compact = CompactGraph.from_networkx(weighted_network)
+    sources = list(weighted_network)[:3]
+    distances, predecessors = batch_dijkstra(compact, sources, ('time',))['time']
+    for row, source in enumerate(sources):
+        for target in list(weighted_network)[::37]:
+            path = predecessor_path(compact, predecessors[row], source, target)
+            length = sum(weighted_network[u][v]['time'] for u, v in zip(path, path[1:]))
+            assert path[0] == source and path[-1] == target
+            assert length == pytest.approx(distances[row, compact.index_of(target)], rel=1e-5)
+
+
+def test_unknown_metric_is_rejected(weighted_network):
+    with pytest.raises(ValueError):
+        batch_dijkstra(weighted_network, ['1'], ('speed',))
+    assert isinstance(batch_dijkstra(weighted_network, ['1'])['distance'][0], np.ndarray)
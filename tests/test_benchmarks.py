@@ -0,0 +1,38 @@
+"""Тести генератора мереж і набору бенчмарків порівняно з networkx."""
+
+import networkx as nx
+import pytest
+
+from network_generator import generate_edges, generate_weighted_edges
+from run_benchmarks import ENGINES, build_network, run_benchmarks
+
+
+@pytest.mark.parametrize('num_nodes', [50, 500])
+def test_generated_network_is_connected(num_nodes):
+    graph = nx.Graph()
+    graph.add_edges_from(generate_edges(num_nodes, seed=1))
+    assert graph.number_of_nodes() == num_nodes
+    assert nx.is_connected(graph)
+    assert generate_weighted_edges(num_nodes, seed=1) == generate_weighted_edges(num_nodes, seed=1)
+
+
+def test_network_representations_agree():
+    network = build_network(300, 2.32, seed=3)
+    for compact in (network.search_compact, network.analysis_compact):
+        assert compact.number_of_nodes() == network.graph.number_of_nodes()
+        assert compact.number_of_edges() == network.graph.number_of_edges()
+    assert len(network.route) - 1 == nx.shortest_path_length(network.graph, network.start, network.goal)
+
+
+def test_analysis_engines_run_separately():
+    engines = ['path_statistics', 'path_statistics_approximate', 'centrality', 'resilience', 'bfs']
+    report = run_benchmarks([200], engines, repeats=1, memory=False, log=None)
+    assert [record['engine'] for record in report['results']] == engines
+    assert all(record['status'] == 'ok' for record in report['results'])
+    assert ENGINES['path_statistics_approximate'].max_nodes >= 10_000
+
+
+def test_rendering_engines_run():
+    engines = ['visualize_path', 'visualize_weighted_path', 'batch_rendering']
+    report = run_benchmarks([60], engines, repeats=1, memory=False, log=None)
+    assert all(record['status'] == 'ok' for record in report['results'])
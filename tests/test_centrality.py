@@ -0,0 +1,90 @@
+"""Тести центральностей `graph01.centrality` (та копій у graph02, graph03), їх додавання в `analyze_graph`
+і розмірів вузлів у візуалізації."""
+
+import importlib
+
+import matplotlib.image
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph01.centrality import centrality, centrality_node_sizes
+from graph01.graph_analysis import analyze_graph
+
+
+def test_exact_matches_networkx(network):
+    network.add_edge('x', 'y')
+    stats = centrality(network, processes=1)
+    betweenness = nx.betweenness_centrality(network)
+    closeness = nx.closeness_centrality(network)
+
+    assert stats['nodes'] == list(network.nodes())
+    assert stats['betweenness'] == pytest.approx([betweenness[node] for node in stats['nodes']])
+    assert stats['closeness'] == pytest.approx([closeness[node] for node in stats['nodes']])
+    assert stats['error_bound'] == 0.0
+    assert stats['bottlenecks'][0] == max(betweenness, key=betweenness.get)
+
+
+def test_parallel_matches_sequential(network):
+    sequential = centrality(network, processes=1)
+    parallel = centrality(network, processes=2)
+
+    assert parallel['betweenness'] == pytest.approx(sequential['betweenness'])
+    assert parallel['closeness'] == pytest.approx(sequential['closeness'])
+
+
+def test_approximate_within_error_bound():
+    graph = nx.grid_2d_graph(30, 30)
+    stats = centrality(graph, mode='approximate', epsilon=0.1, processes=1)
+    betweenness = nx.betweenness_centrality(graph)
+
+    assert stats['sources'] < graph.number_of_nodes()
+    errors = np.abs(stats['betweenness'] - [betweenness[node] for node in stats['nodes']])
+    assert errors.max() <= stats['error_bound']
+
+
+def test_invalid_mode(network):
+    with pytest.raises(ValueError):
+        centrality(network, mode='sampled')
+
+
+@pytest.mark.parametrize('package', ['graph01', 'graph02', 'graph03'])
+def test_node_sizes(network, package):
+    module = importlib.import_module(f'{package}.centrality')
+    sizes = module.centrality_node_sizes(module.centrality(network, processes=1))
+
+    assert sizes.min() >= module.MIN_NODE_SIZE
+    assert sizes.max() == pytest.approx(module.MAX_NODE_SIZE)
+    assert sizes == pytest.approx(centrality_node_sizes(centrality(network, processes=1)))
+
+
+def test_analyze_graph_computes_centrality_on_request(network):
+    assert 'bottlenecks' not in analyze_graph(network)
+
+    results = analyze_graph(network, compute_centrality=True)
+    betweenness = nx.betweenness_centrality(network)
+    assert results['betweenness_centrality'] == pytest.approx(betweenness)
+
+    precomputed = centrality(network, processes=1)
+    assert analyze_graph(network, centrality_stats=precomputed)['bottlenecks'] == precomputed['bottlenecks']
+
+
+def _render_twice(render, graph, path_nodes, tmp_path):
+    """Малює шлях з розмірами вузлів за ступенем і за центральністю та повертає обидва зображення."""
+    stats = centrality(graph, processes=1)
+    render(graph, path_nodes, output_dir=str(tmp_path), filename='degree')
+    render(graph, path_nodes, output_dir=str(tmp_path), filename='betweenness', centrality_stats=stats)
+    return [matplotlib.image.imread(str(tmp_path / f'{name}.png')) for name in ('degree', 'betweenness')]
+
+
+def test_path_renderers_size_nodes_by_centrality(weighted_network, tmp_path):
+    from graph02.graph_visualization import visualize_path_on_graph
+    from graph03.graph_visualization import visualize_path_on_weighted_graph
+
+    graph = weighted_network.subgraph(list(weighted_network)[:60]).copy()
+    path_nodes = nx.shortest_path(graph, *list(graph)[:2])
+
+    for render in (visualize_path_on_graph, visualize_path_on_weighted_graph):
+        by_degree, by_betweenness = _render_twice(render, graph, path_nodes, tmp_path)
+        assert by_degree.shape == by_betweenness.shape
+        assert not np.array_equal(by_degree, by_betweenness)
@@ -0,0 +1,79 @@
+"""Тести компактного графа CSR (усі три копії модуля) порівняно з networkx."""
+
+import importlib
+
+import networkx as nx
+import numpy as np
+import pytest
+
+MODULES = ['graph01.compact_graph', 'graph02.compact_graph', 'graph03.compact_graph']
+
+
+@pytest.fixture(params=MODULES)
+def compact_module(request):
+    return importlib.import_module(request.param)
+
+
+def test_from_networkx_matches_graph(compact_module, weighted_network):
+    compact = compact_module.CompactGraph.from_networkx(weighted_network)
+
+    assert compact.nodes() == list(weighted_network.nodes())
+    assert compact.number_of_edges() == weighted_network.number_of_edges()
+    for node in weighted_network:
+        assert set(compact.neighbors(node)) == set(weighted_network.neighbors(node))
+        assert compact.degree(node) == weighted_network.degree(node)
+    for u, v, data in compact.edges(data=True):
+        assert data['distance'] == pytest.approx(weighted_network[u][v]['distance'], rel=1e-6)
+    assert set(map(frozenset, compact.to_networkx().edges())) == set(map(frozenset, weighted_network.edges()))
+
+
+def test_self_loops_count_twice_in_degree(compact_module, network):
+    network.add_edge('1', '1')
+    network.add_edge('5', '5')
+    compact = compact_module.CompactGraph.from_networkx(network)
+
+    assert compact.number_of_edges() == network.number_of_edges()
+    assert compact.degree().tolist() == [degree for _, degree in network.degree()]
+    for node in ('1', '5', '2'):
+        assert compact.degree(node) == network.degree(node)
+
+
+def test_from_edges_merges_duplicates(compact_module):
+    edges = [('a', 'b', {'distance': 1.0}), ('b', 'c', {'distance': 2.0}), ('b', 'a', {'distance': 5.0})]
+    compact = compact_module.CompactGraph.from_edges(edges)
+    expected = nx.Graph()
+    expected.add_edges_from(edges)
+
+    assert compact.number_of_edges() == expected.number_of_edges()
+    assert set(compact.neighbors('b')) == set(expected.neighbors('b'))
+    assert dict(((u, v), d['distance']) for u, v, d in compact.edges(data=True))[('a', 'b')] == 5.0
+
+
+def test_non_numeric_attributes_are_skipped(compact_module):
+    graph = nx.Graph()
+    graph.add_edge('a', 'b', distance=1.5, name='Line 1')
+    graph.add_edge('b', 'c', distance=2.5, name='Line 2')
+
+    for compact in (
+        compact_module.CompactGraph.from_networkx(graph),
+        compact_module.CompactGraph.from_edges(graph.edges(data=True)),
+    ):
+        assert set(compact.weights) == {'distance'}
+        assert compact.weights['distance'].tolist() == [1.5, 2.5]
+
+
+def test_bfs_levels_and_components(compact_module, network):
+    network.add_edge('x', 'y')
+    compact = compact_module.CompactGraph.from_networkx(network)
+
+    source = compact.index_of('1')
+    expected = nx.single_source_shortest_path_length(network, '1')
+    levels = compact_module.bfs_levels(compact, source)
+    for node in network:
+        assert levels[compact.index_of(node)] == expected.get(node, -1)
+
+    count, labels = compact_module.connected_component_labels(compact)
+    assert count == nx.number_connected_components(network)
+    for component in nx.connected_components(network):
+        assert len({labels[compact.index_of(node)] for node in component}) == 1
+    assert np.unique(labels).size == count
@@ -0,0 +1,35 @@
+"""Тести векторизованого обчислення складених ваг у graph03.graph_creation."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph03.compact_graph import CompactGraph
+from graph03.graph_creation import add_third_weight, compute_composite_weights
+
+
+def test_add_third_weight_matches_per_edge_formula(weighted_network):
+    expected = {
+        (u, v): round(0.3 * data['distance'] + 0.7 * data['time'], 2)
+        for u, v, data in weighted_network.edges(data=True)
+    }
+    add_third_weight(weighted_network, 0.3, 0.7)
+    assert nx.get_edge_attributes(weighted_network, 'third_weight') == pytest.approx(expected)
+
+
+def test_compact_graph_gets_same_columns(weighted_network):
+    compact = CompactGraph.from_networkx(weighted_network)
+    results = compute_composite_weights(
+        compact,
+        {'mixed': (0.5, 0.5), 'speed': lambda columns: columns['distance'] / columns['time']},
+    )
+    for u, v, data in compact.edges(data=True):
+        source = weighted_network[u][v]
+        assert data['mixed'] == pytest.approx(0.5 * source['distance'] + 0.5 * source['time'], rel=1e-5)
+        assert data['speed'] == pytest.approx(source['distance'] / source['time'], rel=1e-5)
+    assert isinstance(results['mixed'], np.ndarray)
+
+
+def test_write_back_false_leaves_graph_untouched(weighted_network):
+    compute_composite_weights(weighted_network, {'fresh': (1.0, 1.0)}, write_back=False)
+    assert not nx.get_edge_attributes(weighted_network, 'fresh')
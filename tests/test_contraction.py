@@ -0,0 +1,57 @@
+"""Тести індексу ієрархій стиснення `graph03.contraction` порівняно з networkx."""
+
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph03.contraction import ContractionIndex
+
+
+@pytest.fixture
+def index(weighted_network):
+    return ContractionIndex.build(weighted_network, processes=1)
+
+
+@pytest.mark.parametrize('metric', ['distance', 'time', 'third_weight'])
+def test_query_matches_networkx(index, weighted_network, metric):
+    rng = random.Random(3)
+    nodes = list(weighted_network)
+    for _ in range(40):
+        start, goal = rng.sample(nodes, 2)
+        distance, path = index.query(start, goal, metric)
+        expected = nx.dijkstra_path_length(weighted_network, start, goal, weight=metric)
+
+        assert distance == pytest.approx(expected)
+        assert path[0] == start and path[-1] == goal
+        assert nx.path_weight(weighted_network, path, metric) == pytest.approx(expected)
+
+
+def test_query_same_and_unreachable_station(weighted_network):
+    weighted_network.add_edge('x', 'y', distance=1.0, time=1.0, third_weight=1.0)
+    index = ContractionIndex.build(weighted_network, processes=1)
+
+    assert index.query('1', '1') == (0.0, ['1'])
+    distance, path = index.query('1', 'x')
+    assert distance == np.inf and path is None
+
+
+def test_unknown_metric(index):
+    with pytest.raises(ValueError):
+        index.query('1', '2', 'cost')
+
+
+@pytest.mark.parametrize('filename', ['index.npz', 'index'])
+def test_save_and_load(index, weighted_network, tmp_path, filename):
+    path = str(tmp_path / filename)
+    index.save(path)
+    loaded = ContractionIndex.load(path, weighted_network)
+
+    for goal in ['2', '150', '299']:
+        assert loaded.query('1', goal, 'time') == index.query('1', goal, 'time')
+
+    other = nx.Graph()
+    other.add_edge('a', 'b', distance=1.0)
+    with pytest.raises(ValueError):
+        ContractionIndex.load(path, other)
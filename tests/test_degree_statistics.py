@@ -0,0 +1,38 @@
+"""Тести статистики ступенів (degree_statistics, усі три копії) порівняно з networkx."""
+
+import importlib
+
+import networkx as nx
+import numpy as np
+import pytest
+
+
+@pytest.fixture(params=['graph01.degree_statistics', 'graph02.degree_statistics', 'graph03.degree_statistics'])
+def degree_module(request):
+    return importlib.import_module(request.param)
+
+
+def test_matches_networkx_degrees(degree_module, network):
+    statistics = degree_module.degree_statistics(network)
+    degrees = dict(network.degree())
+
+    assert statistics['nodes'] == list(network.nodes())
+    assert statistics['degrees'].tolist() == [degrees[node] for node in network]
+    assert statistics['histogram'].tolist() == nx.degree_histogram(network)
+    assert statistics['max'] == max(degrees.values())
+    assert statistics['average'] == pytest.approx(sum(degrees.values()) / len(degrees))
+    assert set(statistics['hubs']) == {
+        node for node, degree in degrees.items() if degree >= statistics['hub_threshold']
+    }
+    assert list(statistics['degree_count']) == list(dict.fromkeys(degrees.values()))
+
+
+def test_compact_graph_gives_same_statistics(degree_module, network):
+    expected = degree_module.degree_statistics(network)
+    compact_module = importlib.import_module(degree_module.__name__.replace('degree_statistics', 'compact_graph'))
+    actual = degree_module.degree_statistics(compact_module.CompactGraph.from_networkx(network))
+    assert actual['degree_count'] == expected['degree_count']
+    np.testing.assert_array_equal(
+        degree_module.scaled_node_sizes(network, expected),
+        degree_module.NODE_SIZE_PER_DEGREE * actual['degrees']
+    )
@@ -0,0 +1,44 @@
+"""Тести динамічних найкоротших шляхів (graph03.dynamic_paths) порівняно з networkx."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from graph03.dynamic_paths import DynamicShortestPaths
+
+
+def test_updates_match_fresh_dijkstra(weighted_network):
+    tree = DynamicShortestPaths(weighted_network, '1', 'time')
+    generator = random.Random(5)
+    edges = list(weighted_network.edges())
+
+    for _ in range(40):
+        u, v = generator.choice(edges)
+        weight = weighted_network[u][v]['time'] * generator.choice([0.2, 0.7, 1.5, 4.0])
+        tree.update_edge_weight(u, v, weight)
+
+        expected = nx.single_source_dijkstra_path_length(weighted_network, '1', weight='time')
+        assert tree.distances == pytest.approx(expected)
+        for target in list(expected)[::29]:
+            assert nx.path_weight(weighted_network, tree.path(target), 'time') == pytest.approx(expected[target])
+
+
+def test_negative_weight_is_rejected(weighted_network):
+    tree = DynamicShortestPaths(weighted_network, '1')
+    u, v = next(iter(weighted_network.edges()))
+    with pytest.raises(ValueError):
+        tree.update_edge_weight(u, v, -1.0)
+
+
+def test_ties_between_unorderable_labels():
+    graph = nx.Graph()
+    graph.add_edge('s', 'h', distance=10.0)
+    for node in ('a', 2):
+        graph.add_edge('h', node, distance=1.0)
+        graph.add_edge('s', node, distance=20.0)
+    tree = DynamicShortestPaths(graph, 's')
+
+    for weight in (1.0, 10.0):
+        tree.update_edge_weight('s', 'h', weight)
+        assert tree.distances == pytest.approx(nx.single_source_dijkstra_path_length(graph, 's', weight='distance'))
@@ -0,0 +1,101 @@
+"""Тести потокового завантаження ребер (graph03.edge_loader) порівняно з networkx."""
+
+import gzip
+import json
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph03.compact_graph import CompactGraph
+from graph03.edge_loader import iter_edge_chunks, iter_weighted_edges, load_compact_graph
+
+
+def _write_csv(path, edges):
+    with open(path, 'w', encoding='utf-8') as stream:
+        stream.write('source,target,distance,time\n')
+        for u, v, data in edges:
+            stream.write(f"{u},{v},{data['distance']},{data['time']}\n")
+        stream.write('\n')
+
+
+def test_csv_matches_networkx_graph(weighted_network, tmp_path):
+    path = str(tmp_path / 'edges.csv')
+    edges = list(weighted_network.edges(data=True))
+    _write_csv(path, edges)
+
+    loaded = nx.Graph()
+    loaded.add_edges_from(iter_weighted_edges(path, chunk_size=50))
+    assert set(map(frozenset, loaded.edges())) == set(map(frozenset, weighted_network.edges()))
+    for u, v, data in loaded.edges(data=True):
+        assert data['time'] == pytest.approx(weighted_network[u][v]['time'])
+
+    compact = load_compact_graph(path, chunk_size=50)
+    assert compact.number_of_edges() == weighted_network.number_of_edges()
+    for u, v, data in compact.edges(data=True):
+        assert data['distance'] == pytest.approx(weighted_network[u][v]['distance'], rel=1e-6)
+
+
+def test_text_and_gzip_formats(tmp_path):
+    plain = tmp_path / 'edges.txt'
+    plain.write_text('# comment\n1 2\n2 3\n\n3 1\n', encoding='utf-8')
+    chunks = list(iter_edge_chunks(str(plain)))
+    assert chunks[0].sources == ['1', '2', '3'] and not chunks[0].weights
+
+    packed = tmp_path / 'edges.tsv.gz'
+    with gzip.open(packed, 'wt', encoding='utf-8') as stream:
+        stream.write('source\ttarget\ttime\na\tb\t1.5\n')
+    assert list(iter_weighted_edges(str(packed))) == [('a', 'b', {'time': 1.5})]
+
+
+def test_row_width_mismatch_reports_line(tmp_path):
+    path = tmp_path / 'edges.csv'
+    path.write_text('source,target,distance,time\n1,2,3.0,4.0\n2,3,5.0\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='line 3'):
+        list(iter_edge_chunks(str(path)))
+
+
+def test_non_numeric_columns(tmp_path):
+    path = tmp_path / 'edges.csv'
+    path.write_text('source,target,line,time\n1,2,Red,1.5\n2,3,Blue,2.5\n', encoding='utf-8')
+    assert list(iter_weighted_edges(str(path))) == [('1', '2', {'time': 1.5}), ('2', '3', {'time': 2.5})]
+
+    path.write_text('source,target,time\n1,2,1.5\n2,3,slow\n', encoding='utf-8')
+    with pytest.raises(ValueError, match="line 3: column 'time'"):
+        list(iter_edge_chunks(str(path)))
+
+
+def test_explicit_columns_skip_csv_header(tmp_path):
+    path = tmp_path / 'edges.csv'
+    path.write_text('source,target,time\n1,2,1.5\n', encoding='utf-8')
+    assert list(iter_weighted_edges(str(path), columns=['source', 'target', 'time'])) == [('1', '2', {'time': 1.5})]
+
+    path.write_text('1,2,1.5\n2,3,2.5\n', encoding='utf-8')
+    chunk = next(iter_edge_chunks(str(path), columns=['source', 'target', 'time']))
+    assert chunk.sources == ['1', '2']
+
+
+def test_ndjson_takes_union_of_weights(tmp_path):
+    path = tmp_path / 'edges.jsonl'
+    records = [
+        {'source': 1, 'target': 2, 'distance': 1.0, 'name': 'Line 1'},
+        {'source': 2, 'target': 3, 'distance': 2.0, 'time': 4.0},
+        {'source': 3, 'target': 4, 'time': 5.0},
+    ]
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records), encoding='utf-8')
+
+    chunk = next(iter_edge_chunks(str(path)))
+    assert set(chunk.weights) == {'distance', 'time'}
+    np.testing.assert_array_equal(chunk.weights['time'], [np.nan, 4.0, 5.0])
+
+    # Колонка 'time' з'являється лише в другій частині, але лишається вирівняною з ребрами
+    compact = load_compact_graph(str(path), chunk_size=1)
+    times = {(u, v): data['time'] for u, v, data in compact.edges(data=True)}
+    assert np.isnan(times[('1', '2')]) and times[('2', '3')] == 4.0 and times[('3', '4')] == 5.0
+
+
+def test_from_arrays_rejects_misaligned_columns():
+    with pytest.raises(ValueError):
+        CompactGraph.from_arrays(['a', 'b', 'c'], [0, 1], [1, 2], {'time': [1.0]})
+    with pytest.raises(ValueError):
+        CompactGraph.from_arrays(['a', 'b', 'c'], [0, 1], [1])
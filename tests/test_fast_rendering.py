@@ -0,0 +1,48 @@
+"""Тести пакетного малювання (fast_rendering, усі три копії) порівняно з об'єктами nx.draw."""
+
+import importlib
+
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection, PathCollection
+
+
+@pytest.fixture(params=['graph01.fast_rendering', 'graph02.fast_rendering', 'graph03.fast_rendering'])
+def rendering(request):
+    module = importlib.import_module(request.param)
+    yield module
+    plt.close('all')
+
+
+def test_bulk_drawing_uses_one_collection_per_layer(rendering):
+    graph = nx.grid_2d_graph(20, 20)
+    pos = {node: np.array(node, dtype=np.float64) for node in graph}
+    _, ax = plt.subplots()
+    rendering.draw_graph_bulk(graph, pos, [10] * graph.number_of_nodes(), ax=ax)
+
+    lines = [item for item in ax.collections if isinstance(item, LineCollection)]
+    points = [item for item in ax.collections if isinstance(item, PathCollection)]
+    assert len(lines) == 1 and len(points) == 1
+    assert len(lines[0].get_segments()) == graph.number_of_edges()
+    assert len(points[0].get_offsets()) == graph.number_of_nodes()
+    assert not ax.texts
+
+
+def test_small_graphs_keep_labels_and_arrows(rendering):
+    graph = nx.path_graph(4)
+    pos = nx.circular_layout(graph)
+    _, ax = plt.subplots()
+    rendering.draw_graph_bulk(graph, pos, [100] * 4, ax=ax)
+    assert sorted(text.get_text() for text in ax.texts) == ['0', '1', '2', '3']
+
+    quiver = rendering.draw_arrows_bulk(np.zeros((3, 2)), np.ones((3, 2)), ax=ax)
+    assert quiver.N == 3
+    assert rendering.draw_arrows_bulk(np.empty((0, 2)), np.empty((0, 2)), ax=ax) is None
+
+
+def test_bulk_mode_threshold(rendering):
+    assert rendering.use_bulk_rendering(nx.path_graph(rendering.BULK_NODE_THRESHOLD))
+    assert not rendering.use_bulk_rendering(nx.path_graph(10))
+    assert rendering.use_bulk_rendering(nx.path_graph(10), bulk=True)
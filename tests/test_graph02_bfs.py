@@ -0,0 +1,36 @@
+"""Тести BFS з graph02.graph_search порівняно з networkx."""
+
+import networkx as nx
+import pytest
+
+from graph02.graph_search import bfs, bfs_tree, tree_path
+
+
+@pytest.mark.parametrize('bidirectional', [False, True])
+def test_bfs_finds_shortest_paths(network, bidirectional):
+    nodes = list(network)
+    for start, goal in zip(nodes[::17], nodes[5::23]):
+        path = bfs(network, start, goal, bidirectional=bidirectional)
+        assert path[0] == start and path[-1] == goal
+        assert all(network.has_edge(u, v) for u, v in zip(path, path[1:]))
+        assert len(path) - 1 == nx.shortest_path_length(network, start, goal)
+
+
+def test_bfs_unreachable_and_unknown(network):
+    network.add_edge('x', 'y')
+    assert bfs(network, '1', 'x') is None
+    assert bfs(network, '1', 'x', bidirectional=True) is None
+    assert bfs(network, '1', 'missing') is None
+    assert bfs(network, '1', '1') == ['1']
+
+
+def test_bfs_handles_long_chains():
+    graph = nx.path_graph(200_000)
+    assert len(bfs(graph, 0, 199_999)) == 200_000
+
+
+def test_bfs_tree_matches_bfs(network):
+    parents = bfs_tree(network, '1')
+    assert set(parents) == nx.node_connected_component(network, '1')
+    for goal in list(network)[::13]:
+        assert tree_path(parents, goal) == bfs(network, '1', goal)
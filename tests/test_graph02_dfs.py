@@ -0,0 +1,31 @@
+"""Тести ітеративного DFS з graph02.graph_search порівняно з networkx."""
+
+import networkx as nx
+
+from graph02.graph_search import dfs, dfs_paths
+
+
+def test_dfs_returns_simple_path(network):
+    nodes = list(network)
+    for start, goal in zip(nodes[::19], nodes[3::29]):
+        path = dfs(network, start, goal)
+        assert path[0] == start and path[-1] == goal
+        assert len(set(path)) == len(path)
+        assert all(network.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+def test_dfs_does_not_hit_recursion_limit():
+    graph = nx.path_graph(50_000)
+    assert dfs(graph, 0, 49_999) == list(range(50_000))
+
+
+def test_dfs_paths_matches_all_simple_paths():
+    graph = nx.petersen_graph()
+    expected = {tuple(path) for path in nx.all_simple_paths(graph, 0, 7)}
+    found = [tuple(path) for path in dfs_paths(graph, 0, 7)]
+    assert len(found) == len(set(found))
+    assert set(found) == expected
+
+    limited = {tuple(path) for path in nx.all_simple_paths(graph, 0, 7, cutoff=4)}
+    assert {tuple(path) for path in dfs_paths(graph, 0, 7, max_depth=4)} == limited
+    assert len(list(dfs_paths(graph, 0, 7, max_count=3))) == 3
@@ -0,0 +1,58 @@
+"""Тести інкрементального аналізу (graph01.incremental_analysis) порівняно з повним перерахунком networkx."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from graph01.incremental_analysis import IncrementalGraphAnalyzer
+
+
+def _check(analyzer):
+    graph = analyzer.graph
+    assert analyzer.connected_components == nx.number_connected_components(graph)
+    assert set(map(frozenset, analyzer._members.values())) == set(map(frozenset, nx.connected_components(graph)))
+    degrees = [degree for _, degree in graph.degree()]
+    assert analyzer.degree_count == {degree: degrees.count(degree) for degree in set(degrees)}
+    assert analyzer.average_degree == pytest.approx(sum(degrees) / len(degrees))
+
+
+def test_updates_match_full_recomputation(network):
+    analyzer = IncrementalGraphAnalyzer(network)
+    _check(analyzer)
+
+    generator = random.Random(3)
+    nodes = list(network)
+    for _ in range(60):
+        edges = list(network.edges())
+        if generator.random() < 0.5 and edges:
+            analyzer.remove_edge(*generator.choice(edges))
+        else:
+            analyzer.add_edge(generator.choice(nodes), generator.choice(nodes + ['new']))
+        _check(analyzer)
+
+
+def test_path_statistics_follow_changes():
+    graph = nx.path_graph(6)
+    analyzer = IncrementalGraphAnalyzer(graph)
+    assert analyzer.diameter == nx.diameter(graph)
+
+    analyzer.add_edge(0, 5)
+    assert analyzer.diameter == nx.diameter(graph)
+    assert analyzer.average_shortest_path_length == pytest.approx(nx.average_shortest_path_length(graph))
+
+    analyzer.remove_edge(2, 3)
+    analyzer.remove_edge(0, 5)
+    assert analyzer.connected_components == 2
+    assert analyzer.diameter is None
+
+
+def test_split_relabels_only_the_separated_side():
+    graph = nx.path_graph(1000)
+    analyzer = IncrementalGraphAnalyzer(graph)
+    before = dict(analyzer._component)
+
+    analyzer.remove_edge(997, 998)
+
+    assert {node for node in graph if analyzer._component[node] != before[node]} == {998, 999}
+    assert analyzer.connected_components == 2
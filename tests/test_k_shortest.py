@@ -0,0 +1,57 @@
+"""Тести пошуку k найкоротших шляхів `graph03.k_shortest` порівняно з networkx."""
+
+from itertools import islice
+
+import networkx as nx
+import pytest
+
+from graph03.compact_graph import CompactGraph
+from graph03.k_shortest import k_shortest_paths
+
+
+@pytest.mark.parametrize('compact', [False, True])
+@pytest.mark.parametrize('metric', ['distance', 'time'])
+def test_lengths_match_shortest_simple_paths(weighted_network, compact, metric):
+    graph = CompactGraph.from_networkx(weighted_network) if compact else weighted_network
+    routes = list(islice(k_shortest_paths(graph, '1', '250', metric), 8))
+    expected = [
+        nx.path_weight(weighted_network, path, metric)
+        for path in islice(nx.shortest_simple_paths(weighted_network, '1', '250', weight=metric), 8)
+    ]
+
+    assert [length for length, _ in routes] == pytest.approx(expected)
+    assert len({tuple(path) for _, path in routes}) == len(routes)
+    for length, path in routes:
+        assert path[0] == '1' and path[-1] == '250'
+        assert len(set(path)) == len(path)
+        assert nx.path_weight(weighted_network, path, metric) == pytest.approx(length)
+
+
+def test_all_paths_of_small_graph():
+    graph = nx.relabel_nodes(nx.gnm_random_graph(9, 16, seed=2), str)
+    for index, (_, _, data) in enumerate(graph.edges(data=True)):
+        data['distance'] = float(1 + (index * 7) % 11)
+
+    lengths = [length for length, _ in k_shortest_paths(graph, '0', '8')]
+    expected = sorted(nx.path_weight(graph, path, 'distance') for path in nx.all_simple_paths(graph, '0', '8'))
+
+    assert lengths == pytest.approx(expected)
+
+
+def test_max_overlap_limits_shared_edges(weighted_network):
+    routes = list(islice(k_shortest_paths(weighted_network, '1', '250', max_overlap=0.5), 3))
+    edge_sets = [{frozenset(edge) for edge in zip(path, path[1:])} for _, path in routes]
+
+    for i, edges in enumerate(edge_sets):
+        for other in edge_sets[:i]:
+            assert len(edges & other) / len(edges) <= 0.5
+
+
+def test_unreachable_and_invalid_arguments(weighted_network):
+    weighted_network.add_edge('x', 'y', distance=1.0, time=1.0)
+
+    assert list(k_shortest_paths(weighted_network, '1', 'x')) == []
+    with pytest.raises(ValueError):
+        list(k_shortest_paths(weighted_network, '1', 'missing'))
+    with pytest.raises(ValueError):
+        list(k_shortest_paths(weighted_network, '1', '2', 'cost'))
@@ -0,0 +1,49 @@
+"""Тести індексу орієнтирів (graph03.landmarks) порівняно з networkx."""
+
+import math
+
+import networkx as nx
+import pytest
+
+from graph03.landmarks import LandmarkIndex
+
+
+@pytest.fixture
+def index(weighted_network):
+    return LandmarkIndex.build(weighted_network, num_landmarks=4)
+
+
+@pytest.mark.parametrize('metric', ['distance', 'time', 'third_weight'])
+def test_query_matches_networkx(weighted_network, index, metric):
+    nodes = list(weighted_network)
+    for start, goal in zip(nodes[::11], nodes[7::13]):
+        length, path = index.query(start, goal, metric)
+        if not nx.has_path(weighted_network, start, goal):
+            assert math.isinf(length) and path is None
+            continue
+        expected = nx.dijkstra_path_length(weighted_network, start, goal, weight=metric)
+        assert length == pytest.approx(expected, rel=1e-5)
+        assert nx.path_weight(weighted_network, path, metric) == pytest.approx(expected, rel=1e-5)
+
+
+def test_heuristic_is_a_lower_bound(weighted_network, index):
+    graph = index.graph
+    goal = graph.index_of('1')
+    distances = nx.single_source_dijkstra_path_length(weighted_network, '1', weight='distance')
+    for node, distance in distances.items():
+        assert index.heuristic(graph.index_of(node), goal, 'distance') <= distance + 1e-4
+
+
+@pytest.mark.parametrize('filename', ['landmarks.npz', 'landmarks'])
+def test_save_and_load(weighted_network, index, tmp_path, filename):
+    path = str(tmp_path / filename)
+    index.save(path)
+    loaded = LandmarkIndex.load(path, weighted_network)
+    assert loaded.query('1', '2', 'time')[0] == pytest.approx(index.query('1', '2', 'time')[0])
+
+
+def test_missing_metrics_are_rejected(network):
+    with pytest.raises(ValueError):
+        LandmarkIndex.build(network)
+    with pytest.raises(ValueError):
+        LandmarkIndex.build(network, metrics=('speed',))
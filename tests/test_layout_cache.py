@@ -0,0 +1,63 @@
+"""Тести кешу розташувань (layout_cache) порівняно з прямим викликом nx.spring_layout."""
+
+import importlib
+
+import networkx as nx
+import numpy as np
+import pytest
+
+MODULES = ['graph01.layout_cache', 'graph02.layout_cache', 'graph03.layout_cache']
+
+
+@pytest.fixture(params=MODULES)
+def layout_cache(request):
+    module = importlib.import_module(request.param)
+    module.clear_layout_cache()
+    module.configure_layout_cache()
+    yield module
+    module.clear_layout_cache()
+    module.configure_layout_cache()
+
+
+def _count_layout_calls(monkeypatch, module):
+    calls = []
+    spring_layout = nx.spring_layout
+
+    def counting_layout(*args, **kwargs):
+        calls.append(args)
+        return spring_layout(*args, **kwargs)
+
+    monkeypatch.setattr(module.nx, 'spring_layout', counting_layout)
+    return calls
+
+
+def test_layout_is_computed_once(monkeypatch, layout_cache):
+    graph = nx.petersen_graph()
+    calls = _count_layout_calls(monkeypatch, layout_cache)
+
+    first = layout_cache.get_layout(graph, seed=42)
+    second = layout_cache.get_layout(graph, seed=42)
+    assert first is second
+    assert len(calls) == 1
+
+    expected = nx.spring_layout(graph, seed=42)
+    for node in graph:
+        np.testing.assert_allclose(first[node], expected[node])
+
+    layout_cache.get_layout(graph, seed=7)
+    graph.add_edge(0, 5)
+    layout_cache.get_layout(graph, seed=42)
+    assert len(calls) == 3
+
+
+def test_layout_is_loaded_from_disk(monkeypatch, layout_cache, tmp_path):
+    graph = nx.cycle_graph(30)
+    layout_cache.configure_layout_cache(cache_dir=str(tmp_path))
+    expected = layout_cache.get_layout(graph, seed=1)
+    layout_cache.clear_layout_cache()
+
+    calls = _count_layout_calls(monkeypatch, layout_cache)
+    loaded = layout_cache.get_layout(graph, seed=1)
+    assert not calls
+    for node in graph:
+        np.testing.assert_allclose(loaded[node], expected[node])
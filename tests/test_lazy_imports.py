@@ -0,0 +1,40 @@
+"""Тести лінивого імпорту matplotlib у пакетах graph01, graph02 і graph03."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Модулі малювання, які можна імпортувати без завантаження matplotlib
+MODULES = [
+    'graph01.graph_visualization', 'graph01.fast_rendering', 'graph01.graph_analysis',
+    'graph02.graph_visualization', 'graph02.fast_rendering', 'graph02.graph_search',
+    'graph03.graph_visualization', 'graph03.fast_rendering', 'graph03.graph_search',
+]
+
+
+@pytest.mark.parametrize('module', MODULES)
+def test_import_does_not_load_matplotlib(module):
+    code = f"import sys, {module}; print('matplotlib' in sys.modules)"
+    path = os.pathsep.join(os.path.join(ROOT, directory) for directory in ('task_01', 'task_02', 'task_03'))
+    result = subprocess.run(
+        [sys.executable, '-c', code], env={**os.environ, 'PYTHONPATH': path},
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == 'False'
+
+
+def test_entry_point_without_rendering_skips_matplotlib():
+    code = (
+        "import runpy, sys; sys.argv = ['main.py', '--no-render']; "
+        "runpy.run_path('task_02/main.py', run_name='__main__'); "
+        "print('matplotlib' in sys.modules, file=sys.stderr)"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT, env={**os.environ, 'PYTHONPATH': os.path.join(ROOT, 'task_02')},
+        capture_output=True, text=True, check=True
+    )
+    assert result.stderr.strip().splitlines()[-1] == 'False'
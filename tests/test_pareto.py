@@ -0,0 +1,65 @@
+"""Тести багатокритеріального пошуку `graph03.pareto` порівняно з networkx."""
+
+import networkx as nx
+import pytest
+
+from graph03.compact_graph import CompactGraph
+from graph03.pareto import pareto_routes
+
+
+def _brute_force_front(graph, start, goal):
+    """Множина Парето з перебору всіх простих шляхів."""
+    values = {
+        (nx.path_weight(graph, path, 'distance'), nx.path_weight(graph, path, 'time'))
+        for path in nx.all_simple_paths(graph, start, goal)
+    }
+    return sorted(
+        value for value in values
+        if not any(other != value and other[0] <= value[0] and other[1] <= value[1] for other in values)
+    )
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_front_endpoints_and_dominance(weighted_network, compact):
+    graph = CompactGraph.from_networkx(weighted_network) if compact else weighted_network
+    routes = pareto_routes(graph, '1', '250')
+    values = [value for value, _ in routes]
+
+    assert values[0][0] == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '250', weight='distance'))
+    assert values[-1][1] == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '250', weight='time'))
+    for (first, second), (next_first, next_second) in zip(values, values[1:]):
+        assert first < next_first and second > next_second
+    for (distance, time), path in routes:
+        assert path[0] == '1' and path[-1] == '250'
+        assert nx.path_weight(weighted_network, path, 'distance') == pytest.approx(distance)
+        assert nx.path_weight(weighted_network, path, 'time') == pytest.approx(time)
+
+
+def test_front_matches_brute_force():
+    graph = nx.gnm_random_graph(12, 24, seed=5)
+    graph = nx.relabel_nodes(graph, str)
+    for index, (_, _, data) in enumerate(graph.edges(data=True)):
+        data['distance'] = float(1 + (index * 7) % 11)
+        data['time'] = float(1 + (index * 5) % 13)
+
+    for goal in ['3', '7', '11']:
+        values = [value for value, _ in pareto_routes(graph, '0', goal)]
+        assert values == pytest.approx(_brute_force_front(graph, '0', goal))
+
+
+def test_epsilon_keeps_endpoints_close(weighted_network):
+    exact = pareto_routes(weighted_network, '1', '250')
+    approximate = pareto_routes(weighted_network, '1', '250', epsilon=0.1)
+
+    assert 0 < len(approximate) <= len(exact)
+    assert approximate[0][0][0] == pytest.approx(exact[0][0][0])
+
+
+def test_unreachable_and_invalid_arguments(weighted_network):
+    weighted_network.add_edge('x', 'y', distance=1.0, time=1.0)
+
+    assert pareto_routes(weighted_network, '1', 'x') == []
+    with pytest.raises(ValueError):
+        pareto_routes(weighted_network, '1', 'missing')
+    with pytest.raises(ValueError):
+        pareto_routes(weighted_network, '1', '2', criteria=('distance',))
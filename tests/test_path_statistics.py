@@ -0,0 +1,44 @@
+"""Тести статистики найкоротших шляхів (graph01.path_statistics) порівняно з networkx."""
+
+import networkx as nx
+import pytest
+
+from graph01.path_statistics import double_sweep_lower_bound, ifub_diameter, path_statistics
+
+
+@pytest.fixture
+def connected_network(network):
+    return network.subgraph(max(nx.connected_components(network), key=len)).copy()
+
+
+def test_exact_matches_networkx(connected_network):
+    statistics = path_statistics(connected_network, mode='exact')
+    assert statistics['diameter'] == nx.diameter(connected_network)
+    assert statistics['average_shortest_path_length'] == pytest.approx(
+        nx.average_shortest_path_length(connected_network)
+    )
+    assert statistics['eccentricities'] == nx.eccentricity(connected_network)
+    assert statistics['error_bound'] == 0.0
+
+
+def test_diameter_bounds(connected_network):
+    diameter = nx.diameter(connected_network)
+    assert ifub_diameter(connected_network) == diameter
+    assert double_sweep_lower_bound(connected_network) <= diameter
+
+
+def test_approximate_stays_within_error_bound():
+    graph = nx.grid_2d_graph(30, 30)
+    expected = nx.average_shortest_path_length(graph)
+    statistics = path_statistics(graph, mode='approximate', epsilon=0.15)
+    assert statistics['diameter'] == nx.diameter(graph)
+    assert statistics['sources'] < graph.number_of_nodes()
+    assert abs(statistics['average_shortest_path_length'] - expected) <= statistics['error_bound']
+    assert statistics['error_bound'] <= 0.15 * expected
+
+
+def test_sample_size_bounds_the_work(connected_network):
+    statistics = path_statistics(connected_network, mode='approximate', sample_size=20)
+    assert statistics['sources'] == 20
+    assert statistics['error_bound'] > 0
+    assert statistics['eccentricities'] is None
@@ -0,0 +1,57 @@
+"""Тести аналізу стійкості `graph01.resilience` порівняно з networkx."""
+
+import random
+
+import networkx as nx
+import pytest
+
+from graph01.compact_graph import CompactGraph
+from graph01.resilience import ResilienceAnalysis
+
+
+@pytest.fixture
+def graph(network):
+    # Додаткова компонента та цикл, щоб мости й компоненти були різних видів
+    network.add_edges_from([('x', 'y'), ('y', 'z'), ('z', 'x'), ('z', 'w')])
+    return network
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_matches_networkx(graph, compact):
+    analysis = ResilienceAnalysis(CompactGraph.from_networkx(graph) if compact else graph)
+
+    assert set(map(frozenset, analysis.bridges)) == set(map(frozenset, nx.bridges(graph)))
+    assert set(analysis.articulation_points) == set(nx.articulation_points(graph))
+    assert sorted(map(sorted, analysis.biconnected_components)) == sorted(map(sorted, nx.biconnected_components(graph)))
+    assert analysis.num_two_edge_components == len(list(nx.k_edge_components(graph, 2)))
+    assert analysis.connected_components == nx.number_connected_components(graph)
+
+
+def test_results_summary(graph):
+    results = ResilienceAnalysis(graph).results()
+
+    assert len(results['bridges']) == len(list(nx.bridges(graph)))
+    assert results['biconnected_components'] == len(list(nx.biconnected_components(graph)))
+
+
+def test_close_edges_matches_networkx(graph):
+    analysis = ResilienceAnalysis(graph)
+    edges = list(graph.edges())
+    rng = random.Random(11)
+    scenarios = [rng.sample(edges, k) for k in (1, 2, 3, 5, 8) for _ in range(10)]
+    scenarios.append(list(analysis.bridges[:2]))
+    bridges = {frozenset(edge) for edge in nx.bridges(graph)}
+
+    for scenario, result in zip(scenarios, analysis.close_edges_batch(scenarios)):
+        closed = graph.copy()
+        closed.remove_edges_from(scenario)
+        components = nx.number_connected_components(closed)
+
+        assert result['components'] == components
+        assert result['disconnected'] == (components > nx.number_connected_components(graph))
+        assert {frozenset(edge) for edge in result['closed_bridges']} == bridges & {frozenset(edge) for edge in scenario}
+
+
+def test_close_unknown_edge(graph):
+    with pytest.raises(ValueError):
+        ResilienceAnalysis(graph).close_edges([('1', 'missing')])
@@ -0,0 +1,133 @@
+"""Тести кешу маршрутів `graph03.route_cache` порівняно з networkx."""
+
+import math
+import pickle
+
+import networkx as nx
+import pytest
+
+from graph03.compact_graph import CompactGraph
+from graph03.query_cache import graph_version, set_edge_weight
+from graph03.route_cache import RouteCache
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_shortest_path_matches_networkx(weighted_network, compact):
+    graph = CompactGraph.from_networkx(weighted_network) if compact else weighted_network
+    cache = RouteCache(graph)
+
+    for start in ['1', '17', '120']:
+        expected_distances = nx.single_source_dijkstra_path_length(weighted_network, start, weight='time')
+        for goal in ['2', '55', '299', start]:
+            distance, path = cache.shortest_path(start, goal, 'time')
+            assert distance == pytest.approx(expected_distances[goal])
+            assert nx.path_weight(weighted_network, path, 'time') == pytest.approx(distance)
+            assert path[0] == start and path[-1] == goal
+
+    assert cache.stats()['searches'] == 3
+    assert cache.stats()['source_hits'] == 9
+
+
+def test_single_source_rebuilds_paths(weighted_network):
+    cache = RouteCache(weighted_network)
+    distances, paths = cache.single_source('5', 'distance')
+    expected_distances, expected_paths = nx.single_source_dijkstra(weighted_network, '5', weight='distance')
+
+    assert distances == pytest.approx(expected_distances)
+    assert paths == expected_paths
+
+
+def test_source_trees_are_bounded_separately(weighted_network):
+    cache = RouteCache(weighted_network, max_entries=1000, max_sources=2)
+    for start in ['1', '2', '3', '4']:
+        cache.shortest_path(start, '100')
+
+    stats = cache.stats()
+    assert stats['source_trees'] == 2
+    assert stats['entries'] == 4
+    # Дерево станції '1' витіснено, а маршрут з неї ще в кеші
+    assert cache.shortest_path('1', '100')[0] == pytest.approx(
+        nx.dijkstra_path_length(weighted_network, '1', '100', weight='distance'))
+    assert cache.stats()['searches'] == 4
+
+
+def test_unreachable_goal():
+    graph = nx.Graph()
+    graph.add_edge('a', 'b', distance=1.0)
+    graph.add_node('c')
+    distance, path = RouteCache(graph).shortest_path('a', 'c')
+
+    assert distance == math.inf
+    assert path is None
+
+
+def test_raw_networkx_edge_invalidates_cache(weighted_network):
+    cache = RouteCache(weighted_network)
+    before, _ = cache.shortest_path('1', '250')
+
+    weighted_network.add_edge('1', '250', distance=0.01, time=0.01, third_weight=0.01)
+    distance, path = cache.shortest_path('1', '250')
+
+    assert before > 0.01
+    assert distance == pytest.approx(0.01)
+    assert path == ['1', '250']
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_weight_change_invalidates_cache(weighted_network):
+    cache = RouteCache(weighted_network)
+    _, path = cache.shortest_path('1', '250')
+    u, v = path[0], path[1]
+
+    set_edge_weight(weighted_network, u, v, 'distance', 1e6)
+
+    assert cache.shortest_path('1', '250')[0] == pytest.approx(
+        nx.dijkstra_path_length(weighted_network, '1', '250', weight='distance'))
+
+
+def test_raw_weight_edit_invalidates_cache(weighted_network):
+    cache = RouteCache(weighted_network)
+    _, path = cache.shortest_path('1', '250')
+
+    weighted_network[path[0]][path[1]]['distance'] = 1e6
+    distance, new_path = cache.shortest_path('1', '250')
+
+    assert distance == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '250', weight='distance'))
+    assert new_path != path
+
+
+def test_raw_edge_replacement_invalidates_cache(weighted_network):
+    cache = RouteCache(weighted_network)
+    _, path = cache.shortest_path('1', '250')
+    u, v = path[0], path[1]
+    data = dict(weighted_network[u][v])
+
+    weighted_network.remove_edge(u, v)
+    weighted_network.add_edge(u, v, **{**data, 'distance': 1e6})
+
+    assert cache.shortest_path('1', '250')[0] == pytest.approx(
+        nx.dijkstra_path_length(weighted_network, '1', '250', weight='distance'))
+
+
+def test_compact_weights_change_only_through_set_edge_weight(weighted_network):
+    graph = CompactGraph.from_networkx(weighted_network)
+    cache = RouteCache(graph)
+    _, path = cache.shortest_path('1', '250')
+
+    with pytest.raises(ValueError):
+        graph.weights['distance'][0] = 1e6
+    set_edge_weight(graph, path[0], path[1], 'distance', 1e6)
+    weighted_network[path[0]][path[1]]['distance'] = 1e6
+
+    assert cache.shortest_path('1', '250')[0] == pytest.approx(
+        nx.dijkstra_path_length(weighted_network, '1', '250', weight='distance'), rel=1e-5)
+
+
+def test_tracked_graph_survives_pickling(weighted_network):
+    RouteCache(weighted_network)
+    copy = pickle.loads(pickle.dumps(weighted_network))
+    version = graph_version(copy)
+
+    copy['1'][next(iter(copy['1']))]['time'] = 1.0
+
+    assert graph_version(copy) == version + 1
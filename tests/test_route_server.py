@@ -0,0 +1,133 @@
+"""Тести асинхронного сервера маршрутів `graph03.route_server` порівняно з networkx."""
+
+import asyncio
+import json
+
+import networkx as nx
+import pytest
+
+from graph03.route_server import RouteServer
+
+
+def _exchange(server, data, unix_path):
+    """Запускає сервер на сокеті Unix, надсилає байти та повертає повну відповідь."""
+    async def run():
+        serving = asyncio.ensure_future(server.serve(unix_path=unix_path))
+        try:
+            while server._executor is None or not unix_path.exists():
+                await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_unix_connection(str(unix_path))
+            writer.write(data)
+            if not data.startswith((b'GET ', b'POST ')):
+                writer.write_eof()
+            response = await asyncio.wait_for(reader.read(), timeout=30)
+            writer.close()
+            return response
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def server(weighted_network):
+    return RouteServer(weighted_network, processes=1)
+
+
+@pytest.fixture
+def unix_path(tmp_path):
+    return tmp_path / 'routes.sock'
+
+
+def test_handle_query_matches_networkx(server, weighted_network):
+    async def run():
+        try:
+            return [await server.handle_query({'start': '1', 'goal': goal, 'metric': 'time'}) for goal in ('20', '21')]
+        finally:
+            server.close()
+
+    for result in asyncio.run(run()):
+        expected = nx.dijkstra_path_length(weighted_network, '1', result['goal'], weight='time')
+        assert result['distance'] == pytest.approx(expected)
+        assert nx.path_weight(weighted_network, result['path'], 'time') == pytest.approx(expected)
+    assert server.stats()['searches'] == 2
+
+
+def test_handle_query_errors(server):
+    async def run():
+        return [
+            await server.handle_query([]),
+            await server.handle_query({'start': '1'}),
+            await server.handle_query({'start': '1', 'goal': 'missing'}),
+            await server.handle_query({'start': '1', 'goal': '2', 'metric': 'cost'}),
+        ]
+
+    assert all('error' in result for result in asyncio.run(run()))
+
+
+def test_json_lines_connection_ends_at_eof(server, weighted_network, unix_path):
+    response = _exchange(server, b'{"start": "1", "goal": "20"}\nnot json\n', unix_path)
+    first, second = [json.loads(line) for line in response.splitlines()]
+
+    assert first['distance'] == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '20', weight='distance'))
+    assert second == {'error': 'invalid JSON'}
+
+
+def test_http_post_route(server, weighted_network, unix_path):
+    body = b'{"start": "1", "goal": "20", "metric": "time"}'
+    response = _exchange(server, b'POST /route HTTP/1.1\r\nContent-Length: %d\r\n\r\n' % len(body) + body, unix_path)
+    head, _, payload = response.partition(b'\r\n\r\n')
+
+    assert head.startswith(b'HTTP/1.1 200 OK')
+    assert json.loads(payload)['distance'] == pytest.approx(
+        nx.dijkstra_path_length(weighted_network, '1', '20', weight='time'))
+
+
+@pytest.mark.parametrize('length', [b'-5', b'abc'])
+def test_http_invalid_content_length(server, unix_path, length):
+    response = _exchange(server, b'POST /route HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n', unix_path)
+    assert response.startswith(b'HTTP/1.1 400 Bad Request')
+
+
+def test_crashed_worker_returns_error_and_restarts_pool(server, weighted_network):
+    async def run():
+        try:
+            await server.start()
+            for process in list(server._executor._processes.values()):
+                process.kill()
+            failed = await server.handle_query({'start': '1', 'goal': '20'})
+            return failed, await server.handle_query({'start': '1', 'goal': '20'})
+        finally:
+            server.close()
+
+    failed, result = asyncio.run(run())
+
+    assert failed == {'error': 'route search failed: BrokenProcessPool'}
+    assert result['distance'] == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '20', weight='distance'))
+
+
+def test_search_failure_keeps_connection_open(server, weighted_network, unix_path, monkeypatch):
+    search = server._search
+
+    async def failing_search(key):
+        if key[2] == '21':
+            raise RuntimeError('worker failed')
+        return await search(key)
+
+    monkeypatch.setattr(server, '_search', failing_search)
+    response = _exchange(server, b'{"start": "1", "goal": "21"}\n{"start": "1", "goal": "20"}\n', unix_path)
+    failed, result = [json.loads(line) for line in response.splitlines()]
+
+    assert failed == {'error': 'route search failed: RuntimeError'}
+    assert result['distance'] == pytest.approx(nx.dijkstra_path_length(weighted_network, '1', '20', weight='distance'))
+
+
+def test_http_search_failure(server, unix_path, monkeypatch):
+    async def failing_search(key):
+        raise RuntimeError('worker failed')
+
+    monkeypatch.setattr(server, '_search', failing_search)
+    response = _exchange(server, b'GET /route?start=1&goal=20 HTTP/1.1\r\n\r\n', unix_path)
+
+    assert response.startswith(b'HTTP/1.1 500 Internal Server Error')
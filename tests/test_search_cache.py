@@ -0,0 +1,56 @@
+"""Тести кешу пошуку шляхів `graph02.search_cache` порівняно з networkx."""
+
+import networkx as nx
+
+from graph02.graph_search import dfs
+from graph02.search_cache import SearchCache
+
+
+def test_bfs_matches_networkx_lengths(network):
+    cache = SearchCache(network)
+    for start in ['1', '40']:
+        for goal in ['2', '150', '299']:
+            path = cache.bfs(start, goal)
+            assert len(path) - 1 == nx.shortest_path_length(network, start, goal)
+            assert nx.is_path(network, path)
+
+    assert cache.stats()['searches'] == 2
+    assert cache.stats()['source_hits'] == 4
+
+
+def test_dfs_matches_uncached_search(network):
+    cache = SearchCache(network)
+    assert cache.dfs('1', '150') == dfs(network, '1', '150')
+    assert cache.dfs('1', '150') == dfs(network, '1', '150')
+    assert cache.stats()['searches'] == 1
+
+
+def test_bfs_trees_are_bounded_separately(network):
+    cache = SearchCache(network, max_sources=2)
+    for start in ['1', '2', '3', '4']:
+        cache.bfs(start, '100')
+
+    assert cache.stats()['source_trees'] == 2
+    assert cache.stats()['entries'] == 4
+
+
+def test_raw_networkx_edge_invalidates_cache(network):
+    cache = SearchCache(network)
+    assert len(cache.bfs('1', '250')) > 2
+
+    network.add_edge('1', '250')
+
+    assert cache.bfs('1', '250') == ['1', '250']
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_raw_edge_swap_invalidates_cache(network):
+    cache = SearchCache(network)
+    path = cache.bfs('1', '250')
+    assert len(path) > 2
+
+    # Кількість ребер не змінюється: одне видалено, інше додано
+    network.remove_edge(path[-2], path[-1])
+    network.add_edge('1', '250')
+
+    assert cache.bfs('1', '250') == ['1', '250']
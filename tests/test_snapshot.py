@@ -0,0 +1,36 @@
+"""Тести бінарного знімка графа (graph03.snapshot) порівняно з вихідним networkx-графом."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph03.snapshot import load_snapshot, save_snapshot
+
+
+def test_round_trip_preserves_graph(weighted_network, tmp_path):
+    path = str(tmp_path / 'network.tng')
+    save_snapshot(weighted_network, path)
+    loaded = load_snapshot(path)
+
+    assert loaded.nodes() == list(weighted_network.nodes())
+    assert set(map(frozenset, loaded.to_networkx().edges())) == set(map(frozenset, weighted_network.edges()))
+    for u, v, data in loaded.edges(data=True):
+        for name in ('distance', 'time', 'third_weight'):
+            assert data[name] == pytest.approx(weighted_network[u][v][name], rel=1e-6)
+    assert isinstance(loaded.indices, np.memmap) or isinstance(loaded.indices.base, np.memmap)
+
+
+def test_snapshot_search_matches_networkx(weighted_network, tmp_path):
+    path = str(tmp_path / 'network.tng')
+    save_snapshot(weighted_network, path)
+    loaded = load_snapshot(path).to_networkx()
+    expected = nx.single_source_dijkstra_path_length(weighted_network, '1', weight='time')
+    actual = nx.single_source_dijkstra_path_length(loaded, '1', weight='time')
+    assert actual == pytest.approx(expected, rel=1e-5)
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a snapshot')
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))